@@ -1,4 +1,6 @@
 import os
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
 
 from anonymous_board.adapter.input.web.anonymous_board_router import anonymous_board_router
@@ -9,7 +11,9 @@ from config.database.session import Base, engine
 from documents_openai.adapter.input.web.documents_openai_router import documents_openai_router
 
 # from documents_multi_agents.adapter.input.web.document_multi_agent_router import documents_multi_agents_router
+from documents_multi_agents.infrastructure.external.download_agent import close_session as close_document_session
 from financial_news.adapter.input.web.financial_news_router import financial_news_router
+from financial_news.infrastructure.scheduler.ingestion_scheduler import ingestion_scheduler
 from kakao_authentication.adapter.input.web.kakao_authentication_router import kakao_authentication_router
 from market_data.adapter.input.web.market_data_router import market_data_router
 from social_oauth.adapter.input.web.google_oauth2_router import authentication_router
@@ -24,7 +28,21 @@ load_dotenv()
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 뉴스 수집은 요청 경로가 아니라 백그라운드 스케줄러에서
+    ingestion_enabled = os.getenv("NEWS_INGESTION_ENABLED", "1") == "1"
+    if ingestion_enabled:
+        ingestion_scheduler.start()
+    yield
+    if ingestion_enabled:
+        await ingestion_scheduler.stop()
+    # 문서 다운로드용 공유 세션 정리
+    await close_document_session()
+
+
+app = FastAPI(lifespan=lifespan)
 
 frontend_url = os.getenv("CORS_ALLOWED_FRONTEND_URL")
 origins = [frontend_url]
@@ -0,0 +1,28 @@
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+import os
+from dotenv import load_dotenv
+import urllib.parse
+
+load_dotenv()
+
+password = urllib.parse.quote_plus(os.getenv("MYSQL_PASSWORD"))
+
+ASYNC_DATABASE_URL = (
+    f"mysql+aiomysql://{os.getenv('MYSQL_USER')}:{password}"
+    f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DATABASE')}"
+)
+
+# 요청마다 세션을 열고 닫으므로 동시 요청 수에 맞춰 풀 크기 설정
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+    pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+    pool_recycle=3600,
+    pool_pre_ping=True
+)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
+def get_async_db_session() -> AsyncSession:
+    return AsyncSessionLocal()
@@ -12,6 +12,8 @@ class OpenAIConfig:
     """OpenAI 설정 클래스"""
     api_key: str
     model: str = "gpt-4o-mini"
+    # 감성 분석 캐스케이드에서 애매한 결과를 재분석할 상위 모델
+    strong_model: str = "gpt-4o"
     temperature: float = 0.3
     max_tokens: Optional[int] = None
     timeout: int = 30
@@ -34,6 +36,7 @@ class OpenAIConfig:
         return cls(
             api_key=api_key,
             model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+            strong_model=os.getenv("OPENAI_STRONG_MODEL", "gpt-4o"),
             temperature=float(os.getenv("OPENAI_TEMPERATURE", "0.3")),
             max_tokens=int(os.getenv("OPENAI_MAX_TOKENS")) if os.getenv("OPENAI_MAX_TOKENS") else None,
             timeout=int(os.getenv("OPENAI_TIMEOUT", "30"))
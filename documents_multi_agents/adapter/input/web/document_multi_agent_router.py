@@ -1,7 +1,11 @@
+import json
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from documents_multi_agents.adapter.input.web.request.analyze_request import AnalyzeRequest
 from documents_multi_agents.application.usecase.document_multi_agent_usecase import DocumentMultiAgentsUseCase
+from documents_multi_agents.infrastructure.external.model_loader import memory_report
 
 documents_multi_agents_router = APIRouter(tags=["documents_multi_agents"])
 
@@ -12,7 +16,9 @@ usecase = DocumentMultiAgentsUseCase.getInstance()
 @documents_multi_agents_router.post("/analyze")
 async def analyze_document(request: AnalyzeRequest):
     try:
-        agents = await usecase.analyze_document(request.doc_id, request.doc_url, request.question)
+        agents = await usecase.analyze_document(
+            request.doc_id, request.doc_url, request.question, request.preset, request.latency_budget_s
+        )
         return {
             "parsed_text": agents.parsed_text,
             "summaries": {
@@ -25,3 +31,32 @@ async def analyze_document(request: AnalyzeRequest):
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+# SSE 포맷: "event: <이름>\ndata: <json>\n\n"
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@documents_multi_agents_router.post("/analyze/stream")
+async def analyze_document_stream(request: AnalyzeRequest):
+    async def event_stream():
+        try:
+            async for event, data in usecase.analyze_document_stream(
+                request.doc_id, request.doc_url, request.question, request.preset, request.latency_budget_s
+            ):
+                yield _sse(event, data)
+        except Exception as e:
+            yield _sse("error", {"detail": str(e)})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# 워커 프로세스별 RSS / 공유 메모리 확인용
+@documents_multi_agents_router.get("/memory")
+async def get_memory_report():
+    return memory_report()
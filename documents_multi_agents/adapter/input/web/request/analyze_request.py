@@ -1,7 +1,13 @@
-from pydantic import BaseModel
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
 
 
 class AnalyzeRequest(BaseModel):
     doc_id: int
     doc_url: str
     question: str
+    # fast: greedy + 짧은 요약 + 배치 (대화형), quality: beam search (배치 작업)
+    preset: Literal["fast", "balanced", "quality"] = Field("quality", description="생성 속도/품질 프리셋")
+    # 지정하면 예산 안에 끝나도록 요약 티어(extractive/single/hierarchical)를 고름
+    latency_budget_s: Optional[float] = Field(None, gt=0, description="요약 지연시간 예산 (초)")
@@ -4,9 +4,9 @@ from documents_multi_agents.domain.document_agents import DocumentAgents
 class DocumentMultiAgentRepositoryPort(ABC):
 
     @abstractmethod
-    def find_by_doc_id(self, doc_id: int) -> DocumentAgents | None:
+    async def find_by_doc_id(self, doc_id: int) -> DocumentAgents | None:
         pass
 
     @abstractmethod
-    def save(self, agents: DocumentAgents) -> DocumentAgents:
+    async def save(self, agents: DocumentAgents) -> DocumentAgents:
         pass
@@ -1,11 +1,18 @@
 import asyncio
+import time
+from typing import AsyncIterator, Optional, Tuple
 
 from documents.infrastructure.repository.document_repository_impl import DocumentRepositoryImpl
 from documents_multi_agents.domain.document_agents import DocumentAgents
-from documents_multi_agents.infrastructure.external.download_agent import download_document, get_cache_filename
-from documents_multi_agents.infrastructure.external.parse_agent import parse_document
-from documents_multi_agents.infrastructure.external.summarizers import bullet_summarizer, abstract_summarizer, \
-    casual_summarizer, consensus_summarizer, answer_agent
+from documents_multi_agents.infrastructure.external.download_agent import download_document, get_content_hash
+from documents_multi_agents.infrastructure.external.parse_agent import stream_pages, parse_document, count_pages
+from documents_multi_agents.infrastructure.external.retriever import build_index, retrieve
+from documents_multi_agents.infrastructure.external.summarizers import consensus_summarizer, answer_agent, \
+    stream_answer_agent, streaming_summarizer, single_pass_summarizer, extractive_only_summarizer, \
+    model_fingerprint, acceptable_fingerprints
+from documents_multi_agents.infrastructure.external.generation_presets import GenerationPreset, get_preset, \
+    DEFAULT_PRESET
+from documents_multi_agents.infrastructure.external.tier_router import choose_tier
 
 from documents_multi_agents.infrastructure.repository.document_multi_agent_repository_impl import \
     DocumentsMultiAgentsRepositoryImpl
@@ -28,34 +35,94 @@ class DocumentMultiAgentsUseCase:
             cls.__instance = cls()
         return cls.__instance
 
-    async def analyze_document(self, doc_id: int, doc_url: str, question: str) -> DocumentAgents:
+    async def _prepare_summaries(self, doc_id: int, doc_url: str, preset: GenerationPreset,
+                                 latency_budget_s: Optional[float] = None) -> DocumentAgents:
         # 이미 저장된 agents가 있는지 확인
-        agents = self.agents_repo.find_by_doc_id(doc_id)
+        agents = await self.agents_repo.find_by_doc_id(doc_id)
         if not agents:
             agents = DocumentAgents(doc_id=doc_id, doc_url=doc_url)
 
         # 다운로드
-        content = await download_document(doc_url)
-        cache_path = get_cache_filename(doc_url)
+        cache_path = await download_document(doc_url)
+        content_hash = await get_content_hash(doc_url)
+
+        # 문서 길이와 지연시간 예산으로 요약 티어 결정
+        try:
+            page_count = await asyncio.to_thread(count_pages, cache_path)
+        except FileNotFoundError:
+            # 다른 워커가 캐시 용량 정리로 막 지운 경우 다시 받음
+            cache_path = await download_document(doc_url)
+            content_hash = await get_content_hash(doc_url)
+            page_count = await asyncio.to_thread(count_pages, cache_path)
+        decision = choose_tier(page_count, latency_budget_s)
+        print(f"[tier] doc_id={doc_id} pages={page_count} budget={latency_budget_s} "
+              f"-> {decision.tier} ({decision.reason})")
+
+        # 문서와 모델이 그대로면 저장된 요약을 재사용하고 QA만 다시 수행
+        if agents.is_reusable(content_hash, acceptable_fingerprints(preset.name, decision.tier)):
+            print(f"[tier] doc_id={doc_id} reused stored summaries ({agents.model_fingerprint})")
+            return agents
+
+        started = time.perf_counter()
+        if decision.tier == "hierarchical":
+            # 파싱 + 병렬 요약 (파싱된 페이지부터 바로 요약 시작)
+            parsed_text, summaries = await streaming_summarizer(stream_pages(cache_path), preset)
+            final_summary = await consensus_summarizer(list(summaries.values()), preset)
+        else:
+            parsed_text = await asyncio.to_thread(parse_document, cache_path)
+            if decision.tier == "single":
+                summaries, final_summary = await single_pass_summarizer(parsed_text, preset)
+            else:
+                summaries, final_summary = await asyncio.to_thread(extractive_only_summarizer, parsed_text)
+        print(f"[tier] doc_id={doc_id} {decision.tier} summarized in {time.perf_counter() - started:.1f}s "
+              f"(estimate {decision.estimated_seconds:.0f}s)")
 
-        # 파싱
-        parsed_text = parse_document(content, cache_path)
         agents.update_parsed_text(parsed_text)
+        # QA용 문단 벡터 인덱스는 파싱 시점에 만들어 둠
+        await build_index(content_hash, parsed_text)
 
-        # 병렬 요약
-        bullet, abstract, casual = await asyncio.gather(
-            bullet_summarizer(parsed_text),
-            abstract_summarizer(parsed_text),
-            casual_summarizer(parsed_text)
+        agents.update_summaries(
+            bullet=summaries["bullet"], abstract=summaries["abstract"],
+            casual=summaries["casual"], final=final_summary
         )
+        agents.update_fingerprint(content_hash, model_fingerprint(preset.name, decision.tier))
+        return agents
 
-        final_summary = await consensus_summarizer([bullet, abstract, casual])
-        answer = await answer_agent(final_summary, question)
+    async def analyze_document(self, doc_id: int, doc_url: str, question: str,
+                               preset_name: str = DEFAULT_PRESET,
+                               latency_budget_s: Optional[float] = None) -> DocumentAgents:
+        preset = get_preset(preset_name)
+        agents = await self._prepare_summaries(doc_id, doc_url, preset, latency_budget_s)
 
-        agents.update_summaries(bullet=bullet, abstract=abstract, casual=casual, final=final_summary)
+        passages = await retrieve(agents.content_hash, agents.parsed_text, question)
+        answer = await answer_agent(agents.final_summary, question, preset, passages)
         agents.set_answer(answer)
 
         # DB 저장
-        self.agents_repo.save(agents)
+        await self.agents_repo.save(agents)
 
         return agents
+
+    async def analyze_document_stream(self, doc_id: int, doc_url: str, question: str,
+                                      preset_name: str = DEFAULT_PRESET,
+                                      latency_budget_s: Optional[float] = None) -> AsyncIterator[Tuple[str, dict]]:
+        """요약이 끝나면 summaries 이벤트, 이후 답변 토큰을 token 이벤트로 흘려보냄"""
+        preset = get_preset(preset_name)
+        agents = await self._prepare_summaries(doc_id, doc_url, preset, latency_budget_s)
+        yield "summaries", {
+            "bullet": agents.bullet_summary,
+            "abstract": agents.abstract_summary,
+            "casual": agents.casual_summary,
+            "final": agents.final_summary
+        }
+
+        passages = await retrieve(agents.content_hash, agents.parsed_text, question)
+        async for kind, text in stream_answer_agent(agents.final_summary, question, preset, passages):
+            if kind == "token":
+                yield "token", {"text": text}
+            else:
+                agents.set_answer(text)
+
+        # DB 저장
+        await self.agents_repo.save(agents)
+        yield "done", {"answer": agents.answer}
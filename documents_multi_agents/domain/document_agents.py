@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Iterable, Optional
 
 class DocumentAgents:
     def __init__(
@@ -11,6 +11,8 @@ class DocumentAgents:
         casual_summary: Optional[str] = None,
         final_summary: Optional[str] = None,
         answer: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        model_fingerprint: Optional[str] = None,
     ):
         self.doc_id = doc_id
         self.doc_url = doc_url
@@ -20,6 +22,8 @@ class DocumentAgents:
         self.casual_summary = casual_summary
         self.final_summary = final_summary
         self.answer = answer
+        self.content_hash = content_hash
+        self.model_fingerprint = model_fingerprint
 
     def update_parsed_text(self, text: str):
         self.parsed_text = text
@@ -42,3 +46,17 @@ class DocumentAgents:
 
     def set_answer(self, answer: str):
         self.answer = answer
+
+
+    def update_fingerprint(self, content_hash: str, model_fingerprint: str):
+        self.content_hash = content_hash
+        self.model_fingerprint = model_fingerprint
+
+    # 문서 내용과 모델 구성이 그대로면 저장된 요약을 재사용할 수 있음
+    def is_reusable(self, content_hash: str, model_fingerprints: Iterable[str]) -> bool:
+        return (
+            self.content_hash == content_hash
+            and self.model_fingerprint in model_fingerprints
+            and self.parsed_text is not None
+            and self.final_summary is not None
+        )
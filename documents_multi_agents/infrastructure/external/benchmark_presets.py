@@ -0,0 +1,71 @@
+"""
+preset별 로컬 생성 지연시간(p50/p95)/처리량(생성 토큰/s) 측정
+
+    python -m documents_multi_agents.infrastructure.external.benchmark_presets <pdf 경로> [반복 횟수] [질문]
+
+preset 마다 요약(3 스타일) + consensus + QA 전체 파이프라인을 반복 실행
+마지막에 출력되는 주석 줄을 측정 환경(CPU/GPU, 워커 수)과 함께 generation_presets.PRESETS 위에 기록
+"""
+import asyncio
+import sys
+import time
+from typing import List
+
+from documents_multi_agents.infrastructure.external.generation_presets import PRESETS
+from documents_multi_agents.infrastructure.external.parse_agent import stream_pages
+from documents_multi_agents.infrastructure.external.summarizers import streaming_summarizer, \
+    consensus_summarizer, answer_agent, summarizer, qa_model
+
+DEFAULT_ITERATIONS = 5
+
+
+def _percentile(values: List[float], ratio: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(ratio * (len(ordered) - 1)))]
+
+
+def _count_tokens(tokenizer, texts: List[str]) -> int:
+    return sum(len(tokenizer.encode(t, add_special_tokens=False)) for t in texts if t)
+
+
+async def _run_once(cache_path: str, question: str, preset):
+    started = time.perf_counter()
+    _, summaries = await streaming_summarizer(stream_pages(cache_path), preset)
+    final_summary = await consensus_summarizer(list(summaries.values()), preset)
+    answer = await answer_agent(final_summary, question, preset)
+    elapsed = time.perf_counter() - started
+
+    generated = (
+        _count_tokens(summarizer.tokenizer, list(summaries.values()) + [final_summary])
+        + _count_tokens(qa_model.tokenizer, [answer])
+    )
+    return elapsed, generated
+
+
+async def benchmark(cache_path: str, iterations: int, question: str):
+    # 모델 로딩/캐시 워밍업은 측정에서 제외
+    await _run_once(cache_path, question, PRESETS["fast"])
+
+    lines = []
+    for name, preset in PRESETS.items():
+        latencies, tokens = [], 0
+        for _ in range(iterations):
+            elapsed, generated = await _run_once(cache_path, question, preset)
+            latencies.append(elapsed)
+            tokens += generated
+
+        line = (
+            f"# {name}: p50 {_percentile(latencies, 0.5):.1f}s / p95 {_percentile(latencies, 0.95):.1f}s, "
+            f"{tokens / sum(latencies):.1f} tok/s (n={iterations})"
+        )
+        print(line)
+        lines.append(line)
+
+    print("\n# generation_presets.PRESETS 주석용")
+    print("\n".join(lines))
+
+
+if __name__ == "__main__":
+    path = sys.argv[1]
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_ITERATIONS
+    asyncio.run(benchmark(path, runs, sys.argv[3] if len(sys.argv) > 3 else "What is this document about?"))
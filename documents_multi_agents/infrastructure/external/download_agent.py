@@ -1,31 +1,190 @@
 import os
+import json
+import time
+import fcntl
+import asyncio
 import hashlib
+import tempfile
+import uuid
+from contextlib import contextmanager
+from typing import Optional
+
+import aiofiles
 import aiohttp
 
 # 캐시 디렉토리 경로 설정
-CACHE_DIR = "./cache"
+CACHE_DIR = os.getenv("DOCUMENT_CACHE_DIR", "./cache")
+CACHE_INDEX_PATH = os.path.join(CACHE_DIR, "index.json")
+# 여러 워커 프로세스가 같은 인덱스를 갱신하므로 파일 잠금으로 직렬화
+CACHE_LOCK_PATH = os.path.join(CACHE_DIR, "index.lock")
+# 캐시 전체 용량 한도 (LRU로 초과분 제거)
+CACHE_MAX_BYTES = int(os.getenv("DOCUMENT_CACHE_MAX_BYTES", str(2 * 1024 * 1024 * 1024)))
+# 최근 이 시간 안에 사용된 파일은 용량을 넘어도 제거하지 않음 (다른 요청이 아직 파싱 중일 수 있음)
+CACHE_EVICT_GRACE_SECONDS = float(os.getenv("DOCUMENT_CACHE_EVICT_GRACE_SECONDS", "600"))
+# 단일 문서 최대 크기
+MAX_DOCUMENT_BYTES = int(os.getenv("DOCUMENT_MAX_BYTES", str(100 * 1024 * 1024)))
+CHUNK_SIZE = 64 * 1024
 os.makedirs(CACHE_DIR, exist_ok=True)
 
+_session: Optional[aiohttp.ClientSession] = None
+
+
 def get_cache_filename(doc_url: str) -> str:
     file_hash = hashlib.sha256(doc_url.encode()).hexdigest()
     file_path = os.path.join(CACHE_DIR, f"{file_hash}.pdf")
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
     return file_path
 
-async def download_document(doc_url: str) -> bytes:
+
+def get_session() -> aiohttp.ClientSession:
+    """프로세스 단위로 재사용하는 커넥션 풀 세션"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=300, sock_read=60),
+        )
+    return _session
+
+
+async def close_session():
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+# 캐시 인덱스: 파일명 -> {url, etag, last_modified, size, sha256, last_access}
+# 파일 I/O 라 호출 측에서 asyncio.to_thread 로 실행
+@contextmanager
+def _locked_index():
+    """프로세스 간 배타 잠금 안에서 인덱스를 읽고, 블록이 끝나면 저장"""
+    with open(CACHE_LOCK_PATH, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            index = _load_index()
+            yield index
+            _save_index(index)
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _load_index() -> dict:
+    try:
+        with open(CACHE_INDEX_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_index(index: dict):
+    # 임시 파일은 쓰는 쪽마다 고유 이름 (같은 디렉토리라 os.replace 가 원자적)
+    with tempfile.NamedTemporaryFile("w", dir=CACHE_DIR, suffix=".json.tmp", delete=False, encoding="utf-8") as f:
+        json.dump(index, f)
+    try:
+        os.replace(f.name, CACHE_INDEX_PATH)
+    except OSError:
+        os.remove(f.name)
+        raise
+
+
+def _evict(index: dict, keep: str):
+    """용량 한도를 넘으면 가장 오래 사용하지 않은 파일부터 제거 (최근 사용 파일은 유지)"""
+    total = sum(entry.get("size", 0) for entry in index.values())
+    protected_since = time.time() - CACHE_EVICT_GRACE_SECONDS
+    for name, entry in sorted(index.items(), key=lambda item: item[1].get("last_access", 0)):
+        if total <= CACHE_MAX_BYTES or entry.get("last_access", 0) >= protected_since:
+            break
+        if name == keep:
+            continue
+        try:
+            os.remove(os.path.join(CACHE_DIR, name))
+        except FileNotFoundError:
+            pass
+        total -= entry.get("size", 0)
+        del index[name]
+
+
+def _touch_index(name: str):
+    with _locked_index() as index:
+        if name in index:
+            index[name]["last_access"] = time.time()
+
+
+def _record_download(name: str, entry: dict):
+    with _locked_index() as index:
+        index[name] = entry
+        _evict(index, keep=name)
+
+
+async def _touch(name: str):
+    await asyncio.to_thread(_touch_index, name)
+
+
+async def get_content_hash(doc_url: str) -> Optional[str]:
+    """다운로드 시 스트리밍으로 계산해 둔 문서 sha256"""
+    name = os.path.basename(get_cache_filename(doc_url))
+    entry = (await asyncio.to_thread(_load_index)).get(name)
+    return entry.get("sha256") if entry else None
+
+
+async def download_document(doc_url: str) -> str:
+    """문서를 캐시에 스트리밍 저장하고 캐시 파일 경로를 반환"""
     cache_path = get_cache_filename(doc_url)
+    name = os.path.basename(cache_path)
+    entry = (await asyncio.to_thread(_load_index)).get(name) if os.path.exists(cache_path) else None
 
-    if os.path.exists(cache_path):
-        with open(cache_path, "rb") as f:
-            return f.read()
+    # 캐시가 있으면 조건부 요청으로 재검증
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(doc_url) as resp:
+    try:
+        async with get_session().get(doc_url, headers=headers) as resp:
+            if resp.status == 304 and entry:
+                await _touch(name)
+                return cache_path
             if resp.status != 200:
                 raise Exception(f"다운로드 실패: {resp.status}")
-            content = await resp.read()
+            if resp.content_length and resp.content_length > MAX_DOCUMENT_BYTES:
+                raise Exception(f"문서 크기 초과: {resp.content_length} bytes")
+
+            # 같은 URL 을 동시에 받아도 서로의 임시 파일을 덮어쓰지 않게 요청마다 고유 이름
+            tmp_path = f"{cache_path}.{uuid.uuid4().hex}.part"
+            sha256 = hashlib.sha256()
+            size = 0
+            try:
+                async with aiofiles.open(tmp_path, "wb") as f:
+                    async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                        size += len(chunk)
+                        if size > MAX_DOCUMENT_BYTES:
+                            raise Exception(f"문서 크기 초과: {MAX_DOCUMENT_BYTES} bytes 이상")
+                        sha256.update(chunk)
+                        await f.write(chunk)
+                os.replace(tmp_path, cache_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        # 네트워크 오류/타임아웃 시 기존 캐시가 있으면 그대로 사용
+        if entry:
+            await _touch(name)
+            return cache_path
+        raise
 
-    with open(cache_path, "wb") as f:
-        f.write(content)
+    await asyncio.to_thread(_record_download, name, {
+        "url": doc_url,
+        "etag": etag,
+        "last_modified": last_modified,
+        "size": size,
+        "sha256": sha256.hexdigest(),
+        "last_access": time.time(),
+    })
 
-    return content
\ No newline at end of file
+    return cache_path
@@ -0,0 +1,89 @@
+import os
+import re
+from typing import List
+
+import networkx as nx
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# 추출 요약 윈도우 크기: 이 길이만큼 모아서 문장 순위를 매김 (짧은 문서는 그대로 통과)
+EXTRACTIVE_WINDOW_CHARS = int(os.getenv("EXTRACTIVE_WINDOW_CHARS", "10000"))
+# 윈도우마다 남길 분량 비율 (생성 요약 모델 입력량 = 원문 x 비율)
+EXTRACTIVE_KEEP_RATIO = float(os.getenv("EXTRACTIVE_KEEP_RATIO", "0.3"))
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.strip() for s in re.split(r'(?<=[.!?])\s+', text) if s.strip()]
+
+
+# TextRank: TF-IDF 코사인 유사도 그래프에서 PageRank 점수 계산
+def rank_sentences(sentences: List[str]) -> List[float]:
+    try:
+        tfidf = TfidfVectorizer().fit_transform(sentences)
+    except ValueError:
+        # 단어가 하나도 없는 경우 (숫자/기호만 있는 페이지 등)
+        return [0.0] * len(sentences)
+    similarity = (tfidf @ tfidf.T).toarray()
+    graph = nx.from_numpy_array(similarity)
+    scores = nx.pagerank(graph, max_iter=200)
+    return [scores[i] for i in range(len(sentences))]
+
+
+def select_salient(text: str, budget_chars: int) -> str:
+    """점수 높은 문장을 budget_chars까지 고르고 원래 순서로 이어붙임"""
+    if len(text) <= budget_chars:
+        return text
+    sentences = split_sentences(text)
+    if len(sentences) <= 1:
+        return text
+
+    scores = rank_sentences(sentences)
+    selected, used = set(), 0
+    for i in sorted(range(len(sentences)), key=lambda i: scores[i], reverse=True):
+        if used + len(sentences[i]) > budget_chars and selected:
+            continue
+        selected.add(i)
+        used += len(sentences[i]) + 1
+    return " ".join(sentences[i] for i in sorted(selected))
+
+
+class ExtractiveFilter:
+    """페이지 단위로 받아 윈도우가 찰 때마다 핵심 문장만 내보냄"""
+
+    def __init__(self, window_chars: int = EXTRACTIVE_WINDOW_CHARS, keep_ratio: float = EXTRACTIVE_KEEP_RATIO):
+        self.window_chars = window_chars
+        self.keep_ratio = keep_ratio
+        self.buffer = ""
+        self.total_chars = 0
+        self.kept_chars = 0
+
+    def _select(self, text: str) -> str:
+        selected = select_salient(text, int(len(text) * self.keep_ratio))
+        self.kept_chars += len(selected)
+        return selected
+
+    def feed(self, text: str) -> str:
+        self.total_chars += len(text)
+        self.buffer += text + "\n"
+
+        selected = []
+        while len(self.buffer) >= self.window_chars:
+            # 윈도우 경계에서 문장이 잘리지 않도록 마지막 문장 끝에서 자름
+            head = self.buffer[:self.window_chars]
+            match = re.search(r'[.!?]\s+(?=[^.!?]*$)', head)
+            cut = match.end() if match else self.window_chars
+            window, self.buffer = self.buffer[:cut], self.buffer[cut:]
+            selected.append(self._select(window))
+        return " ".join(s for s in selected if s)
+
+    def flush(self) -> str:
+        window, self.buffer = self.buffer, ""
+        # 윈도우 하나에 못 미치는 짧은 문서는 걸러내지 않음
+        if self.total_chars < self.window_chars:
+            self.kept_chars += len(window)
+            return window
+        return self._select(window) if window.strip() else ""
+
+
+def extract_salient(text: str) -> str:
+    extractor = ExtractiveFilter()
+    return " ".join(part for part in (extractor.feed(text), extractor.flush()) if part)
@@ -0,0 +1,114 @@
+import json
+import mmap
+import os
+import struct
+from typing import Dict
+
+import torch
+from huggingface_hub import snapshot_download
+from transformers import AutoConfig, AutoTokenizer, pipeline
+
+# 1이면 safetensors 가중치를 읽기 전용 mmap으로 올려서 워커 프로세스끼리 물리 메모리를 공유
+SHARED_MODEL_WEIGHTS = os.getenv("SHARED_MODEL_WEIGHTS", "1") == "1"
+
+_SAFETENSORS_DTYPES = {
+    "F64": torch.float64,
+    "F32": torch.float32,
+    "F16": torch.float16,
+    "BF16": torch.bfloat16,
+    "I64": torch.int64,
+    "I32": torch.int32,
+    "I16": torch.int16,
+    "I8": torch.int8,
+    "U8": torch.uint8,
+    "BOOL": torch.bool,
+}
+
+# 텐서가 참조하는 mmap이 GC되지 않도록 보관
+_mapped_files = []
+
+
+def _load_safetensors_mmap(path: str) -> Dict[str, torch.Tensor]:
+    """safetensors 파일을 복사 없이 page cache에 매핑된 텐서로 반환"""
+    with open(path, "rb") as f:
+        header_len = struct.unpack("<Q", f.read(8))[0]
+        header = json.loads(f.read(header_len))
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _mapped_files.append(mm)
+
+    data_start = 8 + header_len
+    tensors = {}
+    for name, info in header.items():
+        if name == "__metadata__":
+            continue
+        dtype = _SAFETENSORS_DTYPES[info["dtype"]]
+        start, end = info["data_offsets"]
+        shape = info["shape"]
+        if end == start:
+            tensors[name] = torch.empty(shape, dtype=dtype)
+            continue
+        count = (end - start) // torch.empty((), dtype=dtype).element_size()
+        tensors[name] = torch.frombuffer(mm, dtype=dtype, count=count, offset=data_start + start).view(shape)
+    return tensors
+
+
+def _load_shared_model(model_dir: str, model_cls):
+    config = AutoConfig.from_pretrained(model_dir)
+    # meta 디바이스에서 뼈대만 만들고 가중치는 mmap 텐서를 그대로 할당 (assign=True)
+    with torch.device("meta"):
+        model = model_cls.from_config(config)
+
+    state_dict = {}
+    for file_name in sorted(os.listdir(model_dir)):
+        if file_name.endswith(".safetensors"):
+            state_dict.update(_load_safetensors_mmap(os.path.join(model_dir, file_name)))
+    if not state_dict:
+        raise FileNotFoundError(f"No safetensors weights in {model_dir}")
+
+    model.load_state_dict(state_dict, strict=False, assign=True)
+    model.tie_weights()
+
+    leftovers = [n for n, t in list(model.named_parameters()) + list(model.named_buffers()) if t.is_meta]
+    if leftovers:
+        raise RuntimeError(f"Weights missing from checkpoint: {leftovers[:5]}")
+
+    model.eval()
+    model.requires_grad_(False)
+    return model
+
+
+def load_pipeline(task: str, model_name: str, model_cls):
+    """task 파이프라인 생성. 가능하면 mmap 공유 가중치로, 안 되면 기존 방식으로 로드"""
+    if SHARED_MODEL_WEIGHTS:
+        try:
+            model_dir = snapshot_download(
+                model_name,
+                allow_patterns=["*.json", "*.safetensors", "*.model", "*.txt"]
+            )
+            model = _load_shared_model(model_dir, model_cls)
+            tokenizer = AutoTokenizer.from_pretrained(model_dir)
+            return pipeline(task, model=model, tokenizer=tokenizer, device=-1)
+        except Exception as e:
+            print(f"Shared weight loading failed for {model_name}, falling back: {e}")
+    return pipeline(task, model=model_name, device=-1)
+
+
+def memory_report() -> Dict[str, int]:
+    """현재 프로세스의 RSS 중 공유/전용 메모리 (kB, Linux /proc 기준)"""
+    fields = {}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == "kB":
+                    fields[parts[0].rstrip(":")] = int(parts[1])
+    except FileNotFoundError:
+        return {}
+
+    return {
+        "pid": os.getpid(),
+        "rss_kb": fields.get("Rss", 0),
+        "pss_kb": fields.get("Pss", 0),
+        "shared_kb": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+        "private_kb": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
@@ -1,14 +1,76 @@
+import asyncio
+import os
+import queue
+import threading
+from typing import AsyncIterator, Iterator
+
 from PyPDF2 import PdfReader
 
-def parse_document(content: bytes, cache_path: str) -> str:
-    with open(cache_path, "wb") as f:
-        f.write(content)
+# 파서 스레드가 소비자보다 앞서 읽어 둘 수 있는 최대 페이지 수
+PAGE_BUFFER_SIZE = int(os.getenv("PARSE_PAGE_BUFFER_SIZE", "8"))
+
+
+def iter_pages(cache_path: str) -> Iterator[str]:
+    # 파일 핸들을 그대로 넘겨서 페이지를 필요할 때마다 읽음 (전체 복사/재기록 없음)
+    with open(cache_path, "rb") as f:
+        reader = PdfReader(f)
+        for page in reader.pages:
+            yield page.extract_text() or ""  # None 방지
+
+
+def count_pages(cache_path: str) -> int:
+    with open(cache_path, "rb") as f:
+        return len(PdfReader(f).pages)
+
+
+def parse_document(cache_path: str) -> str:
+    return "\n".join(iter_pages(cache_path)).strip()
+
+
+async def stream_pages(cache_path: str) -> AsyncIterator[str]:
+    """
+    이벤트 루프 밖(스레드)에서 파싱하면서 페이지 단위로 전달
+    버퍼가 차면 파서가 기다리고, 소비자가 끝나거나 취소되면 다음 페이지에서 파싱 중단
+    """
+    loop = asyncio.get_running_loop()
+    pages: queue.Queue = queue.Queue(maxsize=PAGE_BUFFER_SIZE)
+    stop = threading.Event()
+    done = object()
 
-    reader = PdfReader(cache_path)
-    text = ""
+    def put(item) -> bool:
+        # 버퍼가 찬 동안에도 중단 요청을 확인
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
 
-    for page in reader.pages:
-        page_text = page.extract_text() or ""  # None 방지
-        text += page_text + "\n"
+    def produce():
+        try:
+            for page_text in iter_pages(cache_path):
+                if not put(page_text):
+                    return
+        except Exception as e:
+            put(e)
+        finally:
+            put(done)
 
-    return text.strip()
+    producer = loop.run_in_executor(None, produce)
+    try:
+        while True:
+            item = await asyncio.to_thread(pages.get)
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+        await producer
+    finally:
+        stop.set()
+        # 취소로 남은 pages.get 대기 스레드를 깨움
+        try:
+            pages.put_nowait(done)
+        except queue.Full:
+            pass
@@ -0,0 +1,92 @@
+import asyncio
+import os
+import re
+from collections import OrderedDict
+from typing import List, Optional
+
+import faiss
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+# 검색 단위 문단 길이 / QA에 넣을 최대 컨텍스트 길이 (flan-t5 입력 512 토큰 안쪽)
+PASSAGE_CHARS = int(os.getenv("RETRIEVAL_PASSAGE_CHARS", "500"))
+MAX_CONTEXT_CHARS = int(os.getenv("RETRIEVAL_MAX_CONTEXT_CHARS", "1500"))
+TOP_K = int(os.getenv("RETRIEVAL_TOP_K", "4"))
+# 메모리에 유지할 문서 인덱스 개수 (LRU)
+MAX_INDEXES = int(os.getenv("RETRIEVAL_MAX_INDEXES", "32"))
+
+_embedder: Optional[SentenceTransformer] = None
+_indexes: "OrderedDict[str, PassageIndex]" = OrderedDict()
+
+
+def get_embedder() -> SentenceTransformer:
+    global _embedder
+    if _embedder is None:
+        _embedder = SentenceTransformer(EMBEDDING_MODEL, device="cpu")
+    return _embedder
+
+
+def split_passages(text: str, max_chars: int = PASSAGE_CHARS) -> List[str]:
+    """원문(숫자 포함)을 문장 경계 기준으로 max_chars 이하 문단으로 분할"""
+    sentences = re.split(r'(?<=[.!?])\s+', re.sub(r'\s+', ' ', text).strip())
+    passages, current = [], ""
+    for s in sentences:
+        if not s:
+            continue
+        if current and len(current) + len(s) + 1 > max_chars:
+            passages.append(current.strip())
+            current = ""
+        current += s + " "
+    if current.strip():
+        passages.append(current.strip())
+    return passages
+
+
+class PassageIndex:
+    """문서 하나의 문단 임베딩 (정규화 후 내적 = 코사인 유사도)"""
+
+    def __init__(self, passages: List[str]):
+        self.passages = passages
+        embeddings = get_embedder().encode(passages, batch_size=32, normalize_embeddings=True)
+        embeddings = np.asarray(embeddings, dtype="float32")
+        self.index = faiss.IndexFlatIP(embeddings.shape[1])
+        self.index.add(embeddings)
+
+    def search(self, question: str, k: int = TOP_K, max_chars: int = MAX_CONTEXT_CHARS) -> List[str]:
+        query = get_embedder().encode([question], normalize_embeddings=True)
+        _, ids = self.index.search(np.asarray(query, dtype="float32"), min(k, len(self.passages)))
+
+        # 유사도 순으로 컨텍스트 한도까지 채운 뒤 원문 순서대로 정렬해 문맥 흐름 유지
+        selected, used = [], 0
+        for i in (i for i in ids[0] if i >= 0):
+            if selected and used + len(self.passages[i]) > max_chars:
+                break
+            selected.append(i)
+            used += len(self.passages[i]) + 1
+        return [self.passages[i] for i in sorted(selected)]
+
+
+async def build_index(key: str, text: str) -> Optional[PassageIndex]:
+    passages = split_passages(text or "")
+    if not passages:
+        return None
+    index = await asyncio.to_thread(PassageIndex, passages)
+    _indexes[key] = index
+    _indexes.move_to_end(key)
+    while len(_indexes) > MAX_INDEXES:
+        _indexes.popitem(last=False)
+    return index
+
+
+async def retrieve(key: str, text: str, question: str, k: int = TOP_K) -> List[str]:
+    """질문과 가까운 문단 top-k (인덱스가 없으면 parsed_text로 새로 생성)"""
+    index = _indexes.get(key)
+    if index is None:
+        index = await build_index(key, text)
+        if index is None:
+            return []
+    else:
+        _indexes.move_to_end(key)
+
+    return await asyncio.to_thread(index.search, question, k)
@@ -1,7 +1,17 @@
 import asyncio
 import re
+from contextlib import aclosing
+from threading import Event, Thread
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
-from transformers import pipeline
+from transformers import AutoModelForSeq2SeqLM, StoppingCriteria, StoppingCriteriaList, TextIteratorStreamer
+
+from documents_multi_agents.infrastructure.external.extractive_filter import ExtractiveFilter, extract_salient, \
+    select_salient, EXTRACTIVE_WINDOW_CHARS, EXTRACTIVE_KEEP_RATIO
+from documents_multi_agents.infrastructure.external.model_loader import load_pipeline
+from documents_multi_agents.infrastructure.external.tier_router import tiers_at_least
+from documents_multi_agents.infrastructure.external.generation_presets import GenerationPreset, get_preset, \
+    presets_at_least, DEFAULT_PRESET
 
 def deduplicate_sentences(text: str) -> str:
     sentences = re.split(r'(?<=[.!?])\s+', text)
@@ -27,69 +37,311 @@ def clean_text(text: str) -> str:
     # 연속 공백 제거
     return re.sub(r'\s+', ' ', text).strip()
 
-# 문장 단위 청킹
-def chunk_text(text: str, max_chars: int = 1000):
-    text = clean_text(text)
-    if not text:
-        return []
-
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    chunks, current = [], ""
-    seen_sentences = set()
+# 문장 단위 청킹 (페이지 단위로 나눠 넣어도 한 번에 넣은 것과 같은 청크가 나옴)
+class IncrementalChunker:
+    def __init__(self, max_chars: int = 1000):
+        self.max_chars = max_chars
+        self.current = ""
+        self.carry = ""
+        self.seen_sentences = set()
 
-    for s in sentences:
+    def _add_sentence(self, s: str, chunks: list):
         s_clean = s.strip()
-        if not s_clean or s_clean in seen_sentences:
-            continue
-        seen_sentences.add(s_clean)
-        if len(current) + len(s_clean) + 1 <= max_chars:
-            current += s_clean + " "
+        if not s_clean or s_clean in self.seen_sentences:
+            return
+        self.seen_sentences.add(s_clean)
+        if len(self.current) + len(s_clean) + 1 <= self.max_chars:
+            self.current += s_clean + " "
         else:
-            if current:
-                chunks.append(current.strip())
-            current = s_clean + " "
-    if current:
-        chunks.append(current.strip())
+            if self.current:
+                chunks.append(self.current.strip())
+            self.current = s_clean + " "
+
+    def feed(self, text: str) -> list:
+        text = clean_text(f"{self.carry} {text}")
+        self.carry = ""
+        if not text:
+            return []
+
+        sentences = re.split(r'(?<=[.!?])\s+', text)
+        # 마지막 문장은 다음 페이지로 이어질 수 있으므로 보류
+        if not re.search(r'[.!?]$', text):
+            self.carry = sentences.pop()
 
-    return chunks
+        chunks = []
+        for s in sentences:
+            self._add_sentence(s, chunks)
+        return chunks
+
+    def flush(self) -> list:
+        chunks = []
+        if self.carry:
+            self._add_sentence(self.carry, chunks)
+            self.carry = ""
+        if self.current:
+            chunks.append(self.current.strip())
+            self.current = ""
+        return chunks
+
+
+def chunk_text(text: str, max_chars: int = 1000):
+    chunker = IncrementalChunker(max_chars)
+    return chunker.feed(text) + chunker.flush()
 
 # 모델 로드
-summarizer = pipeline("summarization", model="facebook/bart-large-cnn", device=-1)
-qa_model = pipeline("text2text-generation", model="google/flan-t5-large", device=-1)
+SUMMARIZER_MODEL = "facebook/bart-large-cnn"
+QA_MODEL = "google/flan-t5-large"
+# 짧은 문서용 단일 패스 요약 모델
+DISTILLED_SUMMARIZER_MODEL = "sshleifer/distilbart-cnn-12-6"
+# 요약 로직(청킹/길이 파라미터)이 바뀌면 버전을 올려서 저장된 결과를 무효화
+PIPELINE_VERSION = "2"
+
+
+def model_fingerprint(preset: str = DEFAULT_PRESET, tier: str = "hierarchical") -> str:
+    return (
+        f"{SUMMARIZER_MODEL}|{DISTILLED_SUMMARIZER_MODEL}|{QA_MODEL}|v{PIPELINE_VERSION}"
+        f"|x{EXTRACTIVE_WINDOW_CHARS}:{EXTRACTIVE_KEEP_RATIO}|{preset}|{tier}"
+    )
+
+
+# 요청 preset/티어와 같거나 더 높은 품질로 만든 요약이면 재사용 가능
+def acceptable_fingerprints(preset: str = DEFAULT_PRESET, tier: str = "hierarchical") -> List[str]:
+    return [
+        model_fingerprint(preset_name, tier_name)
+        for preset_name in presets_at_least(preset)
+        for tier_name in tiers_at_least(tier)
+    ]
+
+
+# 가중치는 mmap으로 공유 로드 (워커 프로세스가 여러 개여도 물리 메모리는 한 벌)
+summarizer = load_pipeline("summarization", SUMMARIZER_MODEL, AutoModelForSeq2SeqLM)
+qa_model = load_pipeline("text2text-generation", QA_MODEL, AutoModelForSeq2SeqLM)
+# distilbart는 single 티어가 처음 선택될 때 로드
+_distilled_summarizer = None
+
+
+def get_distilled_summarizer():
+    global _distilled_summarizer
+    if _distilled_summarizer is None:
+        _distilled_summarizer = load_pipeline("summarization", DISTILLED_SUMMARIZER_MODEL, AutoModelForSeq2SeqLM)
+    return _distilled_summarizer
 
 # 안전한 모델 호출
-async def run_summarize(text: str, max_len: int, min_len: int):
-    return await asyncio.to_thread(
-        lambda: summarizer(text, max_length=max_len, min_length=min_len, truncation=True)[0]["summary_text"]
+def _summary_lengths(max_len: int, min_len: int, preset: GenerationPreset):
+    return int(max_len * preset.length_scale), int(min_len * preset.length_scale)
+
+async def run_summarize(text: str, max_len: int, min_len: int, preset: GenerationPreset = get_preset()):
+    return (await run_summarize_batch([text], max_len, min_len, preset))[0]
+
+async def run_summarize_batch(texts: List[str], max_len: int, min_len: int,
+                              preset: GenerationPreset = get_preset(), model=None) -> List[str]:
+    model = model or summarizer
+    max_len, min_len = _summary_lengths(max_len, min_len, preset)
+    # 길이가 비슷한 것끼리 배치되도록 정렬 후 원래 순서로 복원
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    outputs = await asyncio.to_thread(
+        lambda: model(
+            [texts[i] for i in order],
+            max_length=max_len,
+            min_length=min_len,
+            num_beams=preset.num_beams,
+            batch_size=preset.batch_size,
+            truncation=True
+        )
     )
+    results = [""] * len(texts)
+    for i, out in zip(order, outputs):
+        results[i] = out["summary_text"]
+    return results
 
-async def run_qa(prompt: str):
+async def run_qa(prompt: str, preset: GenerationPreset = get_preset()):
     return await asyncio.to_thread(
-        lambda: qa_model(prompt, max_new_tokens=150)[0]["generated_text"]
+        lambda: qa_model(
+            prompt, max_new_tokens=preset.qa_max_new_tokens, num_beams=preset.num_beams
+        )[0]["generated_text"]
     )
 
+class _EventStoppingCriteria(StoppingCriteria):
+    """이벤트가 설정되면 다음 토큰에서 생성 중단 (클라이언트 연결 종료 시 스레드 정리용)"""
+
+    def __init__(self, stop_event: Event):
+        self.stop_event = stop_event
+
+    def __call__(self, input_ids, scores, **kwargs) -> bool:
+        return self.stop_event.is_set()
+
+
+# 토큰 단위 스트리밍 QA (greedy 전용: TextIteratorStreamer는 beam search 미지원)
+async def stream_qa(prompt: str, preset: GenerationPreset = get_preset()) -> AsyncIterator[str]:
+    tokenizer = qa_model.tokenizer
+    streamer = TextIteratorStreamer(tokenizer, skip_prompt=True, skip_special_tokens=True, timeout=120)
+    inputs = tokenizer(prompt, return_tensors="pt", truncation=True)
+    errors = []
+    stop_event = Event()
+
+    def generate():
+        try:
+            qa_model.model.generate(
+                **inputs, streamer=streamer, max_new_tokens=preset.qa_max_new_tokens, num_beams=1,
+                stopping_criteria=StoppingCriteriaList([_EventStoppingCriteria(stop_event)])
+            )
+        except Exception as e:
+            errors.append(e)
+            streamer.end()
+
+    thread = Thread(target=generate, daemon=True)
+    thread.start()
+    try:
+        while (text := await asyncio.to_thread(next, streamer, None)) is not None:
+            if text:
+                yield text
+    finally:
+        # 소비자가 중간에 끊어도(GeneratorExit/취소) 생성 스레드가 끝까지 돌지 않게
+        stop_event.set()
+    await asyncio.to_thread(thread.join)
+    if errors:
+        raise errors[0]
+
 # 계층 요약
-async def safe_summarizer(text: str, max_len: int, min_len: int):
-    chunks = chunk_text(text, 1000)
-    lvl1 = [await run_summarize(c, max_len, min_len) for c in chunks]
+async def reduce_summaries(lvl1: List[str], max_len: int, min_len: int, preset: GenerationPreset = get_preset()):
     combined = " ".join(lvl1)
     # 길면 2단계 요약
     if len(combined) > 2000:
         lvl2_chunks = chunk_text(combined, 1000)
-        lvl2 = [await run_summarize(c, max_len, min_len) for c in lvl2_chunks]
+        lvl2 = await run_summarize_batch(lvl2_chunks, max_len, min_len, preset)
         combined = " ".join(lvl2)
     return deduplicate_sentences(combined)
 
+async def safe_summarizer(text: str, max_len: int, min_len: int, preset: GenerationPreset = get_preset()):
+    # 긴 문서는 핵심 문장만 남긴 뒤 생성 요약
+    # TextRank 는 CPU 작업이라 이벤트 루프 밖에서
+    chunks = chunk_text(await asyncio.to_thread(extract_salient, text), 1000)
+    lvl1 = await run_summarize_batch(chunks, max_len, min_len, preset) if chunks else []
+    return await reduce_summaries(lvl1, max_len, min_len, preset)
+
 # 요약 타입
-async def bullet_summarizer(text):   return await safe_summarizer(text, 180, 40)
-async def abstract_summarizer(text): return await safe_summarizer(text, 250, 80)
-async def casual_summarizer(text):   return await safe_summarizer(text, 180, 40)
-async def consensus_summarizer(lst):
+SUMMARY_STYLES = {
+    "bullet": (180, 40),
+    "abstract": (250, 80),
+    "casual": (180, 40),
+}
+CONSENSUS_LENGTHS = (200, 60)
+
+async def bullet_summarizer(text, preset=get_preset()):   return await safe_summarizer(text, *SUMMARY_STYLES["bullet"], preset)
+async def abstract_summarizer(text, preset=get_preset()): return await safe_summarizer(text, *SUMMARY_STYLES["abstract"], preset)
+async def casual_summarizer(text, preset=get_preset()):   return await safe_summarizer(text, *SUMMARY_STYLES["casual"], preset)
+async def consensus_summarizer(lst, preset=get_preset()):
     joined = " ".join([s for s in lst if s])
-    return await safe_summarizer(joined, 200, 60)
+    return await safe_summarizer(joined, *CONSENSUS_LENGTHS, preset)
+
+# 토큰 길이 -> 대략적인 글자 수 (추출 요약 분량 산정용)
+CHARS_PER_TOKEN = 4
+# distilbart 입력 한도(1024 토큰) 안에 들어가도록 미리 추출
+SINGLE_PASS_MAX_CHARS = 3500
+
+# single 티어: 짧은 문서를 distilbart로 스타일별 한 번씩만 요약
+async def single_pass_summarizer(text: str,
+                                 preset: GenerationPreset = get_preset()) -> Tuple[Dict[str, str], str]:
+    model = get_distilled_summarizer()
+    # TextRank 는 CPU 작업이라 이벤트 루프 밖에서
+    source = await asyncio.to_thread(select_salient, clean_text(text), SINGLE_PASS_MAX_CHARS)
+    if not source:
+        return {style: "" for style in SUMMARY_STYLES}, ""
+
+    # 길이 파라미터가 같은 스타일은 한 번만 호출
+    by_lengths = {}
+    for lengths in set(SUMMARY_STYLES.values()):
+        by_lengths[lengths] = (await run_summarize_batch([source], *lengths, preset, model))[0]
+    summaries = {style: by_lengths[lengths] for style, lengths in SUMMARY_STYLES.items()}
+
+    joined = " ".join(s for s in summaries.values() if s)
+    final = (await run_summarize_batch([joined], *CONSENSUS_LENGTHS, preset, model))[0]
+    return summaries, deduplicate_sentences(final)
+
+# extractive 티어: 모델 호출 없이 TextRank 상위 문장만으로 요약
+def extractive_only_summarizer(text: str) -> Tuple[Dict[str, str], str]:
+    source = clean_text(text)
+    summaries = {
+        style: select_salient(source, max_len * CHARS_PER_TOKEN)
+        for style, (max_len, _) in SUMMARY_STYLES.items()
+    }
+    final = select_salient(source, CONSENSUS_LENGTHS[0] * CHARS_PER_TOKEN)
+    return summaries, final
+
+# 페이지 스트림 요약: 파싱이 끝나기 전에 앞쪽 청크부터 1단계 요약 시작
+async def streaming_summarizer(pages: AsyncIterator[str],
+                               preset: GenerationPreset = get_preset()) -> Tuple[str, Dict[str, str]]:
+    queues = {style: asyncio.Queue() for style in SUMMARY_STYLES}
+
+    async def worker(style: str):
+        max_len, min_len = SUMMARY_STYLES[style]
+        queue = queues[style]
+        lvl1, finished = [], False
+        while not finished:
+            batch = [await queue.get()]
+            # 이미 쌓여 있는 청크는 preset 배치 크기만큼 한 번에 처리
+            while len(batch) < preset.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            if None in batch:
+                finished = True
+                batch = batch[:batch.index(None)]
+            if batch:
+                lvl1.extend(await run_summarize_batch(batch, max_len, min_len, preset))
+        return await reduce_summaries(lvl1, max_len, min_len, preset)
+
+    extractor = ExtractiveFilter()
+    chunker = IncrementalChunker(1000)
+    page_texts = []
+    chunk_count = 0
+
+    def dispatch(chunks: list):
+        nonlocal chunk_count
+        chunk_count += len(chunks)
+        for chunk in chunks:
+            for queue in queues.values():
+                queue.put_nowait(chunk)
+
+    async def produce():
+        try:
+            # 중간에 취소돼도 페이지 스트림(파서 스레드)을 바로 닫음
+            async with aclosing(pages) as page_stream:
+                async for page_text in page_stream:
+                    page_texts.append(page_text)
+                    # 추출(TextRank)은 CPU 작업이라 이벤트 루프 밖에서
+                    dispatch(chunker.feed(await asyncio.to_thread(extractor.feed, page_text)))
+            dispatch(chunker.feed(await asyncio.to_thread(extractor.flush)) + chunker.flush())
+        finally:
+            for queue in queues.values():
+                queue.put_nowait(None)
+
+    # 워커/파싱 중 하나라도 실패하면 나머지를 모두 취소
+    try:
+        async with asyncio.TaskGroup() as group:
+            workers = {style: group.create_task(worker(style)) for style in SUMMARY_STYLES}
+            group.create_task(produce())
+    except ExceptionGroup as e:
+        # 호출 측 예외 처리가 그대로 동작하도록 첫 원인 예외를 전달
+        raise e.exceptions[0]
+
+    print(f"[extractive] kept {extractor.kept_chars}/{extractor.total_chars} chars, {chunk_count} chunks per style")
+    summaries = {style: task.result() for style, task in workers.items()}
+    return "\n".join(page_texts).strip(), summaries
 
 # QA
-async def answer_agent(summary: str, question: str):
+def _qa_prompt_chunks(summary: str, question: str, passages: Optional[List[str]] = None) -> List[str]:
+    # 검색된 문단이 있으면 크기가 제한된 프롬프트 하나로 한 번만 생성
+    if passages:
+        context = "\n\n".join(passages)
+        return [f"""Read the passages and answer the question.
+
+Question: {question}
+
+Passages:
+{context}
+
+Answer strictly based on the passages above. If the answer is not in the passages, say so.
+Answer:"""]
+
     prompt_template = f"""
 Context:
 {summary}
@@ -99,11 +351,28 @@ Question:
 
 Answer strictly based on the context above. Do not hallucinate or repeat unrelated information.
 Answer:"""
-    chunks = chunk_text(prompt_template, 1000)
-    answers = []
-    for c in chunks:
-        ans = await run_qa(c)
-        ans_clean = deduplicate_sentences(re.sub(r'\s+', ' ', ans).strip())
-        answers.append(ans_clean)
+    return chunk_text(prompt_template, 1000)
+
+def _merge_answers(answers: List[str]) -> str:
     # 청킹 단위 답변 중복 제거 후 합치기
-    return " ".join(list(dict.fromkeys(answers)))
\ No newline at end of file
+    cleaned = [deduplicate_sentences(re.sub(r'\s+', ' ', ans).strip()) for ans in answers]
+    return " ".join(list(dict.fromkeys(cleaned)))
+
+async def answer_agent(summary: str, question: str, preset: GenerationPreset = get_preset(),
+                       passages: Optional[List[str]] = None):
+    answers = [await run_qa(c, preset) for c in _qa_prompt_chunks(summary, question, passages)]
+    return _merge_answers(answers)
+
+# 스트리밍 QA: 생성되는 토큰을 바로 내보내고 마지막에 정리된 전체 답변을 반환용으로 만듦
+async def stream_answer_agent(summary: str, question: str, preset: GenerationPreset = get_preset(),
+                              passages: Optional[List[str]] = None) -> AsyncIterator[Tuple[str, str]]:
+    answers = []
+    for i, c in enumerate(_qa_prompt_chunks(summary, question, passages)):
+        if i > 0:
+            yield "token", " "
+        parts = []
+        async for text in stream_qa(c, preset):
+            parts.append(text)
+            yield "token", text
+        answers.append("".join(parts))
+    yield "answer", _merge_answers(answers)
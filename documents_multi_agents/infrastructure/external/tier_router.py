@@ -0,0 +1,43 @@
+import os
+from dataclasses import dataclass
+from typing import List, Optional
+
+# 품질 낮은 순 -> 높은 순
+TIERS = ["extractive", "single", "hierarchical"]
+
+# 이 페이지 수 이하는 distilbart 단일 패스로 요약
+SHORT_DOC_PAGES = int(os.getenv("TIER_SHORT_DOC_PAGES", "3"))
+# 지연시간 추정치 (배포 환경에서 측정값으로 조정)
+SINGLE_PASS_SECONDS = float(os.getenv("TIER_SINGLE_PASS_SECONDS", "8"))
+HIERARCHICAL_SECONDS_PER_PAGE = float(os.getenv("TIER_HIERARCHICAL_SECONDS_PER_PAGE", "6"))
+
+
+@dataclass(frozen=True)
+class TierDecision:
+    tier: str
+    reason: str
+    estimated_seconds: float
+
+
+def choose_tier(page_count: int, latency_budget_s: Optional[float] = None) -> TierDecision:
+    """문서 길이와 요청 지연시간 예산으로 요약 모델 티어 선택"""
+    if page_count <= SHORT_DOC_PAGES:
+        tier, estimate = "single", SINGLE_PASS_SECONDS
+        reason = f"{page_count} pages <= {SHORT_DOC_PAGES}"
+    else:
+        tier, estimate = "hierarchical", page_count * HIERARCHICAL_SECONDS_PER_PAGE
+        reason = f"{page_count} pages > {SHORT_DOC_PAGES}"
+
+    # 예산 안에 못 끝낼 것 같으면 모델 호출 없이 추출 요약만
+    if latency_budget_s is not None and estimate > latency_budget_s:
+        return TierDecision(
+            tier="extractive",
+            reason=f"{tier} estimate {estimate:.0f}s > budget {latency_budget_s:.0f}s",
+            estimated_seconds=0.0
+        )
+    return TierDecision(tier=tier, reason=reason, estimated_seconds=estimate)
+
+
+def tiers_at_least(tier: str) -> List[str]:
+    """요청 티어 이상 품질의 티어 목록 (저장된 요약 재사용 판단용)"""
+    return TIERS[TIERS.index(tier):]
@@ -0,0 +1,46 @@
+"""
+documents_multi_agents.content_hash / model_fingerprint 컬럼 + content_hash 인덱스 추가
+
+    python -m documents_multi_agents.infrastructure.migration.add_reuse_columns
+
+create_all 은 기존 테이블에 컬럼을 추가하지 않으므로 기존 DB 에서 한 번 실행
+여러 번 실행해도 안전 (컬럼/인덱스가 있으면 건너뜀)
+두 컬럼이 비어 있는 행은 재사용 대상이 아니므로 다음 분석 때 다시 요약하면서 채워짐 (백필 불필요)
+"""
+from sqlalchemy import inspect
+
+from config.database.session import engine
+from documents_multi_agents.infrastructure.orm.document_agents_orm import DocumentAgentsORM
+
+COLUMNS = {
+    "content_hash": "VARCHAR(64) NULL",
+    "model_fingerprint": "VARCHAR(255) NULL",
+}
+
+
+def _ensure_columns():
+    table = DocumentAgentsORM.__tablename__
+    existing = {c["name"] for c in inspect(engine).get_columns(table)}
+    with engine.begin() as conn:
+        for name, ddl in COLUMNS.items():
+            if name not in existing:
+                conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}")
+                print(f"[migration] added {table}.{name}")
+
+
+def _ensure_index():
+    index = next(i for i in DocumentAgentsORM.__table__.indexes if "content_hash" in i.columns)
+    existing = {i["name"] for i in inspect(engine).get_indexes(DocumentAgentsORM.__tablename__)}
+    if index.name not in existing:
+        with engine.begin() as conn:
+            index.create(bind=conn)
+        print(f"[migration] created index {index.name}")
+
+
+def migrate():
+    _ensure_columns()
+    _ensure_index()
+
+
+if __name__ == "__main__":
+    migrate()
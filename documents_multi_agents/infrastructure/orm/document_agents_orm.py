@@ -6,7 +6,7 @@ class DocumentAgentsORM(Base):
     __tablename__ = "documents_multi_agents"
 
     id = Column(Integer, primary_key=True, index=True)
-    doc_id = Column(Integer, ForeignKey("documents.id"), nullable=False)
+    doc_id = Column(Integer, ForeignKey("documents.id"), nullable=False, unique=True)
     doc_url = Column(String(255), nullable=False, unique=True)
     parsed_text = Column(Text, nullable=True)
     bullet_summary = Column(Text, nullable=True)
@@ -14,5 +14,7 @@ class DocumentAgentsORM(Base):
     casual_summary = Column(Text, nullable=True)
     final_summary = Column(Text, nullable=True)
     answer = Column(Text, nullable=True)
+    content_hash = Column(String(64), nullable=True, index=True)
+    model_fingerprint = Column(String(255), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
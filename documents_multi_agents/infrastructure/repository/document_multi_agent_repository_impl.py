@@ -1,16 +1,21 @@
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert
+
 from documents_multi_agents.application.port.document_multi_agent_repository_port import \
     DocumentMultiAgentRepositoryPort
 from documents_multi_agents.domain.document_agents import DocumentAgents
 from documents_multi_agents.infrastructure.orm.document_agents_orm import DocumentAgentsORM
-from config.database.session import SessionLocal
+from config.database.async_session import AsyncSessionLocal
 
 class DocumentsMultiAgentsRepositoryImpl(DocumentMultiAgentRepositoryPort):
     __instance = None
 
+    # 세션은 호출마다 새로 열기 때문에 싱글톤이 공유하는 상태는 없음
     def __new__(cls, *args, **kwargs):
         if cls.__instance is None:
             cls.__instance = super().__new__(cls)
-            cls.__instance.db = SessionLocal()
 
         return cls.__instance
 
@@ -20,8 +25,12 @@ class DocumentsMultiAgentsRepositoryImpl(DocumentMultiAgentRepositoryPort):
             cls.__instance = cls()
         return cls.__instance
 
-    def find_by_doc_id(self, doc_id: int) -> DocumentAgents | None:
-        orm = self.db.query(DocumentAgentsORM).filter(DocumentAgentsORM.doc_id == doc_id).first()
+    async def find_by_doc_id(self, doc_id: int) -> DocumentAgents | None:
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(DocumentAgentsORM).where(DocumentAgentsORM.doc_id == doc_id)
+            )
+            orm = result.scalars().first()
         if not orm:
             return None
         agents = DocumentAgents(
@@ -32,32 +41,32 @@ class DocumentsMultiAgentsRepositoryImpl(DocumentMultiAgentRepositoryPort):
             abstract_summary=orm.abstract_summary,
             casual_summary=orm.casual_summary,
             final_summary=orm.final_summary,
-            answer=orm.answer
+            answer=orm.answer,
+            content_hash=orm.content_hash,
+            model_fingerprint=orm.model_fingerprint
         )
         return agents
 
-    def save(self, agents: DocumentAgents) -> DocumentAgents:
-        orm = self.db.query(DocumentAgentsORM).filter(DocumentAgentsORM.doc_id == agents.doc_id).first()
-        if orm:
-            orm.doc_url = agents.doc_url
-            orm.parsed_text = agents.parsed_text
-            orm.bullet_summary = agents.bullet_summary
-            orm.abstract_summary = agents.abstract_summary
-            orm.casual_summary = agents.casual_summary
-            orm.final_summary = agents.final_summary
-            orm.answer = agents.answer
-        else:
-            orm = DocumentAgentsORM(
-                doc_id=agents.doc_id,
-                doc_url=agents.doc_url,
-                parsed_text=agents.parsed_text,
-                bullet_summary=agents.bullet_summary,
-                abstract_summary=agents.abstract_summary,
-                casual_summary=agents.casual_summary,
-                final_summary=agents.final_summary,
-                answer=agents.answer
-            )
-            self.db.add(orm)
-        self.db.commit()
-        self.db.refresh(orm)
+    async def save(self, agents: DocumentAgents) -> DocumentAgents:
+        values = dict(
+            doc_id=agents.doc_id,
+            doc_url=agents.doc_url,
+            parsed_text=agents.parsed_text,
+            bullet_summary=agents.bullet_summary,
+            abstract_summary=agents.abstract_summary,
+            casual_summary=agents.casual_summary,
+            final_summary=agents.final_summary,
+            answer=agents.answer,
+            content_hash=agents.content_hash,
+            model_fingerprint=agents.model_fingerprint
+        )
+        # doc_id unique 키 기준 upsert (조회 후 수정 왕복 없이 한 번에)
+        stmt = insert(DocumentAgentsORM).values(**values)
+        stmt = stmt.on_duplicate_key_update(
+            **{key: stmt.inserted[key] for key in values if key != "doc_id"},
+            updated_at=datetime.utcnow()
+        )
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                await session.execute(stmt)
         return agents
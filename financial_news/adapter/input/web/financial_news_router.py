@@ -2,19 +2,30 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from typing import List, Optional
 from datetime import datetime
 
+from config.openai.config import get_openai_config
 from financial_news.adapter.input.web.request.news_request import SentimentAnalysisRequest, \
     BatchSentimentAnalysisRequest, AnalysisReportRequest, SubscriptionRequest
 from financial_news.adapter.input.web.response.news_response import NewsResponse, SentimentResponse, \
-    SentimentSummaryResponse, AnalysisReportResponse, TrendingTopicResponse, SubscriptionResponse
+    BatchSentimentResponse, SentimentSummaryResponse, AnalysisReportResponse, TrendingTopicResponse, SubscriptionResponse
+from financial_news.adapter.output.ai_service.cached_sentiment_adapter import CachedSentimentAdapter, \
+    sentiment_cache
+from financial_news.adapter.output.ai_service.cascade_sentiment_adapter import CascadeSentimentAdapter, \
+    cascade_stats
+from financial_news.adapter.output.ai_service.lexicon_sentiment_adapter import LexiconSentimentAdapter, \
+    lexicon_stats
 from financial_news.adapter.output.ai_service.openai_sentiment_adapter import OpenAISentimentAdapter
-from financial_news.adapter.output.google.news_api_adapter import NewsAPIAdapter
 from financial_news.adapter.output.notification.slack_adapter import SlackNotificationAdapter
+from financial_news.adapter.output.trending.redis_trending_adapter import RedisTrendingAdapter
 from financial_news.application.usecase.analyze_sentiment_usecase import AnalyzeSentimentUseCase
 from financial_news.application.usecase.fetch_news_usecase import FetchNewsUseCase
+from financial_news.application.port.input.analysis_service_port import AnalysisServicePort
+from financial_news.application.port.output.ai_service_port import AIServicePort
+from financial_news.application.usecase.cached_report_usecase import CachedReportUseCase, report_cache
 from financial_news.application.usecase.generate_report_usecase import GenerateReportUseCase
 from financial_news.application.usecase.subscribe_alert_usecase import SubscribeAlertUseCase
 from financial_news.domain.value_objects.time_range import TimeRange
-from financial_news.infrastructure.repository.news_repository import NewsRepositoryImpl
+from financial_news.infrastructure.repository.ingestion_state_repository import IngestionStateRepositoryImpl
+from financial_news.infrastructure.repository.async_news_repository import AsyncNewsRepositoryImpl
 from utility.session_helper import get_current_user
 
 # 라우터 생성
@@ -23,21 +34,45 @@ financial_news_router = APIRouter(
 )
 
 
+# AI 어댑터(OpenAI 클라이언트 포함)는 요청마다 만들지 않고 프로세스에서 한 번만 생성
+_openai_service: Optional[OpenAISentimentAdapter] = None
+_sentiment_service: Optional[AIServicePort] = None
+
+
+def _get_openai_service() -> OpenAISentimentAdapter:
+    global _openai_service
+    if _openai_service is None:
+        _openai_service = OpenAISentimentAdapter()
+    return _openai_service
+
+
+def _get_sentiment_service() -> AIServicePort:
+    global _sentiment_service
+    if _sentiment_service is None:
+        cascade = CascadeSentimentAdapter([
+            ("cheap", _get_openai_service()),
+            ("strong", OpenAISentimentAdapter(model=get_openai_config().strong_model)),
+        ])
+        # 사전 1차 판정 -> 캐시 -> 모델 캐스케이드 순
+        _sentiment_service = LexiconSentimentAdapter(CachedSentimentAdapter(cascade, cascade.model_version))
+    return _sentiment_service
+
+
 def get_fetch_news_usecase() -> FetchNewsUseCase:
-    news_repository = NewsRepositoryImpl()
-    return FetchNewsUseCase(news_repository)
+    news_repository = AsyncNewsRepositoryImpl.getInstance()
+    return FetchNewsUseCase(news_repository, IngestionStateRepositoryImpl())
 
 
 def get_analyze_sentiment_usecase() -> AnalyzeSentimentUseCase:
-    news_repository = NewsRepositoryImpl()
-    ai_service = OpenAISentimentAdapter()
-    return AnalyzeSentimentUseCase(news_repository, ai_service)
+    news_repository = AsyncNewsRepositoryImpl.getInstance()
+    return AnalyzeSentimentUseCase(news_repository, _get_sentiment_service(), RedisTrendingAdapter())
 
 
-def get_generate_report_usecase() -> GenerateReportUseCase:
-    news_repository = NewsRepositoryImpl()
-    ai_service = OpenAISentimentAdapter()
-    return GenerateReportUseCase(news_repository, ai_service)
+def get_generate_report_usecase() -> AnalysisServicePort:
+    news_repository = AsyncNewsRepositoryImpl.getInstance()
+    ai_service = _get_openai_service()
+    # 반복 리포트 요청은 캐시에서 (만료 후에는 기존 리포트 응답 + 백그라운드 갱신)
+    return CachedReportUseCase(GenerateReportUseCase(news_repository, ai_service, RedisTrendingAdapter()))
 
 
 def get_subscribe_alert_usecase() -> SubscribeAlertUseCase:
@@ -126,7 +161,7 @@ async def analyze_news_sentiment(
 
 @financial_news_router.post(
     "/sentiment/batch",
-    response_model=List[SentimentResponse],
+    response_model=BatchSentimentResponse,
     summary="일괄 감성 분석"
 )
 async def analyze_batch_sentiment(
@@ -135,13 +170,37 @@ async def analyze_batch_sentiment(
         analyze_sentiment_usecase: AnalyzeSentimentUseCase = Depends(get_analyze_sentiment_usecase)
 ):
     try:
-        sentiments = await analyze_sentiment_usecase.analyze_batch(request.news_ids)
-        return [SentimentResponse.from_entity(s) for s in sentiments]
+        result = await analyze_sentiment_usecase.analyze_batch(request.news_ids)
+        return BatchSentimentResponse.from_result(result)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@financial_news_router.get(
+    "/sentiment/cache/stats",
+    summary="감성 캐시 적중률"
+)
+async def get_sentiment_cache_stats(account_id: str = Depends(get_current_user)):
+    return sentiment_cache.stats()
+
+
+@financial_news_router.get(
+    "/sentiment/lexicon/stats",
+    summary="사전 1차 판정 처리 비율"
+)
+async def get_sentiment_lexicon_stats(account_id: str = Depends(get_current_user)):
+    return lexicon_stats.stats()
+
+
+@financial_news_router.get(
+    "/sentiment/cascade/stats",
+    summary="감성 모델 캐스케이드 티어별 통계"
+)
+async def get_sentiment_cascade_stats(account_id: str = Depends(get_current_user)):
+    return cascade_stats.stats()
+
+
 @financial_news_router.get(
     "/sentiment/summary",
     response_model=SentimentSummaryResponse,
@@ -170,7 +229,7 @@ async def get_sentiment_summary(
 async def generate_analysis_report(
         request: AnalysisReportRequest,
         account_id: str = Depends(get_current_user),
-        generate_report_usecase: GenerateReportUseCase = Depends(get_generate_report_usecase)
+        generate_report_usecase: AnalysisServicePort = Depends(get_generate_report_usecase)
 ):
     try:
         report = await generate_report_usecase.generate_report(
@@ -186,6 +245,14 @@ async def generate_analysis_report(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@financial_news_router.get(
+    "/analysis/report/cache/stats",
+    summary="리포트 캐시 적중률"
+)
+async def get_report_cache_stats(account_id: str = Depends(get_current_user)):
+    return report_cache.stats()
+
+
 @financial_news_router.get(
     "/analysis/trending",
     response_model=List[TrendingTopicResponse],
@@ -194,7 +261,7 @@ async def generate_analysis_report(
 async def get_trending_topics(
         limit: int = Query(10, ge=1, le=50, description="조회할 토픽 개수"),
         account_id: str = Depends(get_current_user),
-        generate_report_usecase: GenerateReportUseCase = Depends(get_generate_report_usecase)
+        generate_report_usecase: AnalysisServicePort = Depends(get_generate_report_usecase)
 ):
     try:
         trending = await generate_report_usecase.get_trending_topics(limit)
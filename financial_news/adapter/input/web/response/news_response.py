@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import List, Optional, Union
 from pydantic import BaseModel, Field
 
+from financial_news.domain.entity.analysis_report import AnalysisReport
 from financial_news.domain.entity.news import News
 from financial_news.domain.entity.sentiment import Sentiment
 from financial_news.domain.entity.subscription import Subscription
@@ -71,7 +72,7 @@ class SentimentResponse(BaseModel):
         return cls(
             id=str(sentiment.id),
             news_id=str(sentiment.news_id),
-            score=sentiment.score,
+            score=sentiment.score.value,
             confidence=sentiment.confidence,
             keywords=sentiment.keywords,
             reasoning=sentiment.reasoning,
@@ -92,6 +93,28 @@ class SentimentResponse(BaseModel):
         }
 
 
+class SentimentBatchErrorResponse(BaseModel):
+    """일괄 감성 분석 실패 항목 DTO"""
+
+    news_id: str = Field(..., description="뉴스 ID")
+    error: str = Field(..., description="실패 사유")
+
+
+class BatchSentimentResponse(BaseModel):
+    """일괄 감성 분석 응답 DTO"""
+
+    sentiments: List[SentimentResponse] = Field(default_factory=list, description="분석 성공 결과")
+    errors: List[SentimentBatchErrorResponse] = Field(default_factory=list, description="항목별 실패")
+
+    @classmethod
+    def from_result(cls, result) -> "BatchSentimentResponse":
+        """BatchSentimentResult 를 DTO로 변환"""
+        return cls(
+            sentiments=[SentimentResponse.from_entity(s) for s in result.sentiments],
+            errors=[SentimentBatchErrorResponse(news_id=e.news_id, error=e.error) for e in result.errors]
+        )
+
+
 class SentimentSummaryResponse(BaseModel):
     """감성 요약 응답 DTO"""
 
@@ -132,15 +155,17 @@ class AnalysisReportResponse(BaseModel):
     generated_at: datetime = Field(..., description="생성 시각")
 
     @classmethod
-    def from_entity(cls, report: dict) -> "AnalysisReportResponse":
-        """리포트 데이터를 DTO로 변환"""
+    def from_entity(cls, report: AnalysisReport) -> "AnalysisReportResponse":
+        """리포트 엔티티를 DTO로 변환"""
         return cls(
-            id=report.get("id", ""),
-            symbols=report.get("symbols", []),
-            summary=report.get("summary", ""),
-            sentiment_breakdown=report.get("sentiment_breakdown", {}),
-            key_insights=report.get("key_insights", []),
-            generated_at=report.get("generated_at", datetime.utcnow())
+            id=report.id,
+            symbols=[str(s) for s in report.symbols],
+            summary=report.summary,
+            sentiment_breakdown={
+                str(t.symbol): {"score": t.avg_sentiment, "count": t.news_count} for t in report.trends
+            },
+            key_insights=report.insights,
+            generated_at=report.created_at
         )
 
     class Config:
@@ -0,0 +1,128 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from config.redis_config import get_redis
+from financial_news.application.port.output.ai_service_port import AIServicePort, SentimentAnalysisResult, \
+    SentimentArticle
+
+# 프로세스 내 LRU 크기 / Redis 보관 기간
+SENTIMENT_CACHE_SIZE = int(os.getenv("SENTIMENT_CACHE_SIZE", "10000"))
+SENTIMENT_CACHE_TTL_SECONDS = int(os.getenv("SENTIMENT_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+
+def content_key(title: str, content: str, model_version: str) -> str:
+    """정규화한 제목+본문과 모델 버전으로 캐시 키 생성 (재배포된 같은 기사는 같은 키)"""
+    normalized = re.sub(r"\s+", " ", f"{title}\n{content}").strip().lower()
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return f"sentiment:{model_version}:{digest}"
+
+
+class SentimentCache:
+    """2단계 감성 결과 캐시 (프로세스 내 LRU -> Redis)"""
+
+    def __init__(self, max_size: int = SENTIMENT_CACHE_SIZE, ttl_seconds: int = SENTIMENT_CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._local: "OrderedDict[str, SentimentAnalysisResult]" = OrderedDict()
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    def _remember(self, key: str, result: SentimentAnalysisResult):
+        self._local[key] = result
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[SentimentAnalysisResult]:
+        result = self._local.get(key)
+        if result is not None:
+            self._local.move_to_end(key)
+            self.local_hits += 1
+            return result
+
+        try:
+            raw = await asyncio.to_thread(get_redis().get, key)
+        except Exception as e:
+            # Redis 장애 시 캐시 미스로 처리하고 LLM 호출로 진행
+            print(f"Sentiment cache redis error: {e}")
+            raw = None
+        if raw:
+            result = SentimentAnalysisResult(**json.loads(raw))
+            self._remember(key, result)
+            self.redis_hits += 1
+            return result
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, result: SentimentAnalysisResult):
+        # 실패 응답(신뢰도 0)은 캐시하지 않음
+        if result.confidence <= 0.0:
+            return
+        self._remember(key, result)
+        try:
+            await asyncio.to_thread(
+                get_redis().set, key, json.dumps(result.__dict__, ensure_ascii=False), ex=self.ttl_seconds
+            )
+        except Exception as e:
+            print(f"Sentiment cache redis error: {e}")
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "lookups": lookups,
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.local_hits + self.redis_hits) / lookups, 3) if lookups else 0.0,
+            "local_size": len(self._local),
+        }
+
+
+# 요청마다 어댑터가 새로 만들어지므로 캐시는 프로세스 단위로 공유
+sentiment_cache = SentimentCache()
+
+
+class CachedSentimentAdapter(AIServicePort):
+    """감성 분석 결과 캐시 데코레이터 (히트 시 LLM 호출 생략)"""
+
+    def __init__(self, inner: AIServicePort, model_version: str, cache: SentimentCache = sentiment_cache):
+        self.inner = inner
+        self.model_version = model_version
+        self.cache = cache
+
+    async def analyze_sentiment(self, title: str, content: str) -> SentimentAnalysisResult:
+        key = content_key(title, content, self.model_version)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = await self.inner.analyze_sentiment(title, content)
+        await self.cache.set(key, result)
+        return result
+
+    async def analyze_sentiment_many(self, articles: List[SentimentArticle]) -> List[SentimentAnalysisResult]:
+        keys = [content_key(a.title, a.content, self.model_version) for a in articles]
+        results: List[Optional[SentimentAnalysisResult]] = [await self.cache.get(k) for k in keys]
+
+        # 캐시에 없는 기사만 묶어서 분석
+        missing = [i for i, r in enumerate(results) if r is None]
+        if missing:
+            fresh = await self.inner.analyze_sentiment_many([articles[i] for i in missing])
+            for i, result in zip(missing, fresh):
+                results[i] = result
+                await self.cache.set(keys[i], result)
+
+        return results
+
+    async def extract_keywords(self, text: str, limit: int = 10) -> List[str]:
+        return await self.inner.extract_keywords(text, limit)
+
+    async def summarize(self, text: str, max_length: int = 200) -> str:
+        return await self.inner.summarize(text, max_length)
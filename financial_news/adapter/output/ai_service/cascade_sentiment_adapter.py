@@ -0,0 +1,132 @@
+import bisect
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from financial_news.application.port.output.ai_service_port import AIServicePort, SentimentAnalysisResult, \
+    SentimentArticle
+from financial_news.domain.value_objects.sentiment_score import SentimentScore
+
+# 신뢰도가 이보다 낮거나 점수가 라벨 경계에 이만큼 가까우면 다음 티어로 재분석
+CASCADE_CONFIDENCE_THRESHOLD = float(os.getenv("SENTIMENT_CASCADE_CONFIDENCE", "0.7"))
+CASCADE_BOUNDARY_MARGIN = float(os.getenv("SENTIMENT_CASCADE_BOUNDARY_MARGIN", "0.05"))
+# 지연시간 히스토그램 구간 (ms, 마지막은 초과 구간)
+LATENCY_BUCKETS_MS = (250, 500, 1000, 2000, 5000, 10000)
+
+
+class TierStats:
+    """티어별 호출/확정/상향 건수와 요청 지연시간 히스토그램"""
+
+    def __init__(self):
+        self.requests = 0
+        self.articles = 0
+        self.accepted = 0
+        self.escalated = 0
+        self.latency_sum_ms = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def observe(self, elapsed_ms: float, articles: int):
+        self.requests += 1
+        self.articles += articles
+        self.latency_sum_ms += elapsed_ms
+        self.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def stats(self) -> Dict:
+        labels = [f"le_{b}ms" for b in LATENCY_BUCKETS_MS] + ["inf"]
+        return {
+            "requests": self.requests,
+            "articles": self.articles,
+            "accepted": self.accepted,
+            "escalated": self.escalated,
+            "avg_latency_ms": round(self.latency_sum_ms / self.requests, 1) if self.requests else 0.0,
+            "latency_histogram": dict(zip(labels, self.latency_buckets)),
+        }
+
+
+class CascadeStats:
+    def __init__(self):
+        self.tiers: Dict[str, TierStats] = {}
+
+    def tier(self, name: str) -> TierStats:
+        return self.tiers.setdefault(name, TierStats())
+
+    def stats(self) -> Dict[str, Dict]:
+        return {name: tier.stats() for name, tier in self.tiers.items()}
+
+
+# 집계는 프로세스 단위로 공유
+cascade_stats = CascadeStats()
+
+
+class CascadeSentimentAdapter(AIServicePort):
+    """저렴한 모델부터 분석하고 애매한 결과만 상위 모델로 재분석하는 데코레이터"""
+
+    def __init__(
+            self,
+            tiers: List[Tuple[str, AIServicePort]],
+            confidence_threshold: float = CASCADE_CONFIDENCE_THRESHOLD,
+            boundary_margin: float = CASCADE_BOUNDARY_MARGIN,
+            stats: CascadeStats = cascade_stats
+    ):
+        if not tiers:
+            raise ValueError("At least one tier is required")
+        self.tiers = tiers
+        self.confidence_threshold = confidence_threshold
+        self.boundary_margin = boundary_margin
+        self.stats = stats
+
+    @property
+    def model_version(self) -> str:
+        """감성 캐시 키용 버전 (티어 구성이 바뀌면 달라짐)"""
+        return ">".join(getattr(service, "model_version", name) for name, service in self.tiers)
+
+    def is_uncertain(self, result: SentimentAnalysisResult) -> bool:
+        if result.confidence < self.confidence_threshold:
+            return True
+        try:
+            return SentimentScore(result.score).boundary_distance() < self.boundary_margin
+        except ValueError:
+            return True
+
+    async def _run_tier(
+            self,
+            name: str,
+            service: AIServicePort,
+            articles: List[SentimentArticle]
+    ) -> List[SentimentAnalysisResult]:
+        started = time.perf_counter()
+        results = await service.analyze_sentiment_many(articles)
+        self.stats.tier(name).observe((time.perf_counter() - started) * 1000, len(articles))
+        return results
+
+    async def analyze_sentiment(self, title: str, content: str) -> SentimentAnalysisResult:
+        return (await self.analyze_sentiment_many([SentimentArticle(id="0", title=title, content=content)]))[0]
+
+    async def analyze_sentiment_many(self, articles: List[SentimentArticle]) -> List[SentimentAnalysisResult]:
+        results: List[Optional[SentimentAnalysisResult]] = [None] * len(articles)
+        pending = list(range(len(articles)))
+
+        for level, (name, service) in enumerate(self.tiers):
+            if not pending:
+                break
+            tier_results = await self._run_tier(name, service, [articles[i] for i in pending])
+            is_last = level == len(self.tiers) - 1
+
+            still_pending = []
+            for i, result in zip(pending, tier_results):
+                # 상위 티어가 실패(confidence 0)하면 하위 티어 결과 유지
+                if results[i] is None or result.confidence > 0:
+                    results[i] = result
+                if not is_last and self.is_uncertain(result):
+                    still_pending.append(i)
+            self.stats.tier(name).accepted += len(pending) - len(still_pending)
+            self.stats.tier(name).escalated += len(still_pending)
+            pending = still_pending
+
+        return results
+
+    async def extract_keywords(self, text: str, limit: int = 10) -> List[str]:
+        return await self.tiers[0][1].extract_keywords(text, limit)
+
+    async def summarize(self, text: str, max_length: int = 200) -> str:
+        return await self.tiers[0][1].summarize(text, max_length)
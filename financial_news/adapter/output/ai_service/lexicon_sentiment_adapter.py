@@ -0,0 +1,161 @@
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from financial_news.application.port.output.ai_service_port import AIServicePort, SentimentAnalysisResult, \
+    SentimentArticle
+
+# 이 신뢰도 이상이면 LLM 없이 사전 점수로 확정
+SENTIMENT_LEXICON_THRESHOLD = float(os.getenv("SENTIMENT_LEXICON_THRESHOLD", "0.8"))
+# 이만큼의 가중치가 모이면 근거가 충분하다고 봄
+LEXICON_SATURATION = 2.0
+# 제목은 본문보다 요약도가 높아서 가중
+TITLE_WEIGHT = 2.0
+CONTENT_CHARS = 1000
+
+# 금융 감성 사전 (구문 -> 극성 가중치). 애매한 단어는 넣지 않음
+# 문맥에 따라 극성이 바뀌는 단어(default, recall, approval, investigation, beats, misses 등)는
+# 단독으로 넣지 않고 뜻이 분명한 구문으로만 등록
+FINANCIAL_LEXICON: Dict[str, float] = {
+    # 긍정
+    "beats estimates": 1.0, "beats expectations": 1.0, "beat estimates": 1.0, "beat expectations": 1.0,
+    "tops estimates": 1.0, "raises guidance": 1.0, "raised guidance": 1.0, "record revenue": 1.0,
+    "record profit": 1.0, "record high": 0.8, "all-time high": 0.8, "upgrade": 0.7, "upgraded": 0.7,
+    "outperform": 0.6, "surge": 0.7, "surges": 0.7, "soars": 0.8, "soared": 0.8, "rally": 0.6,
+    "rallies": 0.6, "jumps": 0.6, "jumped": 0.6, "buyback": 0.5, "dividend increase": 0.8,
+    "raises dividend": 0.8, "strong demand": 0.7, "profit rises": 0.8, "revenue growth": 0.6,
+    "fda approval": 0.7, "wins approval": 0.6,
+    # 부정
+    "bankruptcy": -1.0, "files for bankruptcy": -1.0, "chapter 11": -1.0, "debt default": -0.9,
+    "defaults on": -0.9, "misses estimates": -1.0, "missed estimates": -1.0, "misses expectations": -1.0,
+    "cuts guidance": -1.0, "lowers guidance": -1.0, "lowered guidance": -1.0, "profit warning": -1.0,
+    "downgrade": -0.7, "downgraded": -0.7, "underperform": -0.6, "plunge": -0.8, "plunges": -0.8,
+    "plunged": -0.8, "tumbles": -0.7, "tumbled": -0.7, "slumps": -0.7, "layoffs": -0.6,
+    "job cuts": -0.6, "fraud": -0.9, "sec investigation": -0.6, "lawsuit": -0.5, "product recall": -0.5,
+    "delisted": -0.9, "delisting": -0.9, "dividend cut": -0.8, "suspends dividend": -0.9,
+    "net loss": -0.6, "losses widen": -0.8, "sell-off": -0.6, "selloff": -0.6,
+}
+NEGATIONS = {"not", "no", "never", "without", "fails", "failed"}
+
+# 첫 단어 -> 가능한 구문 길이 (긴 것부터), 사전에 없는 단어는 바로 건너뜀
+_PHRASE_LENGTHS: Dict[str, List[int]] = {}
+for _phrase in FINANCIAL_LEXICON:
+    _PHRASE_LENGTHS.setdefault(_phrase.split()[0], []).append(len(_phrase.split()))
+for _lengths in _PHRASE_LENGTHS.values():
+    _lengths.sort(reverse=True)
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:[-'][a-z0-9]+)*")
+
+
+def score_text(text: str, weight: float = 1.0) -> Tuple[float, float, List[str]]:
+    """사전 구문 매칭 (긴 구문 우선). (긍정 합, 부정 합, 매칭 구문) 반환"""
+    tokens = _TOKEN.findall(text.lower())
+    positive, negative, matched = 0.0, 0.0, []
+    i = 0
+    while i < len(tokens):
+        for n in _PHRASE_LENGTHS.get(tokens[i], ()):
+            phrase = " ".join(tokens[i:i + n])
+            polarity = FINANCIAL_LEXICON.get(phrase)
+            if polarity is None:
+                continue
+            # 바로 앞 두 단어 안의 부정어는 극성을 뒤집음
+            if NEGATIONS.intersection(tokens[max(0, i - 2):i]):
+                polarity = -polarity
+            if polarity > 0:
+                positive += polarity * weight
+            else:
+                negative -= polarity * weight
+            matched.append(phrase)
+            i += n
+            break
+        else:
+            i += 1
+    return positive, negative, matched
+
+
+def lexicon_sentiment(title: str, content: str) -> SentimentAnalysisResult:
+    """사전 기반 감성 점수. 신뢰도 = 극성 일치도 x 근거량"""
+    t_pos, t_neg, t_matched = score_text(title, TITLE_WEIGHT)
+    c_pos, c_neg, c_matched = score_text(content[:CONTENT_CHARS])
+    positive, negative = t_pos + c_pos, t_neg + c_neg
+    total = positive + negative
+    matched = list(dict.fromkeys(t_matched + c_matched))
+
+    if total == 0:
+        return SentimentAnalysisResult(score=0.0, confidence=0.0, keywords=[], reasoning="No lexicon terms matched")
+
+    score = (positive - negative) / total
+    confidence = abs(score) * min(1.0, total / LEXICON_SATURATION)
+    return SentimentAnalysisResult(
+        score=round(score, 3),
+        confidence=round(confidence, 3),
+        keywords=matched[:10],
+        reasoning=f"Lexicon pre-scorer matched: {', '.join(matched[:5])}"
+    )
+
+
+class LexiconStats:
+    """사전 단계가 처리한 비율 집계"""
+
+    def __init__(self):
+        self.absorbed = 0
+        self.escalated = 0
+
+    def stats(self) -> Dict[str, float]:
+        total = self.absorbed + self.escalated
+        return {
+            "total": total,
+            "absorbed": self.absorbed,
+            "escalated": self.escalated,
+            "absorbed_ratio": round(self.absorbed / total, 3) if total else 0.0,
+            "threshold": SENTIMENT_LEXICON_THRESHOLD,
+        }
+
+
+# 요청마다 어댑터가 새로 만들어지므로 집계는 프로세스 단위로 공유
+lexicon_stats = LexiconStats()
+
+
+class LexiconSentimentAdapter(AIServicePort):
+    """사전 기반 1차 감성 판정 데코레이터 (명확한 기사만 확정, 나머지는 inner 로)"""
+
+    def __init__(
+            self,
+            inner: AIServicePort,
+            threshold: float = SENTIMENT_LEXICON_THRESHOLD,
+            stats: LexiconStats = lexicon_stats
+    ):
+        self.inner = inner
+        self.threshold = threshold
+        self.stats = stats
+
+    def _pre_score(self, title: str, content: str) -> Optional[SentimentAnalysisResult]:
+        result = lexicon_sentiment(title, content)
+        if result.confidence >= self.threshold:
+            self.stats.absorbed += 1
+            return result
+        self.stats.escalated += 1
+        return None
+
+    async def analyze_sentiment(self, title: str, content: str) -> SentimentAnalysisResult:
+        result = self._pre_score(title, content)
+        if result is not None:
+            return result
+        return await self.inner.analyze_sentiment(title, content)
+
+    async def analyze_sentiment_many(self, articles: List[SentimentArticle]) -> List[SentimentAnalysisResult]:
+        results: List[Optional[SentimentAnalysisResult]] = [self._pre_score(a.title, a.content) for a in articles]
+
+        ambiguous = [i for i, r in enumerate(results) if r is None]
+        if ambiguous:
+            escalated = await self.inner.analyze_sentiment_many([articles[i] for i in ambiguous])
+            for i, result in zip(ambiguous, escalated):
+                results[i] = result
+
+        return results
+
+    async def extract_keywords(self, text: str, limit: int = 10) -> List[str]:
+        return await self.inner.extract_keywords(text, limit)
+
+    async def summarize(self, text: str, max_length: int = 200) -> str:
+        return await self.inner.summarize(text, max_length)
@@ -1,17 +1,38 @@
+import asyncio
 import json
-from typing import List
+import re
+from typing import List, Optional
 from openai import AsyncOpenAI
 from config.openai.config import get_openai_config
-from financial_news.application.port.output.ai_service_port import AIServicePort, SentimentAnalysisResult
+from financial_news.application.port.output.ai_service_port import AIServicePort, SentimentAnalysisResult, \
+    SentimentArticle
+
+# 프롬프트/파싱 규칙이 바뀌면 올려서 이전 감성 캐시를 무효화
+SENTIMENT_PROMPT_VERSION = "2"
+# 여러 기사를 묶을 때 기사당 본문 길이 (단건 분석과 같은 기준)
+PACKED_CONTENT_CHARS = 1000
+# JSON 모드를 지원하지 않는 모델이 ```json ... ``` 로 감싸서 답하는 경우
+_CODE_FENCE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+
+def _load_json(content: str):
+    """응답 본문 JSON 파싱 (코드 펜스는 벗겨냄)"""
+    match = _CODE_FENCE.match(content or "")
+    return json.loads(match.group(1) if match else content)
 
 
 class OpenAISentimentAdapter(AIServicePort):
     """OpenAI 감성 분석 어댑터"""
 
-    def __init__(self):
+    def __init__(self, model: Optional[str] = None):
         openai_config = get_openai_config()
         self.client = AsyncOpenAI(api_key=openai_config.api_key)
-        self.model = openai_config.model
+        self.model = model or openai_config.model
+
+    @property
+    def model_version(self) -> str:
+        """감성 캐시 키에 쓰는 모델+프롬프트 버전"""
+        return f"{self.model}:{SENTIMENT_PROMPT_VERSION}"
 
     async def analyze_sentiment(self, title: str, content: str) -> SentimentAnalysisResult:
         """텍스트 감성 분석"""
@@ -43,11 +64,12 @@ Rules:
                     {"role": "system", "content": "You are a financial sentiment analysis expert."},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.3
+                temperature=0.3,
+                response_format={"type": "json_object"}
             )
 
-            content_str = response.choices[0].message['content']
-            result = json.loads(content_str)
+            content_str = response.choices[0].message.content
+            result = _load_json(content_str)
 
             return SentimentAnalysisResult(
                 score=float(result['score']),
@@ -64,6 +86,99 @@ Rules:
                 reasoning="Failed to analyze sentiment"
             )
 
+    async def analyze_sentiment_many(self, articles: List[SentimentArticle]) -> List[SentimentAnalysisResult]:
+        """여러 기사를 한 요청으로 감성 분석 (누락/형식 오류 항목만 단건 재시도)"""
+        if not articles:
+            return []
+        if len(articles) == 1:
+            return [await self.analyze_sentiment(articles[0].title, articles[0].content)]
+
+        packed = json.dumps(
+            [{"id": a.id, "title": a.title, "content": a.content[:PACKED_CONTENT_CHARS]} for a in articles],
+            ensure_ascii=False
+        )
+        prompt = f"""
+Analyze the sentiment of each financial news article in the following JSON array.
+
+Articles:
+{packed}
+
+Return only a JSON object whose "results" array has exactly one object per article, in this format:
+{{
+    "results": [
+        {{
+            "id": "<article id, copied exactly>",
+            "score": <float between -1.0 and 1.0>,
+            "confidence": <float between 0.0 and 1.0>,
+            "keywords": [<list of important financial keywords>],
+            "reasoning": "<brief explanation of your analysis>"
+        }}
+    ]
+}}
+
+Rules:
+- score: -1.0 (very negative) to 1.0 (very positive)
+- confidence: how confident you are in this analysis
+- keywords: extract 5-10 important financial terms
+- reasoning: explain why you gave this score
+- analyze each article independently
+"""
+
+        parsed = {}
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": "You are a financial sentiment analysis expert."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                # JSON 모드는 최상위가 객체여야 하므로 {"results": [...]} 로 받음
+                response_format={"type": "json_object"}
+            )
+
+            items = _load_json(response.choices[0].message.content)
+            if isinstance(items, dict):
+                items = items.get("results", [])
+            for item in items if isinstance(items, list) else []:
+                result = self._parse_result(item)
+                if result is not None:
+                    parsed[str(item["id"])] = result
+        except Exception as e:
+            print(f"OpenAI API error (packed {len(articles)} articles): {e}")
+
+        # 응답에서 빠졌거나 형식이 잘못된 기사만 단건 호출로 보완
+        missing = [a for a in articles if a.id not in parsed]
+        if missing:
+            print(f"Packed sentiment fallback: {len(missing)}/{len(articles)} articles")
+            fallbacks = await asyncio.gather(*(self.analyze_sentiment(a.title, a.content) for a in missing))
+            parsed.update({a.id: r for a, r in zip(missing, fallbacks)})
+
+        return [parsed[a.id] for a in articles]
+
+    @staticmethod
+    def _parse_result(item) -> Optional[SentimentAnalysisResult]:
+        """묶음 응답 항목 검증 (범위/타입이 맞지 않으면 None)"""
+        try:
+            if not isinstance(item, dict) or "id" not in item:
+                return None
+            score = float(item["score"])
+            confidence = float(item["confidence"])
+            keywords = item["keywords"]
+            reasoning = item["reasoning"]
+            if not (-1.0 <= score <= 1.0 and 0.0 <= confidence <= 1.0):
+                return None
+            if not isinstance(keywords, list) or not isinstance(reasoning, str):
+                return None
+            return SentimentAnalysisResult(
+                score=score,
+                confidence=confidence,
+                keywords=[str(k) for k in keywords],
+                reasoning=reasoning
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
     async def extract_keywords(self, text: str, limit: int = 10) -> List[str]:
         """키워드 추출"""
         prompt = f"""
@@ -81,7 +196,7 @@ Return only a JSON object with a keywords array:
                 temperature=0.3
             )
 
-            content_str = response.choices[0].message['content']
+            content_str = response.choices[0].message.content
             result = json.loads(content_str)
             return result.get('keywords', [])
         except Exception as e:
@@ -105,7 +220,7 @@ Provide a concise summary focusing on key financial information.
                 max_tokens=150
             )
 
-            content_str = response.choices[0].message['content']
+            content_str = response.choices[0].message.content
             return content_str.strip()
         except Exception as e:
             print(f"OpenAI API error: {e}")
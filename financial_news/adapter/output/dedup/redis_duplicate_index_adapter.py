@@ -0,0 +1,61 @@
+import asyncio
+import os
+from typing import Dict, List, Tuple
+
+from config.redis_config import get_redis
+from financial_news.application.port.output.duplicate_index_port import DuplicateIndexPort
+from financial_news.domain.service.news_fingerprint import NewsFingerprint
+
+# 이 기간 안에 들어온 기사끼리만 중복 판정 (신디케이션은 보통 하루 이틀 안에 퍼짐)
+DEDUP_WINDOW_HOURS = float(os.getenv("DEDUP_WINDOW_HOURS", "72"))
+
+KEY_PREFIX = "dedup"
+
+
+class RedisDuplicateIndexAdapter(DuplicateIndexPort):
+    """
+    Redis 기반 MinHash-LSH 색인.
+    dedup:band:{밴드}:{해시} -> news_id 집합, dedup:sig:{news_id} -> 서명 (모두 기간 TTL)
+    """
+
+    def __init__(self):
+        self.redis = get_redis()
+
+    # redis 클라이언트가 동기라 파이프라인 왕복은 이벤트 루프 밖에서
+    async def find_candidates(self, signatures: List[List[int]]) -> List[Dict[str, List[int]]]:
+        if not signatures:
+            return []
+        return await asyncio.to_thread(self._find_candidates, signatures)
+
+    async def register(self, entries: List[Tuple[str, List[int]]]) -> None:
+        if entries:
+            await asyncio.to_thread(self._register, entries)
+
+    def _find_candidates(self, signatures: List[List[int]]) -> List[Dict[str, List[int]]]:
+
+        # 모든 서명의 밴드 조회를 한 번의 왕복으로
+        band_keys = [NewsFingerprint.band_keys(signature) for signature in signatures]
+        pipe = self.redis.pipeline(transaction=False)
+        for keys in band_keys:
+            for band_key in keys:
+                pipe.smembers(f"{KEY_PREFIX}:band:{band_key}")
+        replies = iter(pipe.execute())
+        candidate_ids = [set().union(*(next(replies) for _ in keys)) for keys in band_keys]
+
+        unique_ids = list(set().union(*candidate_ids))
+        if not unique_ids:
+            return [{} for _ in signatures]
+        stored = dict(zip(unique_ids, self.redis.mget([f"{KEY_PREFIX}:sig:{i}" for i in unique_ids])))
+        stored = {i: [int(v, 16) for v in s.split(",")] for i, s in stored.items() if s}
+        return [{i: stored[i] for i in ids if i in stored} for ids in candidate_ids]
+
+    def _register(self, entries: List[Tuple[str, List[int]]]) -> None:
+        ttl = int(DEDUP_WINDOW_HOURS * 3600)
+        pipe = self.redis.pipeline(transaction=False)
+        for news_id, signature in entries:
+            pipe.set(f"{KEY_PREFIX}:sig:{news_id}", ",".join(f"{v:x}" for v in signature), ex=ttl)
+            for band_key in NewsFingerprint.band_keys(signature):
+                key = f"{KEY_PREFIX}:band:{band_key}"
+                pipe.sadd(key, news_id)
+                pipe.expire(key, ttl)
+        pipe.execute()
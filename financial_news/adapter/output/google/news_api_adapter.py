@@ -1,7 +1,8 @@
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 from dateutil import parser
 from financial_news.domain.entity.news import News
+from financial_news.domain.service.news_fingerprint import NewsFingerprint
 from financial_news.domain.value_objects.news_id import NewsId
 from financial_news.domain.value_objects.stock_symbol import StockSymbol
 from financial_news.infrastructure.api.google_news_api import GoogleNewsAPIClient
@@ -12,10 +13,15 @@ class NewsAPIAdapter:
     def __init__(self):
         self.google_client = GoogleNewsAPIClient()
 
-    async def fetch_news_by_symbols(self, symbols: List[str], limit: int = 20) -> List[News]:
+    async def fetch_news_by_symbols(
+            self,
+            symbols: List[str],
+            limit: int = 20,
+            since: Optional[datetime] = None
+    ) -> List[News]:
         # query 생성
         query = "stock market " + " OR ".join(symbols)
-        articles = await self.google_client.fetch_news(query=query, limit=limit)
+        articles = await self.google_client.fetch_news(query=query, limit=limit, from_date=since)
 
         news_list = []
         for article in articles[:limit]:
@@ -55,7 +61,7 @@ class NewsAPIAdapter:
             content=article.get("snippet", ""),
             source=article.get("source", "Unknown"),
             published_at=published_at,
-            url=article.get("link", ""),
+            url=NewsFingerprint.canonicalize_url(article.get("link", "")),
             symbols=detected_symbols,
             categories=["finance", "stock"],
             keywords=[]
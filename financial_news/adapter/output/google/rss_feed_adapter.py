@@ -1,9 +1,10 @@
-from typing import List
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
 from datetime import datetime
 
 from financial_news.domain.entity.news import News
+from financial_news.domain.service.news_fingerprint import NewsFingerprint
 from financial_news.domain.value_objects.news_id import NewsId
-from financial_news.infrastructure.api.rss_feed_client import RSSFeedClient
+from financial_news.infrastructure.api.rss_feed_client import FeedValidators, RSSFeedClient
 
 
 class RSSFeedAdapter:
@@ -12,10 +13,22 @@ class RSSFeedAdapter:
     def __init__(self):
         self.rss_client = RSSFeedClient()
 
-    async def fetch_latest_news(self, limit: int = 50) -> List[News]:
-        """최신 뉴스 가져오기"""
-
-        articles = await self.rss_client.fetch_all_feeds()
+    async def fetch_latest_news(
+            self,
+            limit: int = 50,
+            find_existing_urls: Optional[Callable[[List[str]], Awaitable[Set[str]]]] = None
+    ) -> Tuple[List[News], FeedValidators]:
+        """
+        최신 뉴스 + 피드 검증자 가져오기 (이미 저장된 URL 은 엔티티로 만들지 않음)
+        검증자는 뉴스 저장이 끝난 뒤 commit_validators 로 반영
+        """
+
+        articles, validators = await self.rss_client.fetch_all_feeds()
+        for article in articles:
+            article["url"] = NewsFingerprint.canonicalize_url(article.get("url", ""))
+        if find_existing_urls and articles:
+            existing = await find_existing_urls([a["url"] for a in articles if a.get("url")])
+            articles = [a for a in articles if a.get("url") not in existing]
 
         news_list = []
         for article in articles[:limit]:
@@ -36,4 +49,8 @@ class RSSFeedAdapter:
                 print(f"Failed to convert RSS article: {e}")
                 continue
 
-        return news_list
\ No newline at end of file
+        return news_list, validators
+
+    async def commit_validators(self, validators: FeedValidators):
+        """저장까지 끝난 피드의 검증자 반영 (다음 수집부터 바뀌지 않은 피드는 304)"""
+        await self.rss_client.save_validators(validators)
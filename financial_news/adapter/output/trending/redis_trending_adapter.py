@@ -0,0 +1,198 @@
+import asyncio
+import math
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+
+from config.redis_config import get_redis
+from financial_news.application.port.output.trending_topics_port import TrendingTopicsPort
+from financial_news.domain.entity.news import News
+
+# 키워드 가중치 반감기 / 관련 심볼 유지 기간
+TRENDING_HALF_LIFE_HOURS = float(os.getenv("TRENDING_HALF_LIFE_HOURS", "6"))
+TRENDING_SYMBOL_WINDOW_HOURS = float(os.getenv("TRENDING_SYMBOL_WINDOW_HOURS", "72"))
+RELATED_SYMBOLS_LIMIT = 5
+
+DECAY_RATE = math.log(2) / (TRENDING_HALF_LIFE_HOURS * 3600)
+# 기준 시각 이후 가중치가 너무 커지기 전에 재기준화 (exp(300) 은 float 범위 안)
+REBASE_EXPONENT = 300.0
+# 재기준화 후 이보다 작은 (감쇠된 빈도) 키워드는 정리
+PRUNE_BELOW = 0.01
+
+KEY_PREFIX = "trending"
+SCORE_KEY = f"{KEY_PREFIX}:score"  # keyword -> sum(w)
+SENTIMENT_WEIGHT_KEY = f"{KEY_PREFIX}:sentiment_weight"  # keyword -> sum(w) (감성 분석된 뉴스만)
+SENTIMENT_SUM_KEY = f"{KEY_PREFIX}:sentiment_sum"  # keyword -> sum(score * w)
+EPOCH_KEY = f"{KEY_PREFIX}:epoch"
+DECAYED_KEYS = (SCORE_KEY, SENTIMENT_WEIGHT_KEY, SENTIMENT_SUM_KEY)
+
+# 기준 시각을 스크립트 안에서 읽고 가중치를 계산해 ZINCRBY (재기준화와 섞이지 않도록 원자적으로)
+# KEYS[1] = 기준 시각, KEYS[2..] = 점수 키 / ARGV = 감쇠율, 현재 시각, (키 번호, 키워드, 발행 시각, 배수) 반복
+INCREMENT_SCRIPT = """
+local epoch = tonumber(redis.call('GET', KEYS[1]))
+if not epoch then
+    epoch = tonumber(ARGV[2])
+    redis.call('SET', KEYS[1], ARGV[2])
+end
+local rate = tonumber(ARGV[1])
+for i = 3, #ARGV, 4 do
+    local weight = math.exp(rate * (tonumber(ARGV[i + 2]) - epoch)) * tonumber(ARGV[i + 3])
+    redis.call('ZINCRBY', KEYS[tonumber(ARGV[i])], weight, ARGV[i + 1])
+end
+return 1
+"""
+
+# 가중치 지수가 커지면 모든 점수에 같은 비율을 곱하고 기준 시각을 현재로 옮긴 뒤 작은 키워드 정리
+# KEYS[1] = 기준 시각, KEYS[2..] = 점수 키 (KEYS[2] 기준으로 정리) / ARGV = 감쇠율, 현재 시각, 최대 지수, 정리 기준
+REBASE_SCRIPT = """
+local epoch = tonumber(redis.call('GET', KEYS[1]))
+if not epoch then
+    return 0
+end
+local exponent = tonumber(ARGV[1]) * (tonumber(ARGV[2]) - epoch)
+if exponent < tonumber(ARGV[3]) then
+    return 0
+end
+local factor = math.exp(-exponent)
+for i = 2, #KEYS do
+    redis.call('ZUNIONSTORE', KEYS[i], 1, KEYS[i], 'WEIGHTS', factor)
+end
+redis.call('SET', KEYS[1], ARGV[2])
+
+local stale = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[4])
+for i = 1, #stale, 1000 do
+    local chunk = {unpack(stale, i, math.min(i + 999, #stale))}
+    for k = 2, #KEYS do
+        redis.call('ZREM', KEYS[k], unpack(chunk))
+    end
+end
+return 1
+"""
+
+
+def _normalize(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+def _timestamp(published_at: datetime) -> float:
+    """naive datetime 은 UTC(utcnow 저장)로 보고 epoch 초로 변환, 미래 시각은 현재로"""
+    if published_at is None:
+        return time.time()
+    if published_at.tzinfo is None:
+        published_at = published_at.replace(tzinfo=timezone.utc)
+    return min(published_at.timestamp(), time.time())
+
+
+class RedisTrendingAdapter(TrendingTopicsPort):
+    """
+    Redis sorted set 기반 시간 감쇠 트렌딩 토픽.
+    forward decay: 뉴스마다 w = exp(rate * (발행시각 - 기준시각)) 를 더해두면 순위는 그대로 유지되고,
+    조회 시 exp(rate * (현재 - 기준시각)) 로 나누면 현재 시점의 감쇠 빈도가 됨.
+    """
+
+    def __init__(self):
+        self.redis = get_redis()
+        self._increment_script = self.redis.register_script(INCREMENT_SCRIPT)
+        self._rebase_script = self.redis.register_script(REBASE_SCRIPT)
+
+    def _rebase(self):
+        """재기준화 판단/적용을 스크립트 한 번으로 (다른 워커의 증가분과 섞이지 않음)"""
+        self._rebase_script(
+            keys=[EPOCH_KEY, *DECAYED_KEYS],
+            args=[DECAY_RATE, time.time(), REBASE_EXPONENT, PRUNE_BELOW]
+        )
+
+    def _increment(self, increments: List[Tuple[str, str, float, float]]):
+        """(점수 키, 키워드, 발행 시각, 배수) -> 기준 시각은 Redis 안에서 읽어 가중치 계산"""
+        if not increments:
+            return
+        args = [DECAY_RATE, time.time()]
+        for key, keyword, published_ts, multiplier in increments:
+            args.extend([DECAYED_KEYS.index(key) + 2, keyword, published_ts, multiplier])
+        self._increment_script(keys=[EPOCH_KEY, *DECAYED_KEYS], args=args)
+
+    def _first_seen(self, kind: str, news_ids: List[str]) -> List[bool]:
+        """같은 뉴스 재수집/재분석은 한 번만 반영 (SET NX 를 한 번의 왕복으로)"""
+        ttl = int(TRENDING_SYMBOL_WINDOW_HOURS * 3600)
+        pipe = self.redis.pipeline(transaction=False)
+        for news_id in news_ids:
+            pipe.set(f"{KEY_PREFIX}:seen:{kind}:{news_id}", 1, nx=True, ex=ttl)
+        return [bool(r) for r in pipe.execute()]
+
+    def _record_news(self, news_list: List[News]):
+        self._rebase()
+        symbol_cutoff = time.time() - TRENDING_SYMBOL_WINDOW_HOURS * 3600
+        ttl = int(TRENDING_SYMBOL_WINDOW_HOURS * 3600)
+
+        fresh = self._first_seen("news", [str(n.id) for n in news_list])
+        increments = []
+        pipe = self.redis.pipeline(transaction=False)
+        for news, is_fresh in zip(news_list, fresh):
+            if not is_fresh:
+                continue
+            published_ts = _timestamp(news.published_at)
+            for keyword in dict.fromkeys(_normalize(k) for k in news.keywords if k.strip()):
+                increments.append((SCORE_KEY, keyword, published_ts, 1.0))
+                symbols_key = f"{KEY_PREFIX}:symbols:{keyword}"
+                if news.symbols:
+                    # 심볼 -> 마지막 언급 시각, 기간 밖은 정리
+                    pipe.zadd(symbols_key, {str(s): published_ts for s in news.symbols}, gt=True)
+                    pipe.zremrangebyscore(symbols_key, "-inf", symbol_cutoff)
+                    pipe.expire(symbols_key, ttl)
+        self._increment(increments)
+        pipe.execute()
+
+    def _record_sentiments(self, scored: List[Tuple[News, float]]):
+        self._rebase()
+
+        fresh = self._first_seen("sentiment", [str(n.id) for n, _ in scored])
+        increments = []
+        for (news, score), is_fresh in zip(scored, fresh):
+            if not is_fresh:
+                continue
+            published_ts = _timestamp(news.published_at)
+            for keyword in dict.fromkeys(_normalize(k) for k in news.keywords if k.strip()):
+                increments.append((SENTIMENT_WEIGHT_KEY, keyword, published_ts, 1.0))
+                increments.append((SENTIMENT_SUM_KEY, keyword, published_ts, score))
+        self._increment(increments)
+
+    def _get_trending(self, limit: int) -> List[Dict[str, Any]]:
+        # 기준 시각과 점수를 같은 트랜잭션에서 읽음
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.get(EPOCH_KEY)
+        pipe.zrevrange(SCORE_KEY, 0, limit - 1, withscores=True)
+        epoch, top = pipe.execute()
+        if not top:
+            return []
+        epoch = float(epoch)
+
+        pipe = self.redis.pipeline(transaction=False)
+        for keyword, _ in top:
+            pipe.zscore(SENTIMENT_WEIGHT_KEY, keyword)
+            pipe.zscore(SENTIMENT_SUM_KEY, keyword)
+            pipe.zrevrange(f"{KEY_PREFIX}:symbols:{keyword}", 0, RELATED_SYMBOLS_LIMIT - 1)
+        replies = pipe.execute()
+
+        # 현재 시점 기준으로 감쇠된 빈도
+        now_scale = math.exp(DECAY_RATE * (time.time() - epoch))
+        trending = []
+        for i, (keyword, score) in enumerate(top):
+            sentiment_weight, sentiment_sum, symbols = replies[3 * i:3 * i + 3]
+            trending.append({
+                "keyword": keyword,
+                "frequency": int(round(score / now_scale)),
+                "sentiment_score": round(sentiment_sum / sentiment_weight, 3) if sentiment_weight else 0.0,
+                "related_symbols": symbols or [],
+            })
+        return trending
+
+    # redis 클라이언트가 동기식이라 이벤트 루프 밖에서 실행
+    async def record_news(self, news_list: List[News]) -> None:
+        await asyncio.to_thread(self._record_news, news_list)
+
+    async def record_sentiments(self, scored: List[Tuple[News, float]]) -> None:
+        await asyncio.to_thread(self._record_sentiments, scored)
+
+    async def get_trending(self, limit: int = 10) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._get_trending, limit)
@@ -1,9 +1,24 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from typing import List, Dict, Any
 
 from financial_news.domain.entity.sentiment import Sentiment
 
 
+@dataclass
+class SentimentBatchItemError:
+    """일괄 분석 중 실패한 항목"""
+    news_id: str
+    error: str
+
+
+@dataclass
+class BatchSentimentResult:
+    """일괄 감성 분석 결과 (성공 + 항목별 실패)"""
+    sentiments: List[Sentiment] = field(default_factory=list)
+    errors: List[SentimentBatchItemError] = field(default_factory=list)
+
+
 class SentimentServicePort(ABC):
     """감성 분석 서비스 포트 (Input Port)"""
 
@@ -13,7 +28,7 @@ class SentimentServicePort(ABC):
         pass
 
     @abstractmethod
-    async def analyze_batch(self, news_ids: List[str]) -> List[Sentiment]:
+    async def analyze_batch(self, news_ids: List[str]) -> BatchSentimentResult:
         """일괄 감성 분석"""
         pass
 
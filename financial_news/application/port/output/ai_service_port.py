@@ -12,6 +12,14 @@ class SentimentAnalysisResult:
     reasoning: str
 
 
+@dataclass
+class SentimentArticle:
+    """일괄 감성 분석 입력 (id 로 결과를 매칭)"""
+    id: str
+    title: str
+    content: str
+
+
 class AIServicePort(ABC):
     """AI 서비스 포트 (Output Port)"""
 
@@ -24,6 +32,14 @@ class AIServicePort(ABC):
         """텍스트 감성 분석"""
         pass
 
+    @abstractmethod
+    async def analyze_sentiment_many(
+            self,
+            articles: List[SentimentArticle]
+    ) -> List[SentimentAnalysisResult]:
+        """여러 기사를 한 번에 감성 분석 (입력 순서대로 반환)"""
+        pass
+
     @abstractmethod
     async def extract_keywords(self, text: str, limit: int = 10) -> List[str]:
         """키워드 추출"""
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple
+
+
+class DuplicateIndexPort(ABC):
+    """최근 저장된 기사의 MinHash 서명 색인 포트 (Output Port) - 이벤트 루프를 막지 않는 코루틴"""
+
+    @abstractmethod
+    async def find_candidates(self, signatures: List[List[int]]) -> List[Dict[str, List[int]]]:
+        """서명마다 LSH 밴드가 하나라도 겹치는 기사들 (news_id -> 서명)"""
+        pass
+
+    @abstractmethod
+    async def register(self, entries: List[Tuple[str, List[int]]]) -> None:
+        """저장된 대표 기사 (news_id, 서명) 등록"""
+        pass
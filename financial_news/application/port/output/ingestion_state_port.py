@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from financial_news.domain.value_objects.stock_symbol import StockSymbol
+
+
+class IngestionStatePort(ABC):
+    """뉴스 수집 상태 포트 (Output Port) - 워터마크, 수집 대상 심볼, 소스별 호출 예산"""
+
+    @abstractmethod
+    async def get_watermark(self, source_key: str) -> Optional[datetime]:
+        """소스별 마지막 수집 시각"""
+        pass
+
+    @abstractmethod
+    async def set_watermark(self, source_key: str, fetched_at: datetime) -> None:
+        """소스별 마지막 수집 시각 저장"""
+        pass
+
+    @abstractmethod
+    async def find_subscribed_symbols(self) -> List[StockSymbol]:
+        """활성 구독의 심볼 목록"""
+        pass
+
+    @abstractmethod
+    async def request_symbols(self, symbols: List[StockSymbol]) -> None:
+        """사용자가 조회한 심볼을 수집 대상에 추가"""
+        pass
+
+    @abstractmethod
+    async def find_requested_symbols(self) -> List[StockSymbol]:
+        """최근 조회된 심볼 목록"""
+        pass
+
+    @abstractmethod
+    async def consume_budget(self, source: str, limit_per_hour: int) -> bool:
+        """소스 호출 예산 1회 차감 (시간당 한도를 넘으면 False)"""
+        pass
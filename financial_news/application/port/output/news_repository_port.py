@@ -1,29 +1,40 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 from datetime import datetime
 
 from financial_news.domain.entity.news import News
 from financial_news.domain.entity.sentiment import Sentiment
+from financial_news.domain.entity.symbol_daily_sentiment import SymbolDailySentiment
 from financial_news.domain.value_objects.news_id import NewsId
 from financial_news.domain.value_objects.stock_symbol import StockSymbol
 from financial_news.domain.value_objects.time_range import TimeRange
 
 
 class NewsRepositoryPort(ABC):
-    """뉴스 저장소 포트 (Output Port)"""
+    """뉴스 저장소 포트 (Output Port) - 모든 메서드는 이벤트 루프를 막지 않는 코루틴"""
 
     @abstractmethod
-    def save(self, news: News) -> News:
-        """뉴스 저장"""
+    async def save(self, news: News) -> News:
+        """뉴스 저장 (save_many 와 같은 upsert: 같은 URL/ID 면 기존 행의 제목/본문만 갱신)"""
         pass
 
     @abstractmethod
-    def find_by_id(self, news_id: NewsId) -> Optional[News]:
+    async def save_many(self, news_list: List[News]) -> List[News]:
+        """뉴스 일괄 저장 (같은 URL 은 기존 행 갱신), 입력 순서대로 저장된 엔티티 반환"""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, news_id: NewsId) -> Optional[News]:
         """ID로 뉴스 조회"""
         pass
 
     @abstractmethod
-    def find_by_symbols(
+    async def find_by_ids(self, news_ids: List[NewsId]) -> List[News]:
+        """ID 목록으로 뉴스 일괄 조회"""
+        pass
+
+    @abstractmethod
+    async def find_by_symbols(
             self,
             symbols: List[StockSymbol],
             time_range: Optional[TimeRange] = None,
@@ -32,16 +43,45 @@ class NewsRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def find_recent(self, hours: int = 24, limit: int = 100) -> List[News]:
+    async def find_existing_urls(self, urls: List[str]) -> Set[str]:
+        """이미 저장된 URL 만 골라 반환"""
+        pass
+
+    @abstractmethod
+    async def find_recent(self, hours: int = 24, limit: int = 100) -> List[News]:
         """최근 뉴스 조회"""
         pass
 
     @abstractmethod
-    def save_sentiment(self, sentiment: Sentiment) -> Sentiment:
+    async def save_sentiment(self, sentiment: Sentiment) -> Sentiment:
         """감성 분석 결과 저장"""
         pass
 
     @abstractmethod
-    def find_sentiment_by_news_id(self, news_id: NewsId) -> Optional[Sentiment]:
-        """뉴스 ID로 감성 분석 결과 조회"""
+    async def save_sentiments(self, sentiments: List[Sentiment]) -> List[Sentiment]:
+        """감성 분석 결과 일괄 저장 (뉴스 감성 점수 갱신 포함)"""
+        pass
+
+    @abstractmethod
+    async def find_sentiment_by_news_id(self, news_id: NewsId) -> Optional[Sentiment]:
+        """뉴스 ID로 가장 최근의 성공한 감성 분석 결과 조회 (실패 결과 confidence 0 은 제외)"""
+        pass
+
+    @abstractmethod
+    async def find_sentiments_by_news_ids(self, news_ids: List[NewsId]) -> Dict[str, Sentiment]:
+        """뉴스 ID 목록 -> 뉴스별 가장 최근의 성공한 감성 분석 결과 (실패 결과 confidence 0 은 제외)"""
+        pass
+
+    @abstractmethod
+    async def find_daily_sentiments(self, symbol: StockSymbol, time_range: TimeRange) -> List[SymbolDailySentiment]:
+        """심볼별 일 단위 감성 집계 조회"""
+        pass
+
+    @abstractmethod
+    async def find_daily_sentiments_for_symbols(
+            self,
+            symbols: List[StockSymbol],
+            time_range: TimeRange
+    ) -> List[SymbolDailySentiment]:
+        """여러 심볼의 일 단위 감성 집계 일괄 조회"""
         pass
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple
+
+from financial_news.domain.entity.news import News
+
+
+class TrendingTopicsPort(ABC):
+    """트렌딩 토픽 저장소 포트 (Output Port) - 쓰기 시점에 증분 갱신"""
+
+    @abstractmethod
+    async def record_news(self, news_list: List[News]) -> None:
+        """새 뉴스의 키워드/심볼 반영 (같은 뉴스는 한 번만)"""
+        pass
+
+    @abstractmethod
+    async def record_sentiments(self, scored: List[Tuple[News, float]]) -> None:
+        """(뉴스, 감성 점수) 목록의 키워드별 감성 반영 (같은 뉴스는 한 번만)"""
+        pass
+
+    @abstractmethod
+    async def get_trending(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """시간 감쇠 점수 상위 키워드 (keyword, frequency, sentiment_score, related_symbols)"""
+        pass
@@ -1,14 +1,27 @@
-from typing import List, Dict, Any
+import asyncio
+import os
+from typing import List, Dict, Any, Tuple
 
-from financial_news.application.port.input.sentiment_service_port import SentimentServicePort
-from financial_news.application.port.output.ai_service_port import AIServicePort
+from financial_news.application.port.input.sentiment_service_port import SentimentServicePort, \
+    BatchSentimentResult, SentimentBatchItemError
+from financial_news.application.port.output.ai_service_port import AIServicePort, SentimentArticle
 from financial_news.application.port.output.news_repository_port import NewsRepositoryPort
+from financial_news.application.port.output.trending_topics_port import TrendingTopicsPort
+from financial_news.domain.entity.news import News
 from financial_news.domain.entity.sentiment import Sentiment
+from financial_news.domain.entity.symbol_daily_sentiment import SymbolDailySentiment
 from financial_news.domain.value_objects.news_id import NewsId
 from financial_news.domain.value_objects.sentiment_score import SentimentScore
 from financial_news.domain.value_objects.stock_symbol import StockSymbol
 from financial_news.domain.value_objects.time_range import TimeRange
 
+# 일괄 분석 시 동시에 보낼 LLM 요청 수 (API rate limit 에 맞춰 조정)
+SENTIMENT_BATCH_CONCURRENCY = int(os.getenv("SENTIMENT_BATCH_CONCURRENCY", "8"))
+# 한 LLM 요청에 묶어 보낼 기사 수
+SENTIMENT_PACK_SIZE = int(os.getenv("SENTIMENT_PACK_SIZE", "8"))
+# AI 어댑터는 실패 시 예외 대신 confidence 0 결과를 돌려줌
+FAILED_SENTIMENT_ERROR = "Sentiment analysis failed"
+
 
 class AnalyzeSentimentUseCase(SentimentServicePort):
     """감성 분석 유스케이스"""
@@ -16,10 +29,12 @@ class AnalyzeSentimentUseCase(SentimentServicePort):
     def __init__(
             self,
             news_repository: NewsRepositoryPort,
-            ai_service: AIServicePort
+            ai_service: AIServicePort,
+            trending_topics: TrendingTopicsPort
     ):
         self.news_repository = news_repository
         self.ai_service = ai_service
+        self.trending_topics = trending_topics
 
     async def analyze_single(self, news_id: str) -> Sentiment:
         """단일 뉴스 감성 분석"""
@@ -28,85 +43,127 @@ class AnalyzeSentimentUseCase(SentimentServicePort):
         if not news:
             raise ValueError(f"News not found: {news_id}")
 
-        # 2. AI 감성 분석
+        # 이미 분석에 성공한 뉴스는 저장된 결과 반환 (LLM 호출 없음)
+        existing = await self.news_repository.find_sentiment_by_news_id(news.id)
+        if existing and existing.confidence > 0:
+            return existing
+
+        # 2. AI 감성 분석 (실패 결과는 저장하지 않아 다음 요청에서 다시 분석)
         result = await self.ai_service.analyze_sentiment(
             title=news.title,
             content=news.content
         )
+        if result.confidence <= 0:
+            raise RuntimeError(FAILED_SENTIMENT_ERROR)
 
         # 3. 도메인 엔티티 생성
         sentiment = Sentiment(
             news_id=news.id,
             score=SentimentScore(result.score),
             confidence=result.confidence,
-            keywords=result.keywords
+            keywords=result.keywords,
+            reasoning=result.reasoning
         )
 
-        # 4. 결과 저장
+        # 4. 결과 저장 (뉴스 감성 점수/일 집계도 같은 트랜잭션에서 갱신)
         await self.news_repository.save_sentiment(sentiment)
         news.set_sentiment(sentiment.score)
-        await self.news_repository.save(news)
+        await self._record_trending([(news, sentiment.score.value)])
 
         return sentiment
 
-    async def analyze_batch(self, news_ids: List[str]) -> List[Sentiment]:
-        """일괄 감성 분석"""
-        sentiments = []
-        for news_id in news_ids:
-            try:
-                sentiment = await self.analyze_single(news_id)
-                sentiments.append(sentiment)
-            except Exception as e:
-                print(f"Failed to analyze news {news_id}: {e}")
+    async def analyze_batch(self, news_ids: List[str]) -> BatchSentimentResult:
+        """일괄 감성 분석 (조회 1회 + 묶음 LLM 호출 + 저장 1회)"""
+        result = BatchSentimentResult()
+        ids = list(dict.fromkeys(news_ids))  # 중복 제거, 순서 유지
+
+        # 1. 뉴스 일괄 조회 + 이미 분석된 결과 조회 (분석된 뉴스는 LLM 호출/저장 없이 그대로 반환)
+        news_map = {
+            str(n.id): n
+            for n in await self.news_repository.find_by_ids([NewsId.from_string(i) for i in ids])
+        }
+        existing = await self.news_repository.find_sentiments_by_news_ids([n.id for n in news_map.values()])
+        for news_id in ids:
+            if news_id not in news_map:
+                result.errors.append(SentimentBatchItemError(news_id=news_id, error="News not found"))
+            elif news_id in existing:
+                result.sentiments.append(existing[news_id])
+
+        # 2. AI 감성 분석 (기사 여러 개를 한 요청에 묶고, 동시 요청 수 제한)
+        semaphore = asyncio.Semaphore(SENTIMENT_BATCH_CONCURRENCY)
+
+        async def analyze(pack):
+            async with semaphore:
+                return await self.ai_service.analyze_sentiment_many([
+                    SentimentArticle(id=str(n.id), title=n.title, content=n.content) for n in pack
+                ])
+
+        targets = [news_map[i] for i in ids if i in news_map and i not in existing]
+        packs = [targets[i:i + SENTIMENT_PACK_SIZE] for i in range(0, len(targets), SENTIMENT_PACK_SIZE)]
+        pack_outcomes = await asyncio.gather(*(analyze(p) for p in packs), return_exceptions=True)
+
+        # 묶음 단위 실패는 묶음 안의 모든 기사에 같은 에러로 기록
+        outcomes = []
+        for pack, pack_outcome in zip(packs, pack_outcomes):
+            outcomes.extend(pack_outcome if isinstance(pack_outcome, list) else [pack_outcome] * len(pack))
+
+        # 3. 도메인 엔티티 생성 (항목별 실패는 에러 목록으로, 저장하지 않음)
+        analyzed: List[Sentiment] = []
+        for news, outcome in zip(targets, outcomes):
+            if isinstance(outcome, Exception):
+                result.errors.append(SentimentBatchItemError(news_id=str(news.id), error=str(outcome)))
                 continue
-
-        return sentiments
+            if outcome.confidence <= 0:
+                result.errors.append(SentimentBatchItemError(news_id=str(news.id), error=FAILED_SENTIMENT_ERROR))
+                continue
+            try:
+                analyzed.append(Sentiment(
+                    news_id=news.id,
+                    score=SentimentScore(outcome.score),
+                    confidence=outcome.confidence,
+                    keywords=outcome.keywords,
+                    reasoning=outcome.reasoning
+                ))
+            except ValueError as e:
+                result.errors.append(SentimentBatchItemError(news_id=str(news.id), error=str(e)))
+
+        # 4. 새로 분석한 결과 + 뉴스 감성 점수 일괄 저장
+        await self.news_repository.save_sentiments(analyzed)
+        await self._record_trending([(news_map[str(s.news_id)], s.score.value) for s in analyzed])
+        result.sentiments.extend(analyzed)
+
+        return result
+
+    async def _record_trending(self, scored: List[Tuple[News, float]]):
+        """트렌딩 토픽의 키워드별 감성 반영 (실패해도 분석 결과는 유지)"""
+        try:
+            await self.trending_topics.record_sentiments(scored)
+        except Exception as e:
+            print(f"Failed to record trending sentiment: {e}")
 
     async def get_sentiment_summary(self, symbol: str, days: int = 7) -> Dict[str, Any]:
         """심볼별 감성 요약"""
         stock_symbol = StockSymbol(symbol.upper())
         time_range = TimeRange.last_n_days(days)
 
-        # 해당 심볼의 뉴스 조회
-        news_list = await self.news_repository.find_by_symbols(
-            symbols=[stock_symbol],
-            start_date=time_range.start,
-            end_date=time_range.end
+        # 일 단위 집계 행(기간 일수만큼)만 읽어서 합산
+        total = SymbolDailySentiment.total(
+            stock_symbol, await self.news_repository.find_daily_sentiments(stock_symbol, time_range)
         )
 
-        # 감성 분석 결과 집계
-        analyzed_news = [n for n in news_list if n.has_sentiment_analyzed()]
-
-        if not analyzed_news:
-            return {
-                "symbol": symbol,
-                "period_days": days,
-                "total_news": len(news_list),
-                "analyzed_news": 0,
-                "avg_sentiment": 0.0,
-                "positive_count": 0,
-                "negative_count": 0,
-                "neutral_count": 0,
-                "positive_ratio": 0.0,
-                "negative_ratio": 0.0
-            }
-
-        sentiments = [n.sentiment_score.value for n in analyzed_news]
-        avg_sentiment = sum(sentiments) / len(sentiments)
-
-        positive_count = sum(1 for s in sentiments if s > 0.2)
-        negative_count = sum(1 for s in sentiments if s < -0.2)
-        neutral_count = len(sentiments) - positive_count - negative_count
-
         return {
             "symbol": symbol,
             "period_days": days,
-            "total_news": len(news_list),
-            "analyzed_news": len(analyzed_news),
-            "avg_sentiment": round(avg_sentiment, 3),
-            "positive_count": positive_count,
-            "negative_count": negative_count,
-            "neutral_count": neutral_count,
-            "positive_ratio": round(positive_count / len(analyzed_news), 2),
-            "negative_ratio": round(negative_count / len(analyzed_news), 2)
-        }
\ No newline at end of file
+            "start_date": time_range.start,
+            "end_date": time_range.end,
+            "total_news": total.news_count,
+            "analyzed_news": total.analyzed_count,
+            "avg_sentiment": round(total.avg_sentiment, 3),
+            "average_score": round(total.avg_sentiment, 3),
+            "positive_count": total.positive_count,
+            "negative_count": total.negative_count,
+            "neutral_count": total.neutral_count,
+            "positive_ratio": round(total.positive_ratio, 2),
+            "negative_ratio": round(total.negative_ratio, 2),
+            "top_keywords": total.top_keywords(10)
+        }
@@ -0,0 +1,120 @@
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from financial_news.application.port.input.analysis_service_port import AnalysisServicePort
+from financial_news.domain.entity.analysis_report import AnalysisReport
+
+# 이 시간 안이면 그대로, 그 뒤 STALE 시간까지는 기존 리포트를 주면서 백그라운드 갱신
+REPORT_CACHE_TTL_SECONDS = float(os.getenv("REPORT_CACHE_TTL_SECONDS", "60"))
+REPORT_CACHE_STALE_SECONDS = float(os.getenv("REPORT_CACHE_STALE_SECONDS", "600"))
+REPORT_CACHE_SIZE = int(os.getenv("REPORT_CACHE_SIZE", "256"))
+
+ReportKey = Tuple[Tuple[str, ...], int]
+
+
+class ReportCache:
+    """(정렬된 심볼, 기간) 단위 리포트 캐시 (stale-while-revalidate, 키별 생성 1회)"""
+
+    def __init__(
+            self,
+            ttl_seconds: float = REPORT_CACHE_TTL_SECONDS,
+            stale_seconds: float = REPORT_CACHE_STALE_SECONDS,
+            max_size: int = REPORT_CACHE_SIZE
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[ReportKey, Tuple[AnalysisReport, float]]" = OrderedDict()
+        self._building: Dict[ReportKey, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return now - stored_at >= self.ttl_seconds + self.stale_seconds
+
+    def _sweep(self, now: float):
+        # 저장 순서 = 저장 시각 순서라 앞에서부터 만료된 것만 정리
+        while self._entries:
+            _, stored_at = next(iter(self._entries.values()))
+            if not self._expired(stored_at, now):
+                break
+            self._entries.popitem(last=False)
+
+    def _store(self, key: ReportKey, task: asyncio.Task):
+        self._building.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            if not task.cancelled():
+                print(f"Report refresh failed for {key}: {task.exception()}")
+            return
+        now = time.monotonic()
+        self._entries[key] = (task.result(), now)
+        self._entries.move_to_end(key)
+        self._sweep(now)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _build(self, key: ReportKey, builder: Callable[[], Awaitable[AnalysisReport]]) -> asyncio.Task:
+        # 같은 키는 동시에 한 번만 생성
+        task = self._building.get(key)
+        if task is None:
+            task = asyncio.create_task(builder())
+            task.add_done_callback(lambda t: self._store(key, t))
+            self._building[key] = task
+        return task
+
+    async def get_or_build(
+            self,
+            key: ReportKey,
+            builder: Callable[[], Awaitable[AnalysisReport]]
+    ) -> AnalysisReport:
+        entry = self._entries.get(key)
+        if entry is not None:
+            report, stored_at = entry
+            age = time.monotonic() - stored_at
+            if age < self.ttl_seconds:
+                self.hits += 1
+                return report
+            if age < self.ttl_seconds + self.stale_seconds:
+                self.stale_hits += 1
+                self._build(key, builder)
+                return report
+            # stale 기간도 지난 리포트는 버리고 새로 생성
+            self._entries.pop(key, None)
+
+        self.misses += 1
+        return await asyncio.shield(self._build(key, builder))
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "lookups": lookups,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 3) if lookups else 0.0,
+            "size": len(self._entries),
+            "refreshing": len(self._building),
+        }
+
+
+# 요청마다 유스케이스가 새로 만들어지므로 캐시는 프로세스 단위로 공유
+report_cache = ReportCache()
+
+
+class CachedReportUseCase(AnalysisServicePort):
+    """리포트 캐시 데코레이터 (반복 요청은 캐시에서 바로 응답)"""
+
+    def __init__(self, inner: AnalysisServicePort, cache: ReportCache = report_cache):
+        self.inner = inner
+        self.cache = cache
+
+    async def generate_report(self, symbols: List[str], days: int = 7) -> AnalysisReport:
+        key = (tuple(sorted({s.upper() for s in symbols})), days)
+        return await self.cache.get_or_build(key, lambda: self.inner.generate_report(list(key[0]), days))
+
+    async def get_trending_topics(self, limit: int = 10) -> List[Dict[str, Any]]:
+        return await self.inner.get_trending_topics(limit)
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from financial_news.adapter.output.google.news_api_adapter import NewsAPIAdapter
+from financial_news.application.port.output.ingestion_state_port import IngestionStatePort
 from financial_news.application.port.output.news_repository_port import NewsRepositoryPort
 from financial_news.application.port.input.news_service_port import NewsServicePort
 from financial_news.domain.entity.news import News
@@ -10,11 +10,11 @@ from financial_news.domain.value_objects.time_range import TimeRange
 
 
 class FetchNewsUseCase(NewsServicePort):
-    """뉴스 조회 유스케이스"""
+    """뉴스 조회 유스케이스 (저장소만 조회, 외부 수집은 백그라운드 스케줄러가 담당)"""
 
-    def __init__(self, news_repository: NewsRepositoryPort):
+    def __init__(self, news_repository: NewsRepositoryPort, ingestion_state: IngestionStatePort):
         self.news_repository = news_repository
-        self.news_api = NewsAPIAdapter()
+        self.ingestion_state = ingestion_state
 
     async def get_news_list(
             self,
@@ -22,15 +22,18 @@ class FetchNewsUseCase(NewsServicePort):
             limit: int = 20,
             time_range: Optional[TimeRange] = None
     ) -> List[News]:
-        news_list = self.news_repository.find_by_symbols(symbols, limit)
-        if news_list:
-            return news_list
+        if not symbols:
+            return await self.news_repository.find_recent(limit=limit)
 
-        articles = await self.news_api.fetch_news_by_symbols([str(s) for s in symbols], limit=limit)
-        for news in articles:
-            self.news_repository.save(news)
+        symbols = [s if isinstance(s, StockSymbol) else StockSymbol(s.strip().upper()) for s in symbols]
 
-        return self.news_repository.find_by_symbols(symbols, limit)
+        # 조회된 심볼은 다음 수집 주기부터 수집 대상에 포함 (실패해도 조회는 계속)
+        try:
+            await self.ingestion_state.request_symbols(symbols)
+        except Exception as e:
+            print(f"Failed to register requested symbols: {e}")
+
+        return await self.news_repository.find_by_symbols(symbols, time_range, limit)
 
     async def get_news_by_id(self, news_id: str) -> News | None:
-        return self.news_repository.find_by_id(NewsId.from_string(news_id))
+        return await self.news_repository.find_by_id(NewsId.from_string(news_id))
@@ -1,16 +1,22 @@
 from typing import List, Dict, Any
-from collections import Counter
+from collections import defaultdict, OrderedDict
+import hashlib
 import uuid
 
 from financial_news.application.port.input.analysis_service_port import AnalysisServicePort
 from financial_news.application.port.output.ai_service_port import AIServicePort
 from financial_news.application.port.output.news_repository_port import NewsRepositoryPort
+from financial_news.application.port.output.trending_topics_port import TrendingTopicsPort
 from financial_news.domain.entity.analysis_report import AnalysisReport
+from financial_news.domain.entity.symbol_daily_sentiment import SymbolDailySentiment
 from financial_news.domain.entity.trend_data import TrendData
-from financial_news.domain.service.sentiment_calculator import SentimentCalculator
 from financial_news.domain.value_objects.stock_symbol import StockSymbol
 from financial_news.domain.value_objects.time_range import TimeRange
 
+# 트렌드 지문 -> 요약 (수치가 그대로면 LLM 요약 재사용)
+SUMMARY_CACHE_SIZE = 256
+_summaries_by_fingerprint: "OrderedDict[str, str]" = OrderedDict()
+
 
 class GenerateReportUseCase(AnalysisServicePort):
     """분석 리포트 생성 유스케이스"""
@@ -18,15 +24,16 @@ class GenerateReportUseCase(AnalysisServicePort):
     def __init__(
             self,
             news_repository: NewsRepositoryPort,
-            ai_service: AIServicePort
+            ai_service: AIServicePort,
+            trending_topics: TrendingTopicsPort
     ):
         self.news_repository = news_repository
         self.ai_service = ai_service
-        self.sentiment_calculator = SentimentCalculator()
+        self.trending_topics = trending_topics
 
     async def generate_report(self, symbols: List[str], days: int = 7) -> AnalysisReport:
         """종합 분석 리포트 생성"""
-        stock_symbols = [StockSymbol(s.upper()) for s in symbols]
+        stock_symbols = list(dict.fromkeys(StockSymbol(s.upper()) for s in symbols))
         time_range = TimeRange.last_n_days(days)
 
         # 리포트 생성
@@ -36,9 +43,8 @@ class GenerateReportUseCase(AnalysisServicePort):
             time_range=time_range
         )
 
-        # 각 심볼별 트렌드 분석
-        for symbol in stock_symbols:
-            trend = await self._analyze_symbol_trend(symbol, time_range)
+        # 모든 심볼 트렌드를 집계 쿼리 한 번으로
+        for trend in await self._analyze_symbol_trends(stock_symbols, time_range):
             report.add_trend(trend)
 
         # 전체 요약 생성
@@ -49,50 +55,28 @@ class GenerateReportUseCase(AnalysisServicePort):
 
         return report
 
-    async def _analyze_symbol_trend(
+    async def _analyze_symbol_trends(
             self,
-            symbol: StockSymbol,
+            symbols: List[StockSymbol],
             time_range: TimeRange
-    ) -> TrendData:
-        """심볼별 트렌드 분석"""
-        news_list = await self.news_repository.find_by_symbols(
-            symbols=[symbol],
-            start_date=time_range.start,
-            end_date=time_range.end
-        )
-
-        analyzed_news = [n for n in news_list if n.has_sentiment_analyzed()]
-
-        if not analyzed_news:
-            return TrendData(
+    ) -> List[TrendData]:
+        """심볼별 트렌드 분석 (일 단위 집계 행을 한 번에 읽어 심볼별로 합산)"""
+        daily_by_symbol = defaultdict(list)
+        for daily in await self.news_repository.find_daily_sentiments_for_symbols(symbols, time_range):
+            daily_by_symbol[daily.symbol].append(daily)
+
+        trends = []
+        for symbol in symbols:
+            total = SymbolDailySentiment.total(symbol, daily_by_symbol[symbol])
+            trends.append(TrendData(
                 symbol=symbol,
-                news_count=len(news_list),
-                avg_sentiment=0.0,
-                positive_ratio=0.0,
-                negative_ratio=0.0,
-                trending_keywords=[]
-            )
-
-        avg_sentiment = self.sentiment_calculator.calculate_average_sentiment(analyzed_news)
-        positive_ratio = self.sentiment_calculator.calculate_positive_ratio(analyzed_news)
-        negative_ratio = self.sentiment_calculator.calculate_negative_ratio(analyzed_news)
-
-        # 키워드 추출
-        all_keywords = []
-        for news in analyzed_news:
-            all_keywords.extend(news.keywords)
-
-        keyword_counts = Counter(all_keywords)
-        trending_keywords = [k for k, _ in keyword_counts.most_common(10)]
-
-        return TrendData(
-            symbol=symbol,
-            news_count=len(news_list),
-            avg_sentiment=round(avg_sentiment, 3),
-            positive_ratio=round(positive_ratio, 2),
-            negative_ratio=round(negative_ratio, 2),
-            trending_keywords=trending_keywords
-        )
+                news_count=total.news_count,
+                avg_sentiment=round(total.avg_sentiment, 3),
+                positive_ratio=round(total.positive_ratio, 2),
+                negative_ratio=round(total.negative_ratio, 2),
+                trending_keywords=total.top_keywords(10)
+            ))
+        return trends
 
     async def _generate_summary(self, report: AnalysisReport) -> str:
         """AI를 활용한 리포트 요약 생성"""
@@ -109,7 +93,18 @@ Analyze the following financial news trends and provide a brief summary:
 Period: {report.time_range.start.date()} to {report.time_range.end.date()}
         """
 
+        # 프롬프트가 트렌드 수치와 기간만으로 정해지므로 프롬프트 해시를 트렌드 지문으로 사용
+        fingerprint = hashlib.sha256(summary_prompt.encode("utf-8")).hexdigest()
+        cached = _summaries_by_fingerprint.get(fingerprint)
+        if cached is not None:
+            _summaries_by_fingerprint.move_to_end(fingerprint)
+            return cached
+
         summary = await self.ai_service.summarize(summary_prompt, max_length=300)
+        if summary != "Failed to generate summary":
+            _summaries_by_fingerprint[fingerprint] = summary
+            while len(_summaries_by_fingerprint) > SUMMARY_CACHE_SIZE:
+                _summaries_by_fingerprint.popitem(last=False)
         return summary
 
     def _generate_insights(self, report: AnalysisReport) -> List[str]:
@@ -146,17 +141,5 @@ Period: {report.time_range.start.date()} to {report.time_range.end.date()}
 
     async def get_trending_topics(self, limit: int = 10) -> List[Dict[str, Any]]:
         """트렌딩 토픽 조회"""
-        recent_news = await self.news_repository.find_recent(hours=24, limit=200)
-
-        # 키워드 빈도 분석
-        all_keywords = []
-        for news in recent_news:
-            all_keywords.extend(news.keywords)
-
-        keyword_counts = Counter(all_keywords)
-        trending = [
-            {"keyword": k, "count": c}
-            for k, c in keyword_counts.most_common(limit)
-        ]
-
-        return trending
\ No newline at end of file
+        # 쓰기 시점에 갱신된 시간 감쇠 점수에서 상위 limit 개만 읽음
+        return await self.trending_topics.get_trending(limit)
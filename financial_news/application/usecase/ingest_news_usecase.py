@@ -0,0 +1,169 @@
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from financial_news.adapter.output.google.news_api_adapter import NewsAPIAdapter
+from financial_news.adapter.output.google.rss_feed_adapter import RSSFeedAdapter
+from financial_news.application.port.output.duplicate_index_port import DuplicateIndexPort
+from financial_news.application.port.output.ingestion_state_port import IngestionStatePort
+from financial_news.application.port.output.news_repository_port import NewsRepositoryPort
+from financial_news.application.port.output.trending_topics_port import TrendingTopicsPort
+from financial_news.domain.entity.news import News
+from financial_news.domain.service.news_fingerprint import NewsFingerprint
+from financial_news.domain.value_objects.stock_symbol import StockSymbol
+
+# 항상 수집할 심볼 (구독/조회 심볼에 추가)
+WATCHED_SYMBOLS = [s for s in os.getenv("INGESTION_WATCH_SYMBOLS", "").split(",") if s.strip()]
+# SerpAPI 쿼리 하나에 묶을 심볼 수 / 쿼리당 기사 수
+SYMBOLS_PER_QUERY = int(os.getenv("INGESTION_SYMBOLS_PER_QUERY", "5"))
+ARTICLES_PER_QUERY = int(os.getenv("INGESTION_ARTICLES_PER_QUERY", "20"))
+# 소스별 시간당 호출 예산
+SERPAPI_HOURLY_BUDGET = int(os.getenv("INGESTION_SERPAPI_HOURLY_BUDGET", "20"))
+RSS_HOURLY_BUDGET = int(os.getenv("INGESTION_RSS_HOURLY_BUDGET", "60"))
+# 워터마크가 없는 심볼은 이만큼 과거부터
+INITIAL_LOOKBACK_DAYS = 7
+# 늦게 색인되는 기사를 놓치지 않게 워터마크보다 이만큼 앞부터 다시 조회 (겹치는 기사는 중복 제거로 걸러짐)
+WATERMARK_OVERLAP_HOURS = float(os.getenv("INGESTION_WATERMARK_OVERLAP_HOURS", "6"))
+# 추정 자카드 유사도가 이 이상이면 같은 기사 (재작성된 신디케이션 ~0.45, 다른 기사 ~0.3 이하)
+DEDUP_SIMILARITY_THRESHOLD = float(os.getenv("DEDUP_SIMILARITY_THRESHOLD", "0.4"))
+
+
+class IngestNewsUseCase:
+    """백그라운드 뉴스 수집 유스케이스 (요청 경로에서는 호출하지 않음)"""
+
+    def __init__(
+            self,
+            news_repository: NewsRepositoryPort,
+            ingestion_state: IngestionStatePort,
+            trending_topics: TrendingTopicsPort,
+            duplicate_index: DuplicateIndexPort,
+            news_api: Optional[NewsAPIAdapter],
+            rss_feed: Optional[RSSFeedAdapter]
+    ):
+        self.news_repository = news_repository
+        self.ingestion_state = ingestion_state
+        self.trending_topics = trending_topics
+        self.duplicate_index = duplicate_index
+        self.news_api = news_api
+        self.rss_feed = rss_feed
+
+    async def target_symbols(self) -> List[StockSymbol]:
+        """고정 관심 심볼 + 활성 구독 심볼 + 최근 조회 심볼"""
+        watched = []
+        for value in WATCHED_SYMBOLS:
+            try:
+                watched.append(StockSymbol(value.strip().upper()))
+            except ValueError:
+                print(f"[ingestion] invalid watched symbol: {value}")
+        symbols = (
+            watched
+            + await self.ingestion_state.find_subscribed_symbols()
+            + await self.ingestion_state.find_requested_symbols()
+        )
+        return list(dict.fromkeys(symbols))
+
+    async def ingest_symbols(self) -> int:
+        """심볼 뉴스 수집. 워터마크가 오래된 심볼부터, 예산이 남는 동안만"""
+        now = datetime.utcnow()
+        default_since = now - timedelta(days=INITIAL_LOOKBACK_DAYS)
+        watermarks = {
+            s: await self.ingestion_state.get_watermark(f"serpapi:{s}") or default_since
+            for s in await self.target_symbols()
+        }
+        ordered = sorted(watermarks, key=lambda s: watermarks[s])
+
+        saved = 0
+        for i in range(0, len(ordered), SYMBOLS_PER_QUERY):
+            group = ordered[i:i + SYMBOLS_PER_QUERY]
+            if not await self.ingestion_state.consume_budget("serpapi", SERPAPI_HOURLY_BUDGET):
+                print(f"[ingestion] serpapi budget exhausted, {len(ordered) - i} symbols deferred")
+                break
+
+            since = min(watermarks[s] for s in group) - timedelta(hours=WATERMARK_OVERLAP_HOURS)
+            articles = await self.news_api.fetch_news_by_symbols(
+                [str(s) for s in group], limit=ARTICLES_PER_QUERY, since=since
+            )
+            # 발행 시각으로 거르지 않음 (늦게 색인된 기사도 저장, 이미 본 기사는 URL/MinHash 로 제외)
+            saved += await self._store(articles)
+            for symbol in group:
+                await self.ingestion_state.set_watermark(f"serpapi:{symbol}", now)
+        return saved
+
+    async def ingest_rss(self) -> int:
+        """RSS 피드 수집 (피드에 남아 있는 기사 중 아직 저장되지 않은 것)"""
+        if not await self.ingestion_state.consume_budget("rss", RSS_HOURLY_BUDGET):
+            print("[ingestion] rss budget exhausted")
+            return 0
+
+        now = datetime.utcnow()
+        articles, validators = await self.rss_feed.fetch_latest_news(
+            find_existing_urls=self.news_repository.find_existing_urls
+        )
+        # 발행 시각이 워터마크 이전이어도 늦게 피드에 올라온 기사일 수 있어 중복 제거에만 맡김
+        saved = await self._store(articles)
+        # 저장이 성공한 뒤에만 검증자 반영 (저장 실패 시 다음 수집이 304 로 기사를 건너뛰지 않게)
+        await self.rss_feed.commit_validators(validators)
+        await self.ingestion_state.set_watermark("rss", now)
+        return saved
+
+    async def _deduplicate(self, articles: List[News]) -> Tuple[List[News], List[List[int]]]:
+        """
+        중복 제거: 정규화 URL 이 같거나 이미 저장됨 -> 제외,
+        MinHash 유사도가 기준 이상 -> 같은 묶음으로 보고 대표(먼저 본 기사)만 남김
+        """
+        total = len(articles)
+        by_url: Dict[str, News] = {}
+        for news in articles:
+            news.url = NewsFingerprint.canonicalize_url(news.url)
+            if news.url and news.url in by_url:
+                self._merge_into(by_url[news.url], news)
+                continue
+            by_url[news.url or str(news.id)] = news
+        existing_urls = await self.news_repository.find_existing_urls([u for u in by_url if u])
+        articles = [n for n in by_url.values() if n.url not in existing_urls]
+
+        signatures = [NewsFingerprint.minhash(n.title, n.content) for n in articles]
+        candidates = await self.duplicate_index.find_candidates(signatures)
+
+        kept: List[Tuple[News, List[int]]] = []
+        for news, signature, stored in zip(articles, signatures, candidates):
+            # 이미 저장된 대표가 있으면 제외 (저장/분석 비용 절감)
+            if any(NewsFingerprint.similarity(signature, s) >= DEDUP_SIMILARITY_THRESHOLD for s in stored.values()):
+                continue
+            representative = next(
+                (rep for rep, rep_signature in kept
+                 if NewsFingerprint.similarity(signature, rep_signature) >= DEDUP_SIMILARITY_THRESHOLD),
+                None
+            )
+            if representative:
+                self._merge_into(representative, news)
+            else:
+                kept.append((news, signature))
+
+        print(f"[ingestion] dedup: {len(kept)} kept, {total - len(articles)} same url, "
+              f"{len(articles) - len(kept)} near duplicates")
+        return [n for n, _ in kept], [s for _, s in kept]
+
+    @staticmethod
+    def _merge_into(representative: News, duplicate: News):
+        # 같은 묶음의 다른 기사에만 잡힌 심볼/키워드는 대표에 합침
+        for symbol in duplicate.symbols:
+            representative.add_symbol(symbol)
+        representative.keywords = list(dict.fromkeys(representative.keywords + duplicate.keywords))
+
+    async def _store(self, articles: List[News]) -> int:
+        """중복 제거 후 일괄 저장, 실제로 새로 저장된 기사 수 반환"""
+        articles, signatures = await self._deduplicate(articles)
+        signature_by_id = {str(n.id): s for n, s in zip(articles, signatures)}
+        # 한 트랜잭션으로 일괄 저장 (다른 워커가 먼저 넣은 URL 이면 기존 행이 돌아옴)
+        stored = await self.news_repository.save_many(articles)
+        # ID 가 그대로인 엔티티만 이번에 새로 들어간 행 (기존 행은 이미 색인/집계됨)
+        inserted = [n for n in stored if str(n.id) in signature_by_id]
+        await self.duplicate_index.register([(str(n.id), signature_by_id[str(n.id)]) for n in inserted])
+
+        # 트렌딩 토픽 증분 반영 (실패해도 수집은 계속)
+        try:
+            await self.trending_topics.record_news(inserted)
+        except Exception as e:
+            print(f"Failed to record trending topics: {e}")
+        return len(inserted)
@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from financial_news.domain.value_objects.news_id import NewsId
+from financial_news.domain.value_objects.sentiment_id import SentimentId
 from financial_news.domain.value_objects.sentiment_score import SentimentScore
 
 
@@ -12,7 +13,9 @@ class Sentiment:
     score: SentimentScore
     confidence: float  # 0.0 ~ 1.0
     keywords: List[str] = field(default_factory=list)
+    reasoning: Optional[str] = None
     analyzed_at: datetime = field(default_factory=datetime.utcnow)
+    id: SentimentId = field(default_factory=SentimentId.generate)
 
     def __post_init__(self):
         if not 0.0 <= self.confidence <= 1.0:
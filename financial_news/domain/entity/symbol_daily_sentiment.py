@@ -0,0 +1,52 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional
+
+from financial_news.domain.value_objects.stock_symbol import StockSymbol
+
+
+@dataclass
+class SymbolDailySentiment:
+    """심볼별 일 단위 감성 집계 (day 가 None 이면 기간 합계)"""
+    symbol: StockSymbol
+    day: Optional[date] = None
+    news_count: int = 0
+    analyzed_count: int = 0
+    sum_score: float = 0.0
+    positive_count: int = 0
+    negative_count: int = 0
+    neutral_count: int = 0
+    keyword_counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def avg_sentiment(self) -> float:
+        return self.sum_score / self.analyzed_count if self.analyzed_count else 0.0
+
+    @property
+    def positive_ratio(self) -> float:
+        return self.positive_count / self.analyzed_count if self.analyzed_count else 0.0
+
+    @property
+    def negative_ratio(self) -> float:
+        return self.negative_count / self.analyzed_count if self.analyzed_count else 0.0
+
+    def top_keywords(self, limit: int = 10) -> List[str]:
+        return [k for k, _ in Counter(self.keyword_counts).most_common(limit)]
+
+    @classmethod
+    def total(cls, symbol: StockSymbol, days: List["SymbolDailySentiment"]) -> "SymbolDailySentiment":
+        """일별 집계를 기간 합계로 합침"""
+        keywords = Counter()
+        for d in days:
+            keywords.update(d.keyword_counts)
+        return cls(
+            symbol=symbol,
+            news_count=sum(d.news_count for d in days),
+            analyzed_count=sum(d.analyzed_count for d in days),
+            sum_score=sum(d.sum_score for d in days),
+            positive_count=sum(d.positive_count for d in days),
+            negative_count=sum(d.negative_count for d in days),
+            neutral_count=sum(d.neutral_count for d in days),
+            keyword_counts=dict(keywords)
+        )
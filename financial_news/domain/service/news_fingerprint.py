@@ -0,0 +1,72 @@
+import re
+from typing import List
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import xxhash
+
+# 같은 기사를 가리키는 URL 에서 지워도 되는 추적용 파라미터
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ocid", "cmpid", "ref", "taid", "yptr"}
+TRACKING_PREFIXES = ("utm_",)
+
+# MinHash 서명 길이 = 밴드 수 x 밴드당 행 수 (32 x 3 -> 자카드 0.45 면 95%, 0.2 면 23% 확률로 후보)
+MINHASH_BANDS = 32
+MINHASH_ROWS = 3
+MINHASH_SIZE = MINHASH_BANDS * MINHASH_ROWS
+SHINGLE_SIZE = 3
+
+_MASK32 = 0xFFFFFFFF
+_TOKEN_PATTERN = re.compile(r"[a-z0-9가-힣]+")
+
+
+class NewsFingerprint:
+    """기사 중복 판정 도메인 서비스 (URL 정규화 + MinHash)"""
+
+    @staticmethod
+    def canonicalize_url(url: str) -> str:
+        """스킴/호스트 소문자, www·기본 포트·추적 파라미터·프래그먼트 제거, 쿼리 정렬"""
+        if not url:
+            return url
+        parts = urlsplit(url.strip())
+        if not parts.netloc:
+            return url.strip()
+
+        host = (parts.hostname or "").lower()
+        if host.startswith("www."):
+            host = host[4:]
+        if parts.port and parts.port not in (80, 443):
+            host = f"{host}:{parts.port}"
+
+        query = sorted(
+            (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+        )
+        scheme = "https" if parts.scheme.lower() in ("http", "https") else parts.scheme.lower()
+        return urlunsplit((scheme, host, parts.path.rstrip("/") or "/", urlencode(query), ""))
+
+    @staticmethod
+    def minhash(title: str, content: str) -> List[int]:
+        """제목+본문의 단어 3-gram 집합에 대한 MinHash 서명 (같은 위치 값이 같을 확률 = 자카드 유사도)"""
+        tokens = _TOKEN_PATTERN.findall(f"{title} {content}".lower())
+        shingles = {" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+        if not shingles:
+            shingles = set(tokens) or {""}
+
+        # 64비트 해시 하나를 두 32비트로 나눠 h1 + i*h2 로 해시 함수 MINHASH_SIZE 개를 흉내
+        pairs = []
+        for shingle in shingles:
+            h = xxhash.xxh64_intdigest(shingle)
+            pairs.append((h & _MASK32, (h >> 32) | 1))
+        return [min((h1 + i * h2) & _MASK32 for h1, h2 in pairs) for i in range(MINHASH_SIZE)]
+
+    @staticmethod
+    def similarity(a: List[int], b: List[int]) -> float:
+        """추정 자카드 유사도"""
+        return sum(x == y for x, y in zip(a, b)) / MINHASH_SIZE
+
+    @staticmethod
+    def band_keys(signature: List[int]) -> List[str]:
+        """LSH 밴드 키 (밴드 하나라도 같으면 후보)"""
+        return [
+            f"{band}:{xxhash.xxh64_hexdigest(repr(signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS]))}"
+            for band in range(MINHASH_BANDS)
+        ]
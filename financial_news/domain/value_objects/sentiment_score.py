@@ -2,6 +2,9 @@ from dataclasses import dataclass
 
 from financial_news.domain.value_objects.sentiment_label import SentimentLabel
 
+# get_label 의 라벨 경계값
+LABEL_BOUNDARIES = (-0.6, -0.2, 0.2, 0.6)
+
 
 @dataclass(frozen=True)
 class SentimentScore:
@@ -23,6 +26,10 @@ class SentimentScore:
         else:
             return SentimentLabel.VERY_POSITIVE
 
+    def boundary_distance(self) -> float:
+        """가장 가까운 라벨 경계까지의 거리 (작을수록 라벨이 애매함)"""
+        return min(abs(self.value - b) for b in LABEL_BOUNDARIES)
+
     def is_positive(self) -> bool:
         return self.value > 0.2
 
@@ -1,7 +1,25 @@
+import asyncio
+import os
+
 import aiohttp
-from typing import List, Dict, Any
+import feedparser
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+from config.redis_config import get_redis
+
+# 피드 전체를 한 번에 요청하므로 피드 수만큼 연결을 유지
+RSS_CONNECTION_LIMIT = int(os.getenv("RSS_CONNECTION_LIMIT", "10"))
+RSS_TIMEOUT_SECONDS = float(os.getenv("RSS_TIMEOUT_SECONDS", "10"))
+RSS_ENTRIES_PER_FEED = 20
+
+# 피드 URL -> 마지막 응답의 ETag / Last-Modified (워커 간 공유)
+ETAG_KEY = "rss:etag"
+LAST_MODIFIED_KEY = "rss:last_modified"
+
+# 피드 URL -> 이번 응답의 (ETag, Last-Modified). 수집 결과가 저장된 뒤에 save_validators 로 반영
+FeedValidators = Dict[str, Tuple[Optional[str], Optional[str]]]
+
 
 class RSSFeedClient:
     """RSS Feed 파서 클라이언트"""
@@ -14,54 +32,114 @@ class RSSFeedClient:
         "https://www.wsj.com/xml/rss/3_7085.xml"
     ]
 
-    async def fetch_from_feed(self, feed_url: str) -> List[Dict[str, Any]]:
-        """단일 RSS 피드에서 뉴스 가져오기"""
+    # 커넥션 풀을 재사용하도록 프로세스 단위로 세션 공유
+    _session: Optional[aiohttp.ClientSession] = None
+
+    def __init__(self):
+        self.redis = get_redis()
+
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=RSS_CONNECTION_LIMIT),
+                timeout=aiohttp.ClientTimeout(total=RSS_TIMEOUT_SECONDS)
+            )
+        return cls._session
+
+    @classmethod
+    async def close(cls):
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+
+    async def fetch_from_feed(
+            self,
+            feed_url: str
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[Optional[str], Optional[str]]]]:
+        """
+        단일 RSS 피드에서 뉴스와 응답 검증자 가져오기 (바뀌지 않았으면 304 로 빈 목록, 검증자 None)
+        검증자는 여기서 저장하지 않음 (저장 실패 시 다음 요청이 304 가 되어 기사를 잃지 않게)
+        """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                        feed_url,
-                        timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        feed = feedparser.parse(content)
-
-                        articles = []
-                        for entry in feed.entries[:20]:  # 최대 20개
-                            article = {
-                                "title": entry.get("title", ""),
-                                "description": entry.get("summary", ""),
-                                "url": entry.get("link", ""),
-                                "published_at": self._parse_date(entry.get("published")),
-                                "source": feed.feed.get("title", "Unknown")
-                            }
-                            articles.append(article)
-
-                        return articles
-                    else:
-                        return []
+            # 조건부 GET: 이전 응답의 검증자 전송
+            etag, last_modified = await asyncio.to_thread(self._get_validators, feed_url)
+            headers = {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+            async with self._get_session().get(feed_url, headers=headers) as response:
+                if response.status == 304:
+                    return [], None
+                if response.status != 200:
+                    print(f"RSS feed {feed_url} returned {response.status}")
+                    return [], None
+                content = await response.read()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
+            # 파싱은 CPU 작업이라 이벤트 루프 밖에서
+            articles = await asyncio.to_thread(self._parse_feed, content)
+            return articles, (etag, last_modified)
 
         except Exception as e:
             print(f"Failed to fetch RSS feed {feed_url}: {e}")
-            return []
-
-    async def fetch_all_feeds(self) -> List[Dict[str, Any]]:
-        """모든 RSS 피드에서 뉴스 가져오기"""
-        all_articles = []
+            return [], None
 
-        for feed_url in self.FINANCIAL_RSS_FEEDS:
-            articles = await self.fetch_from_feed(feed_url)
-            all_articles.extend(articles)
+    async def fetch_all_feeds(self) -> Tuple[List[Dict[str, Any]], FeedValidators]:
+        """모든 RSS 피드에서 뉴스 + 새로 받은 검증자 가져오기 (동시 요청)"""
+        results = await asyncio.gather(*(self.fetch_from_feed(url) for url in self.FINANCIAL_RSS_FEEDS))
 
         # 중복 제거 (URL 기준)
         seen_urls = set()
         unique_articles = []
-        for article in all_articles:
-            if article["url"] not in seen_urls:
-                seen_urls.add(article["url"])
-                unique_articles.append(article)
+        validators: FeedValidators = {}
+        for feed_url, (articles, feed_validators) in zip(self.FINANCIAL_RSS_FEEDS, results):
+            if feed_validators is not None:
+                validators[feed_url] = feed_validators
+            for article in articles:
+                if article["url"] not in seen_urls:
+                    seen_urls.add(article["url"])
+                    unique_articles.append(article)
+
+        return unique_articles, validators
+
+    async def save_validators(self, validators: FeedValidators):
+        """다음 조건부 GET 에 쓸 검증자 저장 (가져온 기사가 저장된 뒤에 호출)"""
+        if validators:
+            await asyncio.to_thread(self._set_validators, validators)
+
+    def _parse_feed(self, content: bytes) -> List[Dict[str, Any]]:
+        feed = feedparser.parse(content)
+        source = feed.feed.get("title", "Unknown")
+        return [
+            {
+                "title": entry.get("title", ""),
+                "description": entry.get("summary", ""),
+                "url": entry.get("link", ""),
+                "published_at": self._parse_date(entry.get("published")),
+                "source": source
+            }
+            for entry in feed.entries[:RSS_ENTRIES_PER_FEED]
+        ]
+
+    def _get_validators(self, feed_url: str):
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hget(ETAG_KEY, feed_url)
+        pipe.hget(LAST_MODIFIED_KEY, feed_url)
+        return pipe.execute()
 
-        return unique_articles
+    def _set_validators(self, validators: FeedValidators):
+        pipe = self.redis.pipeline(transaction=False)
+        for feed_url, (etag, last_modified) in validators.items():
+            for key, value in ((ETAG_KEY, etag), (LAST_MODIFIED_KEY, last_modified)):
+                if value:
+                    pipe.hset(key, feed_url, value)
+                else:
+                    pipe.hdel(key, feed_url)
+        pipe.execute()
 
     def _parse_date(self, date_str: str) -> datetime:
         """날짜 문자열 파싱"""
@@ -69,4 +147,4 @@ class RSSFeedClient:
             from dateutil import parser
             return parser.parse(date_str)
         except:
-            return datetime.utcnow()
\ No newline at end of file
+            return datetime.utcnow()
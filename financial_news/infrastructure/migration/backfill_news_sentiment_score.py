@@ -0,0 +1,79 @@
+"""
+news.sentiment_score 컬럼 추가 + sentiments 테이블에서 백필
+
+    python -m financial_news.infrastructure.migration.backfill_news_sentiment_score [배치 크기]
+
+여러 번 실행해도 안전 (컬럼이 있으면 건너뛰고, 비어 있는 행만 채움)
+뉴스별로 가장 최근의 성공한 분석(confidence > 0) 점수를 사용
+"""
+import sys
+import time
+from typing import Dict, List
+
+from sqlalchemy import bindparam, inspect, select, update
+
+from config.database.session import SessionLocal, engine
+from financial_news.infrastructure.orm.models import NewsModel, SentimentModel
+
+
+def _ensure_column():
+    columns = {c["name"] for c in inspect(engine).get_columns(NewsModel.__tablename__)}
+    if "sentiment_score" not in columns:
+        with engine.begin() as conn:
+            conn.exec_driver_sql("ALTER TABLE news ADD COLUMN sentiment_score FLOAT NULL")
+
+
+def latest_sentiment_scores(db, news_ids: List[str]) -> Dict[str, float]:
+    """뉴스 ID -> 가장 최근의 성공한 분석 점수 (실패 결과 confidence 0 은 제외)"""
+    if not news_ids:
+        return {}
+    rows = db.execute(
+        select(SentimentModel.news_id, SentimentModel.score)
+        .where(SentimentModel.news_id.in_(news_ids), SentimentModel.confidence > 0)
+        .order_by(SentimentModel.analyzed_at, SentimentModel.id)
+    ).all()
+    # 오래된 것부터 덮어써서 최신 값만 남김
+    return {news_id: score for news_id, score in rows}
+
+
+def backfill(batch_size: int = 5000):
+    _ensure_column()
+
+    db = SessionLocal()
+    started = time.perf_counter()
+    last_id, scanned, written = "", 0, 0
+    try:
+        while True:
+            # PK 기준 keyset 페이지네이션 (OFFSET 없이 일정한 속도)
+            news_ids = db.execute(
+                select(NewsModel.id)
+                .where(NewsModel.id > last_id, NewsModel.sentiment_score.is_(None))
+                .order_by(NewsModel.id)
+                .limit(batch_size)
+            ).scalars().all()
+            if not news_ids:
+                break
+
+            scores = [
+                {"b_id": news_id, "b_score": score}
+                for news_id, score in latest_sentiment_scores(db, news_ids).items()
+            ]
+            if scores:
+                db.connection().execute(
+                    update(NewsModel.__table__)
+                    .where(NewsModel.__table__.c.id == bindparam("b_id"))
+                    .values(sentiment_score=bindparam("b_score")),
+                    scores
+                )
+            db.commit()
+
+            last_id = news_ids[-1]
+            scanned += len(news_ids)
+            written += len(scores)
+            print(f"[backfill] {scanned} news scanned, {written} sentiment scores, {time.perf_counter() - started:.1f}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
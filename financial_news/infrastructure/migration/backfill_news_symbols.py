@@ -0,0 +1,53 @@
+"""
+news.symbols(콤마 문자열) -> news_symbols 연결 테이블 백필
+
+    python -m financial_news.infrastructure.migration.backfill_news_symbols [배치 크기]
+
+여러 번 실행해도 안전 (이미 있는 행은 INSERT IGNORE 로 건너뜀)
+"""
+import sys
+import time
+
+from sqlalchemy import insert, select
+
+from config.database.session import SessionLocal, engine
+from financial_news.infrastructure.orm.models import NewsModel, NewsSymbolModel
+
+
+def backfill(batch_size: int = 5000):
+    NewsSymbolModel.__table__.create(bind=engine, checkfirst=True)
+
+    db = SessionLocal()
+    started = time.perf_counter()
+    last_id, scanned, written = "", 0, 0
+    try:
+        while True:
+            # PK 기준 keyset 페이지네이션 (OFFSET 없이 일정한 속도)
+            rows = db.execute(
+                select(NewsModel.id, NewsModel.symbols, NewsModel.published_at)
+                .where(NewsModel.id > last_id)
+                .order_by(NewsModel.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+
+            links = [
+                {"news_id": news_id, "symbol": symbol, "published_at": published_at}
+                for news_id, symbols, published_at in rows
+                for symbol in dict.fromkeys(s.strip() for s in (symbols or "").split(",") if s.strip())
+            ]
+            if links:
+                db.execute(insert(NewsSymbolModel).prefix_with("IGNORE"), links)
+            db.commit()
+
+            last_id = rows[-1][0]
+            scanned += len(rows)
+            written += len(links)
+            print(f"[backfill] {scanned} news scanned, {written} symbol links, {time.perf_counter() - started:.1f}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,95 @@
+"""
+기존 뉴스로 symbol_sentiment_daily 일 집계 재생성
+
+    python -m financial_news.infrastructure.migration.backfill_sentiment_rollups [배치 크기]
+
+집계 테이블을 비우고 news 전체에서 다시 계산 (이후로는 저장 시 증분 갱신)
+감성 점수는 sentiments 의 뉴스별 최신 성공 결과 우선, 없으면 news.sentiment_score
+수집/분석 작업을 멈춘 상태에서 실행
+"""
+import json
+import sys
+import time
+from collections import Counter, defaultdict
+
+from sqlalchemy import delete, insert, select
+
+from config.database.session import SessionLocal, engine
+from financial_news.domain.value_objects.sentiment_score import SentimentScore
+from financial_news.infrastructure.migration.backfill_news_sentiment_score import latest_sentiment_scores
+from financial_news.infrastructure.orm.models import NewsModel, SymbolSentimentDailyModel
+
+
+def backfill(batch_size: int = 5000):
+    SymbolSentimentDailyModel.__table__.create(bind=engine, checkfirst=True)
+
+    counts = defaultdict(Counter)
+    keywords = defaultdict(Counter)
+    db = SessionLocal()
+    started = time.perf_counter()
+    last_id, scanned = "", 0
+    try:
+        while True:
+            rows = db.execute(
+                select(NewsModel.id, NewsModel.symbols, NewsModel.published_at, NewsModel.keywords,
+                       NewsModel.sentiment_score)
+                .where(NewsModel.id > last_id)
+                .order_by(NewsModel.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+
+            # news.sentiment_score 는 컬럼 추가 전 분석분이 비어 있을 수 있어 sentiments 기준
+            latest = latest_sentiment_scores(db, [row[0] for row in rows])
+            for news_id, symbols, published_at, news_keywords, news_score in rows:
+                score = latest.get(news_id, news_score)
+                day = published_at.date()
+                for symbol in dict.fromkeys(s for s in (symbols or "").split(",") if s):
+                    key = (symbol, day)
+                    counts[key]["news_count"] += 1
+                    if score is None:
+                        continue
+                    value = SentimentScore(score)
+                    counts[key]["analyzed_count"] += 1
+                    counts[key]["sum_score"] += score
+                    if value.is_positive():
+                        counts[key]["positive_count"] += 1
+                    elif value.is_negative():
+                        counts[key]["negative_count"] += 1
+                    else:
+                        counts[key]["neutral_count"] += 1
+                    keywords[key].update(k for k in (news_keywords or "").split(",") if k)
+
+            last_id = rows[-1][0]
+            scanned += len(rows)
+            print(f"[backfill] {scanned} news scanned, {len(counts)} rollup rows, {time.perf_counter() - started:.1f}s")
+
+        db.execute(delete(SymbolSentimentDailyModel))
+        rollups = [
+            {
+                "symbol": symbol,
+                "day": day,
+                "news_count": c["news_count"],
+                "analyzed_count": c["analyzed_count"],
+                "sum_score": c["sum_score"],
+                "positive_count": c["positive_count"],
+                "negative_count": c["negative_count"],
+                "neutral_count": c["neutral_count"],
+                "keyword_counts": json.dumps(dict(keywords[(symbol, day)]), ensure_ascii=False),
+            }
+            for (symbol, day), c in counts.items()
+        ]
+        for i in range(0, len(rollups), batch_size):
+            db.execute(insert(SymbolSentimentDailyModel), rollups[i:i + batch_size])
+        db.commit()
+        print(f"[backfill] wrote {len(rollups)} rollup rows")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
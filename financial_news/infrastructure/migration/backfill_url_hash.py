@@ -0,0 +1,103 @@
+"""
+news.url_hash 컬럼 추가 + 기존 뉴스 백필 + 유니크 인덱스
+
+    python -m financial_news.infrastructure.migration.backfill_url_hash [배치 크기]
+
+여러 번 실행해도 안전 (컬럼/인덱스가 있으면 건너뛰고, 비어 있는 행만 채움)
+같은 URL 로 이미 여러 행이 있으면 가장 먼저 저장된 행만 url_hash 를 유지 (나머지는 NULL)
+다시 실행하면 NULL 로 남긴 중복 행도 다시 읽히지만, 유니크 인덱스와 충돌하는 갱신은 건너뜀
+"""
+import sys
+import time
+
+from sqlalchemy import bindparam, func, inspect, select, update
+
+from config.database.session import SessionLocal, engine
+from financial_news.infrastructure.orm.models import NewsModel
+from financial_news.infrastructure.repository.async_news_repository import url_hash
+
+
+def _ensure_column():
+    columns = {c["name"] for c in inspect(engine).get_columns(NewsModel.__tablename__)}
+    if "url_hash" not in columns:
+        with engine.begin() as conn:
+            conn.exec_driver_sql("ALTER TABLE news ADD COLUMN url_hash VARCHAR(64) NULL")
+
+
+def _ensure_unique_index():
+    index = next(i for i in NewsModel.__table__.indexes if "url_hash" in i.columns)
+    existing = {i["name"]: i for i in inspect(engine).get_indexes(NewsModel.__tablename__)}
+    if index.name in existing and existing[index.name]["unique"]:
+        return
+    with engine.begin() as conn:
+        if index.name in existing:
+            conn.exec_driver_sql(f"ALTER TABLE news DROP INDEX {index.name}")
+        index.create(bind=conn)
+
+
+def _release_duplicates(db) -> int:
+    """같은 url_hash 의 행 중 가장 먼저 저장된 행만 남기고 url_hash 를 비움"""
+    duplicated = db.execute(
+        select(NewsModel.url_hash)
+        .where(NewsModel.url_hash.is_not(None))
+        .group_by(NewsModel.url_hash)
+        .having(func.count() > 1)
+    ).scalars().all()
+
+    released = 0
+    for hash_value in duplicated:
+        ids = db.execute(
+            select(NewsModel.id)
+            .where(NewsModel.url_hash == hash_value)
+            .order_by(NewsModel.created_at, NewsModel.id)
+        ).scalars().all()
+        db.execute(update(NewsModel).where(NewsModel.id.in_(ids[1:])).values(url_hash=None))
+        released += len(ids) - 1
+    db.commit()
+    return released
+
+
+def backfill(batch_size: int = 5000):
+    _ensure_column()
+
+    db = SessionLocal()
+    started = time.perf_counter()
+    last_id, scanned, written = "", 0, 0
+    try:
+        while True:
+            # PK 기준 keyset 페이지네이션 (OFFSET 없이 일정한 속도)
+            rows = db.execute(
+                select(NewsModel.id, NewsModel.url)
+                .where(NewsModel.id > last_id, NewsModel.url_hash.is_(None))
+                .order_by(NewsModel.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+
+            hashes = [{"b_id": news_id, "b_hash": url_hash(url)} for news_id, url in rows if url]
+            if hashes:
+                # 이미 다른 행이 가진 해시면 (이전 실행에서 비운 중복 행) 충돌 대신 NULL 로 남김
+                result = db.connection().execute(
+                    update(NewsModel.__table__)
+                    .prefix_with("IGNORE", dialect="mysql")
+                    .prefix_with("OR IGNORE", dialect="sqlite")
+                    .where(NewsModel.__table__.c.id == bindparam("b_id"))
+                    .values(url_hash=bindparam("b_hash")),
+                    hashes
+                )
+                written += result.rowcount
+            db.commit()
+
+            last_id = rows[-1][0]
+            scanned += len(rows)
+            print(f"[backfill] {scanned} news scanned, {written} url hashes, {time.perf_counter() - started:.1f}s")
+
+        print(f"[backfill] {_release_duplicates(db)} duplicate urls released")
+        _ensure_unique_index()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Float, DateTime, Boolean, Integer
+from sqlalchemy import Column, String, Text, Float, Date, DateTime, Boolean, Integer, Index
 # from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 from config.database.session import Base
@@ -14,13 +14,28 @@ class NewsModel(Base):
     source = Column(Text, nullable=False)  # dict(JSON) 저장 가능
     published_at = Column(DateTime, nullable=False, index=True)
     url = Column(String(1000))
+    url_hash = Column(String(64), index=True, unique=True)  # sha256(url), 같은 URL 은 한 행만 (save_many upsert 키)
     symbols = Column(String(500), index=True)  # 콤마로 구분된 심볼
     categories = Column(String(500))
     keywords = Column(Text)  # 길이 길어질 수 있음
+    sentiment_score = Column(Float, nullable=True)  # 감성 분석 후 채워짐
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+class NewsSymbolModel(Base):
+    """뉴스-심볼 연결 ORM 모델 (심볼+기간 조회는 이 테이블의 인덱스로)"""
+    __tablename__ = "news_symbols"
+
+    news_id = Column(String(50), primary_key=True)
+    symbol = Column(String(10), primary_key=True)
+    published_at = Column(DateTime, nullable=False)  # news.published_at 복사 (인덱스 범위 조회용)
+
+    __table_args__ = (
+        Index("ix_news_symbols_symbol_published_at", "symbol", "published_at"),
+    )
+
+
 class SentimentModel(Base):
     """감성 분석 ORM 모델"""
     __tablename__ = "sentiments"
@@ -34,6 +49,22 @@ class SentimentModel(Base):
     analyzed_at = Column(DateTime, default=datetime.utcnow)
 
 
+class SymbolSentimentDailyModel(Base):
+    """심볼별 일 단위 감성 집계 ORM 모델 (save / save_sentiment 시 증분 갱신)"""
+    __tablename__ = "symbol_sentiment_daily"
+
+    symbol = Column(String(10), primary_key=True)
+    day = Column(Date, primary_key=True)
+    news_count = Column(Integer, nullable=False, default=0)
+    analyzed_count = Column(Integer, nullable=False, default=0)
+    sum_score = Column(Float, nullable=False, default=0.0)
+    positive_count = Column(Integer, nullable=False, default=0)
+    negative_count = Column(Integer, nullable=False, default=0)
+    neutral_count = Column(Integer, nullable=False, default=0)
+    keyword_counts = Column(Text)  # {"keyword": count} JSON
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 class SubscriptionModel(Base):
     """구독 ORM 모델"""
     __tablename__ = "subscriptions"
@@ -45,4 +76,13 @@ class SubscriptionModel(Base):
     sentiment_threshold = Column(Float, default=0.5)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
\ No newline at end of file
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class IngestionWatermarkModel(Base):
+    """뉴스 수집 워터마크 ORM 모델 (소스/심볼별 마지막 수집 시각)"""
+    __tablename__ = "ingestion_watermarks"
+
+    source_key = Column(String(100), primary_key=True)  # 예: "serpapi:AAPL", "rss"
+    last_fetched_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
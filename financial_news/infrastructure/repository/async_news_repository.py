@@ -0,0 +1,450 @@
+import hashlib
+import json
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+from datetime import date, datetime, timedelta
+from sqlalchemy import bindparam, select, or_, insert, update, tuple_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.database.async_session import AsyncSessionLocal
+from financial_news.application.port.output.news_repository_port import NewsRepositoryPort
+from financial_news.domain.entity.news import News
+from financial_news.domain.entity.sentiment import Sentiment
+from financial_news.domain.entity.symbol_daily_sentiment import SymbolDailySentiment
+from financial_news.domain.value_objects.news_id import NewsId
+from financial_news.domain.value_objects.sentiment_id import SentimentId
+from financial_news.domain.value_objects.sentiment_score import SentimentScore
+from financial_news.domain.value_objects.stock_symbol import StockSymbol
+from financial_news.domain.value_objects.time_range import TimeRange
+from financial_news.infrastructure.orm.models import NewsModel, NewsSymbolModel, SentimentModel, \
+    SymbolSentimentDailyModel
+
+# 일 집계 숫자 컬럼
+ROLLUP_COUNTERS = (
+    "news_count", "analyzed_count", "sum_score", "positive_count", "negative_count", "neutral_count"
+)
+# (symbol, day) -> (숫자 컬럼 증감, 키워드 증감)
+RollupDeltas = Dict[Tuple[str, date], Tuple[Counter, Counter]]
+
+
+def url_hash(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+class AsyncNewsRepositoryImpl(NewsRepositoryPort):
+    """aiomysql 기반 뉴스 저장소 (호출마다 풀에서 세션을 열고 바로 반환, 이벤트 루프를 막지 않음)"""
+    __instance = None
+
+    # 세션은 호출마다 새로 열기 때문에 싱글톤이 공유하는 상태는 없음
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    # 뉴스 저장 (save_many 와 같은 upsert 경로)
+    async def save(self, news: News) -> News:
+        return (await self.save_many([news]))[0]
+
+    # 뉴스 일괄 저장: url_hash 기준 multi-row INSERT ... ON DUPLICATE KEY UPDATE 를 한 트랜잭션으로
+    async def save_many(self, news_list: List[News]) -> List[News]:
+        if not news_list:
+            return []
+        rows = [self._to_row(n) for n in news_list]
+        stmt = mysql_insert(NewsModel).values(rows)
+
+        async with AsyncSessionLocal() as db:
+            async with db.begin():
+                # 같은 ID 재저장은 새 행이 아니므로 연결 행/일 집계 대상에서 제외
+                existing_ids = set((await db.execute(
+                    select(NewsModel.id).where(NewsModel.id.in_([r["id"] for r in rows]))
+                )).scalars().all())
+
+                # 이미 있는 URL 은 본문만 갱신 (ID/심볼/발행 시각/감성 점수는 유지해서 연결 행과 일 집계가 그대로 맞음)
+                await db.execute(stmt.on_duplicate_key_update(
+                    title=stmt.inserted.title,
+                    content=stmt.inserted.content,
+                    updated_at=stmt.inserted.updated_at,
+                ))
+
+                hashes = [r["url_hash"] for r in rows if r["url_hash"]]
+                stored = (await db.execute(
+                    select(NewsModel).where(or_(
+                        NewsModel.id.in_([r["id"] for r in rows]),
+                        NewsModel.url_hash.in_(hashes)
+                    ))
+                )).scalars().all()
+                by_id = {o.id: o for o in stored}
+                by_hash = {o.url_hash: o for o in stored if o.url_hash}
+
+                # 실제로 새로 들어간 행만 심볼 연결 + 일 집계 반영
+                inserted = [by_id[r["id"]] for r in rows if r["id"] in by_id and r["id"] not in existing_ids]
+                links = [
+                    {"news_id": o.id, "symbol": symbol, "published_at": o.published_at}
+                    for o in inserted
+                    for symbol in dict.fromkeys(s for s in (o.symbols or "").split(",") if s)
+                ]
+                if links:
+                    await db.execute(insert(NewsSymbolModel).prefix_with("IGNORE"), links)
+                deltas: RollupDeltas = {}
+                for o in inserted:
+                    self._track_rollup(deltas, o, old_score=None, is_new=True)
+                await self._apply_rollups(db, deltas)
+
+        # 입력 순서대로 저장된 엔티티 (같은 URL 은 기존 행)
+        return [
+            self._to_entity(by_hash.get(r["url_hash"]) or by_id[r["id"]])
+            for r in rows
+            if by_hash.get(r["url_hash"]) or r["id"] in by_id
+        ]
+
+    # ID 조회
+    async def find_by_id(self, news_id: NewsId) -> Optional[News]:
+        async with AsyncSessionLocal() as db:
+            orm = await db.get(NewsModel, str(news_id))
+        return self._to_entity(orm) if orm else None
+
+    # ID 일괄 조회 (쿼리 한 번)
+    async def find_by_ids(self, news_ids: List[NewsId]) -> List[News]:
+        if not news_ids:
+            return []
+        async with AsyncSessionLocal() as db:
+            orms = (await db.execute(
+                select(NewsModel).where(NewsModel.id.in_([str(i) for i in news_ids]))
+            )).scalars().all()
+        return [self._to_entity(o) for o in orms]
+
+    # 심볼 조회 (인터페이스와 100% 일치)
+    async def find_by_symbols(
+        self,
+        symbols: List[StockSymbol],
+        time_range: Optional[TimeRange] = None,
+        limit: int = 100
+    ) -> List[News]:
+        if not symbols:
+            return []
+
+        symbol_values = [str(s) for s in symbols]
+        in_range = isinstance(time_range, TimeRange)
+
+        if len(symbols) == 1:
+            # news_symbols 의 (symbol, published_at) 인덱스 순서 그대로 읽고 news 를 PK 로 조인
+            query = (
+                select(NewsModel)
+                .join(NewsSymbolModel, NewsSymbolModel.news_id == NewsModel.id)
+                .where(NewsSymbolModel.symbol == symbol_values[0])
+                .order_by(NewsSymbolModel.published_at.desc())
+            )
+            if in_range:
+                query = query.where(
+                    NewsSymbolModel.published_at >= time_range.start,
+                    NewsSymbolModel.published_at <= time_range.end
+                )
+        else:
+            # 여러 심볼: 전체 행 DISTINCT 대신 news_id 세미조인 (정렬/제한은 news.published_at 인덱스로)
+            matched = select(NewsSymbolModel.news_id).where(NewsSymbolModel.symbol.in_(symbol_values))
+            query = select(NewsModel).order_by(NewsModel.published_at.desc())
+            if in_range:
+                matched = matched.where(
+                    NewsSymbolModel.published_at >= time_range.start,
+                    NewsSymbolModel.published_at <= time_range.end
+                )
+                query = query.where(
+                    NewsModel.published_at >= time_range.start,
+                    NewsModel.published_at <= time_range.end
+                )
+            query = query.where(NewsModel.id.in_(matched))
+        async with AsyncSessionLocal() as db:
+            orms = (await db.execute(query.limit(limit))).scalars().all()
+        return [self._to_entity(o) for o in orms]
+
+    # 저장된 URL 조회 (url_hash 인덱스로, 해시 충돌은 원문 URL 로 재확인)
+    async def find_existing_urls(self, urls: List[str]) -> Set[str]:
+        hashes = {url_hash(u) for u in urls if u}
+        if not hashes:
+            return set()
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(select(NewsModel.url).where(NewsModel.url_hash.in_(hashes)))).scalars().all()
+        return set(rows) & set(urls)
+
+    # 최근 뉴스 조회 (파라미터 순서 일치)
+    async def find_recent(self, hours: int = 24, limit: int = 100) -> List[News]:
+        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+
+        async with AsyncSessionLocal() as db:
+            orms = (await db.execute(
+                select(NewsModel)
+                .where(NewsModel.published_at >= cutoff_time)
+                .order_by(NewsModel.published_at.desc())
+                .limit(limit)
+            )).scalars().all()
+
+        return [self._to_entity(o) for o in orms]
+
+    # 감성 저장 (뉴스 감성 점수와 일 집계도 같은 트랜잭션에서 갱신)
+    async def save_sentiment(self, sentiment: Sentiment) -> Sentiment:
+        await self.save_sentiments([sentiment])
+        return sentiment
+
+    # 감성 일괄 저장: 감성 결과 multi-row INSERT + 뉴스 감성 점수 bulk UPDATE + 일 집계 증분을 한 트랜잭션으로
+    async def save_sentiments(self, sentiments: List[Sentiment]) -> List[Sentiment]:
+        if not sentiments:
+            return []
+        async with AsyncSessionLocal() as db:
+            async with db.begin():
+                news_rows = {
+                    o.id: o
+                    for o in (await db.execute(
+                        select(NewsModel).where(NewsModel.id.in_([str(s.news_id) for s in sentiments]))
+                    )).scalars()
+                }
+                # 같은 뉴스가 여러 번 들어와도 직전 점수 기준으로 증감
+                current = {news_id: o.sentiment_score for news_id, o in news_rows.items()}
+                deltas: RollupDeltas = {}
+                for s in sentiments:
+                    orm = news_rows.get(str(s.news_id))
+                    if orm is not None:
+                        self._track_rollup(deltas, orm, old_score=current[orm.id], new_score=s.score.value)
+                        current[orm.id] = s.score.value
+
+                await db.execute(insert(SentimentModel), [
+                    {
+                        "id": str(s.id),
+                        "news_id": str(s.news_id),
+                        "score": s.score.value,
+                        "confidence": s.confidence,
+                        "keywords": ",".join(s.keywords),
+                        "reasoning": s.reasoning,
+                        "analyzed_at": s.analyzed_at,
+                    }
+                    for s in sentiments
+                ])
+                await db.execute(update(NewsModel), [
+                    {"id": str(s.news_id), "sentiment_score": s.score.value, "updated_at": datetime.utcnow()}
+                    for s in sentiments
+                ])
+                await self._apply_rollups(db, deltas)
+        return sentiments
+
+    # 심볼별 일 집계 조회 (기간 일수만큼의 행)
+    async def find_daily_sentiments(self, symbol: StockSymbol, time_range: TimeRange) -> List[SymbolDailySentiment]:
+        return await self.find_daily_sentiments_for_symbols([symbol], time_range)
+
+    # 여러 심볼의 일 집계를 쿼리 한 번으로 (심볼 수 x 일수 행)
+    async def find_daily_sentiments_for_symbols(
+        self,
+        symbols: List[StockSymbol],
+        time_range: TimeRange
+    ) -> List[SymbolDailySentiment]:
+        if not symbols:
+            return []
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(
+                select(SymbolSentimentDailyModel)
+                .where(
+                    SymbolSentimentDailyModel.symbol.in_([str(s) for s in symbols]),
+                    SymbolSentimentDailyModel.day >= time_range.start.date(),
+                    SymbolSentimentDailyModel.day <= time_range.end.date()
+                )
+                .order_by(SymbolSentimentDailyModel.symbol, SymbolSentimentDailyModel.day)
+            )).scalars().all()
+        return [self._rollup_to_entity(r) for r in rows]
+
+    # 감성 단건 조회
+    async def find_sentiment_by_news_id(self, news_id: NewsId) -> Optional[Sentiment]:
+        async with AsyncSessionLocal() as db:
+            orm = (await db.execute(
+                select(SentimentModel)
+                .where(SentimentModel.news_id == str(news_id), SentimentModel.confidence > 0)
+                .order_by(SentimentModel.analyzed_at.desc(), SentimentModel.id.desc())
+                .limit(1)
+            )).scalars().first()
+
+        return self._sentiment_to_entity(orm) if orm else None
+
+    async def find_sentiments_by_news_ids(self, news_ids: List[NewsId]) -> Dict[str, Sentiment]:
+        if not news_ids:
+            return {}
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(
+                select(SentimentModel)
+                .where(SentimentModel.news_id.in_([str(i) for i in news_ids]), SentimentModel.confidence > 0)
+                .order_by(SentimentModel.analyzed_at, SentimentModel.id)
+            )).scalars().all()
+
+        # 오래된 것부터 덮어써서 뉴스별 최신 결과만 남김
+        return {row.news_id: self._sentiment_to_entity(row) for row in rows}
+
+    # 뉴스 감성 점수 변화 -> (symbol, day) 집계 증감
+    @staticmethod
+    def _track_rollup(
+        deltas: RollupDeltas,
+        orm: NewsModel,
+        old_score: Optional[float],
+        new_score: Optional[float] = None,
+        is_new: bool = False
+    ):
+        if new_score is None:
+            new_score = orm.sentiment_score
+        if not is_new and old_score == new_score:
+            return
+
+        day = orm.published_at.date()
+        keywords = [k for k in (orm.keywords or "").split(",") if k]
+        for symbol in dict.fromkeys(s for s in (orm.symbols or "").split(",") if s):
+            counts, keyword_counts = deltas.setdefault((symbol, day), (Counter(), Counter()))
+            if is_new:
+                counts["news_count"] += 1
+            if old_score == new_score:
+                continue
+            if old_score is None:
+                counts["analyzed_count"] += 1
+                keyword_counts.update(keywords)
+            else:
+                counts["sum_score"] -= old_score
+                counts[AsyncNewsRepositoryImpl._label_column(old_score)] -= 1
+            if new_score is not None:
+                counts["sum_score"] += new_score
+                counts[AsyncNewsRepositoryImpl._label_column(new_score)] += 1
+
+    @staticmethod
+    def _label_column(score: float) -> str:
+        value = SentimentScore(score)
+        if value.is_positive():
+            return "positive_count"
+        if value.is_negative():
+            return "negative_count"
+        return "neutral_count"
+
+    # 집계 증감 반영 (커밋은 호출 측 트랜잭션)
+    # 숫자 컬럼은 INSERT ... ON DUPLICATE KEY UPDATE col = col + 증감 으로 원자적으로 더함
+    # (없는 (symbol, day) 를 두 트랜잭션이 동시에 만들어도 한쪽이 중복 키로 실패하지 않음)
+    # 키워드 JSON 은 SQL 로 더할 수 없으므로, upsert 로 행이 생긴 뒤 행 잠금 후 병합
+    @staticmethod
+    async def _apply_rollups(db: AsyncSession, deltas: RollupDeltas):
+        if not deltas:
+            return
+        # 키 순서를 고정해서 트랜잭션 간 잠금 순서 역전(데드락) 방지
+        keys = sorted(deltas)
+        now = datetime.utcnow()
+        stmt = mysql_insert(SymbolSentimentDailyModel).values([
+            {
+                "symbol": symbol,
+                "day": day,
+                **{column: deltas[(symbol, day)][0].get(column, 0) for column in ROLLUP_COUNTERS},
+                "keyword_counts": "{}",
+                "updated_at": now,
+            }
+            for symbol, day in keys
+        ])
+        await db.execute(stmt.on_duplicate_key_update(
+            **{column: getattr(SymbolSentimentDailyModel, column) + stmt.inserted[column] for column in ROLLUP_COUNTERS},
+            updated_at=stmt.inserted.updated_at
+        ))
+
+        keyword_keys = [key for key in keys if deltas[key][1]]
+        if not keyword_keys:
+            return
+        rows = (await db.execute(
+            select(SymbolSentimentDailyModel.symbol, SymbolSentimentDailyModel.day,
+                   SymbolSentimentDailyModel.keyword_counts)
+            .where(tuple_(SymbolSentimentDailyModel.symbol, SymbolSentimentDailyModel.day).in_(keyword_keys))
+            .order_by(SymbolSentimentDailyModel.symbol, SymbolSentimentDailyModel.day)
+            .with_for_update()
+        )).all()
+        merged_rows = []
+        for symbol, day, keyword_counts in rows:
+            merged = Counter(json.loads(keyword_counts or "{}"))
+            merged.update(deltas[(symbol, day)][1])
+            merged_rows.append({
+                "b_symbol": symbol, "b_day": day, "b_keywords": json.dumps(dict(merged), ensure_ascii=False)
+            })
+        table = SymbolSentimentDailyModel.__table__
+        await db.execute(
+            update(table)
+            .where(table.c.symbol == bindparam("b_symbol"), table.c.day == bindparam("b_day"))
+            .values(keyword_counts=bindparam("b_keywords")),
+            merged_rows
+        )
+
+    # 도메인 → 행 (save / save_many 공용)
+    @staticmethod
+    def _to_row(news: News) -> dict:
+        # source를 문자열로 변환 (dict면 JSON 직렬화)
+        source_str = json.dumps(news.source) if isinstance(news.source, dict) else str(news.source)
+        return {
+            "id": str(news.id),
+            "title": news.title,
+            "content": news.content,
+            "source": source_str,
+            "published_at": news.published_at,
+            "url": news.url,
+            "url_hash": url_hash(news.url) if news.url else None,
+            "symbols": ",".join([str(s) for s in news.symbols]),
+            "categories": ",".join(news.categories),
+            "keywords": ",".join(news.keywords),
+            "sentiment_score": news.sentiment_score.value if news.sentiment_score else None,
+            "created_at": news.created_at or datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+        }
+
+    # ORM → 도메인 변환
+    @staticmethod
+    def _to_entity(orm: NewsModel) -> News:
+        # source를 dict로 복원 시도, 실패하면 문자열 그대로
+        try:
+            source = json.loads(orm.source)
+        except (json.JSONDecodeError, TypeError):
+            source = orm.source
+
+        symbols = [StockSymbol(s) for s in orm.symbols.split(",") if s]
+        categories = [c for c in orm.categories.split(",") if c]
+        keywords = [k for k in orm.keywords.split(",") if k]
+
+        return News(
+            id=orm.id,
+            title=orm.title,
+            content=orm.content,
+            source=source,
+            published_at=orm.published_at,
+            url=orm.url,
+            symbols=symbols,
+            categories=categories,
+            keywords=keywords,
+            sentiment_score=SentimentScore(orm.sentiment_score) if orm.sentiment_score is not None else None,
+            created_at=orm.created_at,
+            updated_at=orm.updated_at,
+        )
+
+    @staticmethod
+    def _sentiment_to_entity(model: SentimentModel) -> Sentiment:
+        return Sentiment(
+            id=SentimentId(model.id),
+            news_id=NewsId(model.news_id),
+            score=SentimentScore(model.score),
+            confidence=model.confidence,
+            keywords=model.keywords.split(",") if model.keywords else [],
+            reasoning=model.reasoning,
+            analyzed_at=model.analyzed_at,
+        )
+
+    @staticmethod
+    def _rollup_to_entity(row: SymbolSentimentDailyModel) -> SymbolDailySentiment:
+        return SymbolDailySentiment(
+            symbol=StockSymbol(row.symbol),
+            day=row.day,
+            news_count=row.news_count,
+            analyzed_count=row.analyzed_count,
+            sum_score=row.sum_score,
+            positive_count=row.positive_count,
+            negative_count=row.negative_count,
+            neutral_count=row.neutral_count,
+            keyword_counts=json.loads(row.keyword_counts or "{}"),
+        )
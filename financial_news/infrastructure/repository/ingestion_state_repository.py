@@ -0,0 +1,75 @@
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import select
+
+from config.database.async_session import AsyncSessionLocal
+from config.redis_config import get_redis
+from financial_news.application.port.output.ingestion_state_port import IngestionStatePort
+from financial_news.domain.value_objects.stock_symbol import StockSymbol
+from financial_news.infrastructure.orm.models import IngestionWatermarkModel, SubscriptionModel
+
+# 사용자가 조회한 심볼을 수집 대상으로 유지하는 기간
+REQUESTED_SYMBOL_TTL_HOURS = float(os.getenv("INGESTION_REQUESTED_SYMBOL_TTL_HOURS", "24"))
+REQUESTED_SYMBOLS_KEY = "ingestion:requested_symbols"
+
+
+def _valid_symbols(values) -> List[StockSymbol]:
+    symbols = []
+    for value in values:
+        try:
+            symbols.append(StockSymbol(value.strip().upper()))
+        except ValueError:
+            continue
+    return list(dict.fromkeys(symbols))
+
+
+class IngestionStateRepositoryImpl(IngestionStatePort):
+    """워터마크/구독 심볼은 DB(aiomysql), 조회 심볼/호출 예산은 Redis"""
+
+    def __init__(self):
+        self.redis = get_redis()
+
+    async def get_watermark(self, source_key: str) -> Optional[datetime]:
+        async with AsyncSessionLocal() as db:
+            orm = await db.get(IngestionWatermarkModel, source_key)
+        return orm.last_fetched_at if orm else None
+
+    async def set_watermark(self, source_key: str, fetched_at: datetime) -> None:
+        async with AsyncSessionLocal() as db:
+            async with db.begin():
+                await db.merge(IngestionWatermarkModel(source_key=source_key, last_fetched_at=fetched_at))
+
+    async def find_subscribed_symbols(self) -> List[StockSymbol]:
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(
+                select(SubscriptionModel.symbols).where(SubscriptionModel.is_active.is_(True))
+            )).scalars().all()
+        return _valid_symbols(s for symbols in rows for s in (symbols or "").split(",") if s.strip())
+
+    # redis 클라이언트가 동기식이라 이벤트 루프 밖에서 실행
+    async def request_symbols(self, symbols: List[StockSymbol]) -> None:
+        if symbols:
+            await asyncio.to_thread(self.redis.zadd, REQUESTED_SYMBOLS_KEY, {str(s): time.time() for s in symbols})
+
+    async def find_requested_symbols(self) -> List[StockSymbol]:
+        return _valid_symbols(await asyncio.to_thread(self._find_requested_symbols))
+
+    async def consume_budget(self, source: str, limit_per_hour: int) -> bool:
+        return await asyncio.to_thread(self._consume_budget, source, limit_per_hour)
+
+    def _find_requested_symbols(self) -> List[str]:
+        cutoff = time.time() - REQUESTED_SYMBOL_TTL_HOURS * 3600
+        self.redis.zremrangebyscore(REQUESTED_SYMBOLS_KEY, "-inf", cutoff)
+        return self.redis.zrange(REQUESTED_SYMBOLS_KEY, 0, -1)
+
+    def _consume_budget(self, source: str, limit_per_hour: int) -> bool:
+        # 워커가 여러 개여도 예산은 Redis 카운터 하나를 공유
+        key = f"ingestion:budget:{source}:{datetime.utcnow():%Y%m%d%H}"
+        used = self.redis.incr(key)
+        if used == 1:
+            self.redis.expire(key, 3600)
+        return used <= limit_per_hour
@@ -0,0 +1,84 @@
+import asyncio
+import os
+import random
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from config.redis_config import get_redis
+from financial_news.adapter.output.dedup.redis_duplicate_index_adapter import RedisDuplicateIndexAdapter
+from financial_news.adapter.output.google.news_api_adapter import NewsAPIAdapter
+from financial_news.adapter.output.google.rss_feed_adapter import RSSFeedAdapter
+from financial_news.adapter.output.trending.redis_trending_adapter import RedisTrendingAdapter
+from financial_news.application.usecase.ingest_news_usecase import IngestNewsUseCase
+from financial_news.infrastructure.api.rss_feed_client import RSSFeedClient
+from financial_news.infrastructure.repository.ingestion_state_repository import IngestionStateRepositoryImpl
+from financial_news.infrastructure.repository.async_news_repository import AsyncNewsRepositoryImpl
+
+# 소스별 수집 주기(초) / 주기 흔들기 비율 (워커들이 같은 시각에 몰리지 않게)
+SERPAPI_INTERVAL_SECONDS = float(os.getenv("INGESTION_SERPAPI_INTERVAL_SECONDS", "900"))
+RSS_INTERVAL_SECONDS = float(os.getenv("INGESTION_RSS_INTERVAL_SECONDS", "300"))
+INTERVAL_JITTER = float(os.getenv("INGESTION_INTERVAL_JITTER", "0.2"))
+
+LOCK_KEY_PREFIX = "ingestion:lock"
+
+
+def _build_usecase(source: str) -> IngestNewsUseCase:
+    # 소스에 필요한 어댑터만 생성 (SERP_API_KEY 가 없어도 RSS 수집은 동작)
+    return IngestNewsUseCase(
+        AsyncNewsRepositoryImpl.getInstance(),
+        IngestionStateRepositoryImpl(),
+        RedisTrendingAdapter(),
+        RedisDuplicateIndexAdapter(),
+        NewsAPIAdapter() if source == "serpapi" else None,
+        RSSFeedAdapter() if source == "rss" else None
+    )
+
+
+class IngestionScheduler:
+    """앱 프로세스 안에서 도는 주기적 뉴스 수집기 (소스마다 asyncio 태스크 하나)"""
+
+    def __init__(self):
+        self.jobs: List[Tuple[str, float, Callable[[IngestNewsUseCase], Awaitable[int]]]] = [
+            ("serpapi", SERPAPI_INTERVAL_SECONDS, lambda usecase: usecase.ingest_symbols()),
+            ("rss", RSS_INTERVAL_SECONDS, lambda usecase: usecase.ingest_rss()),
+        ]
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def start(self):
+        for source, interval, job in self.jobs:
+            if source not in self._tasks:
+                self._tasks[source] = asyncio.create_task(self._run(source, interval, job))
+        print(f"[ingestion] scheduler started: {', '.join(self._tasks)}")
+
+    async def stop(self):
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._tasks.clear()
+        await RSSFeedClient.close()
+        print("[ingestion] scheduler stopped")
+
+    async def _run(self, source: str, interval: float, job: Callable[[IngestNewsUseCase], Awaitable[int]]):
+        # 첫 실행도 흔들어서 재시작 직후 여러 워커가 동시에 호출하지 않게
+        await asyncio.sleep(random.uniform(0, interval * INTERVAL_JITTER))
+        while True:
+            await self._tick(source, interval, job)
+            await asyncio.sleep(interval * random.uniform(1 - INTERVAL_JITTER, 1 + INTERVAL_JITTER))
+
+    async def _tick(self, source: str, interval: float, job: Callable[[IngestNewsUseCase], Awaitable[int]]):
+        # 워커가 여러 개여도 한 주기에는 하나만 수집
+        lock_ttl = max(1, int(interval * (1 - INTERVAL_JITTER)))
+        try:
+            acquired = await asyncio.to_thread(
+                get_redis().set, f"{LOCK_KEY_PREFIX}:{source}", 1, nx=True, ex=lock_ttl
+            )
+            if not acquired:
+                return
+            saved = await job(_build_usecase(source))
+            print(f"[ingestion] {source}: {saved} new articles")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[ingestion] {source} failed: {e}")
+
+
+ingestion_scheduler = IngestionScheduler()
@@ -0,0 +1,65 @@
+"""
+news.url_hash 백필 재실행 테스트
+
+    python -m unittest financial_news.tests.test_backfill_url_hash
+
+SQLite 임시 파일 DB 에서 중복 URL 이 있는 뉴스로 백필을 두 번 실행
+(두 번째 실행에서 비워둔 중복 행을 다시 채우다 유니크 인덱스와 충돌하지 않는지 확인)
+"""
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+
+class BackfillUrlHashTest(unittest.TestCase):
+
+    def setUp(self):
+        from financial_news.infrastructure.migration import backfill_url_hash
+        from financial_news.infrastructure.orm.models import NewsModel
+
+        handle, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        self.engine = create_engine(f"sqlite:///{self.path}")
+        NewsModel.__table__.create(self.engine)
+
+        # 마이그레이션 전 상태: url_hash 가 비어 있고 인덱스도 없음
+        index = next(i for i in NewsModel.__table__.indexes if "url_hash" in i.columns)
+        now = datetime.utcnow()
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(f"DROP INDEX {index.name}")
+            for i in range(12):
+                conn.execute(NewsModel.__table__.insert().values(
+                    id=f"n{i:02d}", title="t", content="c", source="s", published_at=now,
+                    url=f"https://example.com/{i % 5}" if i < 10 else "",
+                    created_at=now - timedelta(seconds=i)
+                ))
+
+        # 백필이 테스트 DB 를 쓰도록 교체
+        self.module = backfill_url_hash
+        self._original = (backfill_url_hash.engine, backfill_url_hash.SessionLocal)
+        backfill_url_hash.engine = self.engine
+        backfill_url_hash.SessionLocal = sessionmaker(bind=self.engine)
+
+    def tearDown(self):
+        self.module.engine, self.module.SessionLocal = self._original
+        self.engine.dispose()
+        os.remove(self.path)
+
+    def test_backfill_twice(self):
+        self.module.backfill(batch_size=4)
+        self.module.backfill(batch_size=4)
+
+        with self.engine.connect() as conn:
+            owners = dict(conn.execute(text(
+                "SELECT url, id FROM news WHERE url_hash IS NOT NULL"
+            )).all())
+        # URL 마다 한 행만, 가장 먼저 저장된 행(created_at 이 더 이른 n05~n09)이 해시를 가짐
+        self.assertEqual(owners, {f"https://example.com/{i}": f"n{i + 5:02d}" for i in range(5)})
+
+
+if __name__ == "__main__":
+    unittest.main()